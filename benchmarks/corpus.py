@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""
+파서 픽스처 말뭉치 - tests/fixtures/pages/에 저장한 HTML/JSON 페이지와 파서별 기대 결과(manifest.json)
+
+사용법:
+    python benchmarks/corpus.py list
+    python benchmarks/corpus.py add data/kbo_official_20241015.html --parser KBOOfficialCrawler._parse_with_beautifulsoup --date 20241015
+    python benchmarks/corpus.py refresh       # 파서 동작을 의도적으로 바꾼 뒤 기대 결과 갱신
+"""
+import argparse
+import glob
+import gzip
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parser import GameParser
+from src.kbo_official_crawler import KBOOfficialCrawler
+from src.playwright_crawler import PlaywrightCrawler
+from src.simple_crawler import SimpleCrawler
+from src.team_registry import get_team_registry
+from src.logger import setup_logger
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures', 'pages')
+MANIFEST = os.path.join(CORPUS_DIR, 'manifest.json')
+
+def _game_parser():
+    parser = GameParser()
+    parser.parse_cache = None
+    parser.selector_stats = None
+    return parser
+
+def _kbo_official():
+    crawler = KBOOfficialCrawler()
+    crawler.parse_cache = None
+    return crawler
+
+def _playwright():
+    crawler = PlaywrightCrawler()
+    crawler.parse_cache = None
+    crawler.selector_stats = None
+    return crawler
+
+def _simple():
+    # Storage()가 data/를 만들지 않도록 파싱에 필요한 속성만 채움
+    crawler = SimpleCrawler.__new__(SimpleCrawler)
+    crawler.logger = setup_logger('SimpleCrawler')
+    crawler.teams = get_team_registry()
+    crawler.parse_cache = None
+    return crawler
+
+# 파서 이름 -> (인스턴스를 만들어 파싱 함수를 돌려주는 함수, 입력 형식)
+PARSERS = {
+    'GameParser.parse_naver_sports': (lambda: _game_parser().parse_naver_sports, 'html'),
+    'GameParser.parse_kbo_official': (lambda: _game_parser().parse_kbo_official, 'json'),
+    'PlaywrightCrawler._parse_naver_html': (lambda: _playwright()._parse_naver_html, 'html'),
+    'PlaywrightCrawler._parse_kbo_games': (lambda: _playwright()._parse_kbo_games, 'html'),
+    'KBOOfficialCrawler._parse_with_beautifulsoup': (lambda: _kbo_official()._parse_with_beautifulsoup, 'html'),
+    'SimpleCrawler.parse_kbo_html': (lambda: _simple().parse_kbo_html, 'html'),
+}
+
+def load_manifest():
+    try:
+        with open(MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def save_manifest(entries):
+    with open(MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+def read_page(entry):
+    """픽스처 내용 (.gz 지원, json 입력은 디코딩)"""
+    path = os.path.join(CORPUS_DIR, entry['file'])
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        content = f.read()
+    if PARSERS[entry['parser']][1] == 'json':
+        return json.loads(content)
+    return content
+
+def load_pages(paths=None):
+    """(이름, HTML) 목록 - paths가 없으면 말뭉치의 HTML 픽스처, 있으면 파일/디렉터리의 .html, .html.gz"""
+    if not paths:
+        return [(entry['file'], read_page(entry)) for entry in load_manifest()
+                if PARSERS[entry['parser']][1] == 'html']
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.html')) + glob.glob(os.path.join(path, '*.html.gz'))))
+        elif os.path.exists(path):
+            files.append(path)
+
+    pages = []
+    for path in files:
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8', errors='replace') as f:
+            pages.append((os.path.basename(path), f.read()))
+    return pages
+
+def entry_date(entry):
+    return datetime.strptime(entry['date'], '%Y%m%d')
+
+def summarize(games):
+    """기대 결과 비교용 요약 (날짜, 원정, 홈, 원정 점수, 홈 점수)"""
+    return [[g['date'], g['away_team'], g['home_team'], g['away_score'], g['home_score']] for g in games]
+
+def run_entry(entry, parse=None):
+    """픽스처 하나를 파싱한 경기 목록"""
+    parse = parse or PARSERS[entry['parser']][0]()
+    return parse(read_page(entry), entry_date(entry), **entry.get('kwargs', {}))
+
+def add(path, parser, date, note=''):
+    """페이지를 말뭉치에 복사하고 현재 파서 출력을 기대 결과로 기록"""
+    if parser not in PARSERS:
+        raise ValueError(f"알 수 없는 파서: {parser} (가능: {', '.join(PARSERS)})")
+    name = os.path.basename(path)
+    shutil.copyfile(path, os.path.join(CORPUS_DIR, name))
+    entry = {'file': name, 'parser': parser, 'date': date, 'kwargs': {}, 'note': note}
+    entry['games'] = summarize(run_entry(entry))
+
+    entries = [e for e in load_manifest() if (e['file'], e['parser']) != (name, parser)]
+    entries.append(entry)
+    save_manifest(entries)
+    return entry
+
+def refresh():
+    """모든 픽스처의 기대 결과를 현재 파서 출력으로 갱신"""
+    entries = load_manifest()
+    for entry in entries:
+        entry['games'] = summarize(run_entry(entry))
+    save_manifest(entries)
+    return entries
+
+def main():
+    parser = argparse.ArgumentParser(description='파서 픽스처 말뭉치 관리')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help='픽스처 목록')
+    add_parser = sub.add_parser('add', help='저장된 페이지를 픽스처로 추가')
+    add_parser.add_argument('path')
+    add_parser.add_argument('--parser', required=True, choices=sorted(PARSERS))
+    add_parser.add_argument('--date', required=True, help='YYYYMMDD')
+    add_parser.add_argument('--note', default='')
+    sub.add_parser('refresh', help='기대 결과를 현재 파서 출력으로 갱신')
+    args = parser.parse_args()
+
+    if args.command == 'add':
+        entry = add(args.path, args.parser, args.date, args.note)
+        print(f"추가: {entry['file']} ({entry['parser']}, {len(entry['games'])}경기)")
+    elif args.command == 'refresh':
+        for entry in refresh():
+            print(f"갱신: {entry['file']} ({entry['parser']}, {len(entry['games'])}경기)")
+    else:
+        for entry in load_manifest():
+            size = os.path.getsize(os.path.join(CORPUS_DIR, entry['file']))
+            print(f"{entry['file']:<40} {size / 1024:7.1f}KB  {entry['parser']:<46} {len(entry.get('games', []))}경기  {entry.get('note', '')}")
+
+if __name__ == '__main__':
+    main()
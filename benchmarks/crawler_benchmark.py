@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+크롤러 벤치마크 - 녹화한 HAR 세션으로 모든 Playwright 크롤러를 오프라인 실행하고 단계별 시간을 비교한다
+
+사용법:
+    python benchmarks/crawler_benchmark.py --record --date 20241015   # 실제 사이트에서 HAR 녹화
+    python benchmarks/crawler_benchmark.py --date 20241015 --repeat 3 # HAR 재생으로 측정
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.browser_pool import BrowserPool
+from src.config import HAR_DEFAULT_PATH
+from src.kbo_official_crawler import KBOOfficialCrawler
+from src.playwright_crawler import PlaywrightCrawler
+from src.stage_timer import StageTimer
+from src.unified_crawler import UnifiedCrawler
+
+# 벤치마크 대상: (이름, 풀을 받아 경기 목록을 돌려주는 코루틴 함수)
+CRAWLERS = [
+    ('unified', lambda pool, date: UnifiedCrawler(pool=pool).run(date)),
+    ('unified_intercept', lambda pool, date: UnifiedCrawler(pool=pool, intercept=True).run(date)),
+    ('kbo_official', lambda pool, date: KBOOfficialCrawler(pool=pool).run(date)),
+    ('playwright_naver', lambda pool, date: PlaywrightCrawler(pool=pool).crawl_naver_sports(date)),
+    ('playwright_kbo', lambda pool, date: PlaywrightCrawler(pool=pool).crawl_kbo_official(date)),
+]
+
+async def record(har_path, date):
+    """모든 크롤러를 한 세션으로 실행해 HAR 하나에 녹화"""
+    async with BrowserPool(record_har=har_path) as pool:
+        for name, run in CRAWLERS:
+            games = await run(pool, date)
+            print(f"[녹화] {name}: {len(games)}경기")
+    print(f"HAR 저장: {har_path}")
+
+async def measure(name, run, har_path, date):
+    """크롤러 한 번 실행 (브라우저 실행부터 저장까지)"""
+    timer = StageTimer()
+    with timer.activate():
+        start = time.perf_counter()
+        async with BrowserPool(size=1, replay_har=har_path) as pool:
+            games = await run(pool, date)
+        total = time.perf_counter() - start
+    return timer, total, len(games)
+
+async def replay(har_path, date, repeat, selected):
+    results = {}
+    for name, run in CRAWLERS:
+        if selected and name not in selected:
+            continue
+
+        merged = StageTimer()
+        totals = []
+        for _ in range(repeat):
+            timer, total, game_count = await measure(name, run, har_path, date)
+            for stage, values in timer.samples.items():
+                merged.samples.setdefault(stage, []).extend(values)
+            totals.append(total)
+
+        print(f"\n== {name} ({game_count}경기, 평균 {sum(totals) / len(totals) * 1000:.1f}ms) ==")
+        print(merged.report())
+        results[name] = {
+            'games': game_count,
+            'total_ms': [t * 1000 for t in totals],
+            'stages': merged.summary()
+        }
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Playwright 크롤러 HAR 벤치마크')
+    parser.add_argument('--har', type=str, default=HAR_DEFAULT_PATH, help='HAR 파일 경로')
+    parser.add_argument('--date', type=str, default='20241015', help='측정 날짜 (YYYYMMDD)')
+    parser.add_argument('--record', action='store_true', help='실제 사이트에서 HAR 녹화')
+    parser.add_argument('--repeat', type=int, default=3, help='크롤러별 반복 횟수')
+    parser.add_argument('--only', nargs='*', help='측정할 크롤러 이름')
+    parser.add_argument('--output', type=str, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    date = datetime.strptime(args.date, '%Y%m%d')
+
+    if args.record:
+        asyncio.run(record(args.har, date))
+        return
+
+    if not os.path.exists(args.har):
+        print(f"HAR 파일이 없습니다: {args.har} (--record로 먼저 녹화하세요)")
+        sys.exit(1)
+
+    results = asyncio.run(replay(args.har, date, args.repeat, args.only))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'date': args.date, 'har': args.har, 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+HTML 파서 벤치마크 - 저장된 페이지로 파서 백엔드(html.parser 전체 트리, lxml 전체 트리, lxml 부분 트리)의
+파싱 시간과 최대 메모리를 비교한다
+
+사용법:
+    python benchmarks/parser_benchmark.py                       # 픽스처 말뭉치(tests/fixtures/pages)의 HTML 사용
+    python benchmarks/parser_benchmark.py --pages data/debug page1.html --repeat 5
+    python benchmarks/parser_benchmark.py --synthetic 3         # 저장된 페이지가 없을 때 3MB 합성 페이지
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parser import (
+    make_soup, NAVER_SPORTS_STRAINER, NAVER_SCHEDULE_STRAINER, KBO_HTML_STRAINER, TABLE_STRAINER
+)
+from corpus import load_pages
+
+# (이름, 부분 트리 SoupStrainer, 파서가 찾는 요소 선택자)
+PARSERS = [
+    ('GameParser.parse_naver_sports', NAVER_SPORTS_STRAINER, 'div.sch_tb, div.game_schedule, table.schedule_table tr, div.game_result'),
+    ('PlaywrightCrawler._parse_naver_games', NAVER_SCHEDULE_STRAINER, 'table.tb_sc tr, div.game_box'),
+    ('KBOOfficialCrawler._parse_with_beautifulsoup', TABLE_STRAINER, 'table tr'),
+    ('SimpleCrawler.parse_kbo_html', KBO_HTML_STRAINER, 'div.game-cont, div.game_cont, table.tbl tbody tr, div.schedule_game'),
+]
+
+# (이름, 백엔드, 부분 트리 사용 여부)
+VARIANTS = [
+    ('html.parser', 'html.parser', False),
+    ('lxml', 'lxml', False),
+    ('lxml+strainer', 'lxml', True),
+]
+
+def synthetic_page(megabytes):
+    """일정 표 하나와 나머지 페이지 구성 요소로 채운 합성 페이지"""
+    games = ''.join(
+        f'<tr><td class="play"><span class="team_name">KIA</span><em class="score">{i % 10}</em>'
+        f'<em class="score">{(i + 3) % 10}</em><span class="team_name">LG</span><span class="state">종료</span></td></tr>'
+        for i in range(10)
+    )
+    table = f'<table class="tb_sc tbl"><tbody>{games}</tbody></table>'
+    filler_block = ('<div class="news_item"><a href="/news/1"><img src="a.jpg"><span class="title">기사 제목</span></a>'
+                    '<p class="desc">' + '본문 ' * 40 + '</p></div>')
+    # 표 앞뒤로 절반씩
+    filler = filler_block * max(1, int(megabytes * 1024 * 1024 / 2 / len(filler_block.encode('utf-8'))))
+    return f'<html><head><script>{"var x=1;" * 2000}</script></head><body><div id="wrap">{filler}{table}{filler}</div></body></html>'
+
+def measure(html, strainer, selector, backend, strained, repeat):
+    """(중앙값 ms, 최대 메모리 MB, 찾은 요소 수)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = make_soup(html, strainer if strained else None, backend=backend)
+        found = len(soup.select(selector))
+        times.append((time.perf_counter() - start) * 1000)
+        soup.decompose()
+
+    tracemalloc.start()
+    soup = make_soup(html, strainer if strained else None, backend=backend)
+    soup.select(selector)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    soup.decompose()
+
+    return statistics.median(times), peak / (1024 * 1024), found
+
+def run(pages, repeat):
+    results = []
+    for page_name, html in pages:
+        print(f"\n== {page_name} ({len(html.encode('utf-8')) / (1024 * 1024):.2f}MB) ==")
+        for parser_name, strainer, selector in PARSERS:
+            print(f"  {parser_name}")
+            for variant, backend, strained in VARIANTS:
+                median_ms, peak_mb, found = measure(html, strainer, selector, backend, strained, repeat)
+                print(f"    {variant:<14} {median_ms:8.1f}ms  최대 {peak_mb:7.1f}MB  요소 {found}개")
+                results.append({
+                    'page': page_name,
+                    'parser': parser_name,
+                    'variant': variant,
+                    'median_ms': round(median_ms, 2),
+                    'peak_mb': round(peak_mb, 2),
+                    'elements': found
+                })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--pages', nargs='*', help='말뭉치 대신 사용할 HTML 파일 또는 디렉터리 (.html, .html.gz)')
+    parser.add_argument('--synthetic', type=float, help='저장된 페이지 대신 지정한 크기(MB)의 합성 페이지 사용')
+    parser.add_argument('--repeat', type=int, default=5, help='측정 반복 횟수')
+    parser.add_argument('--output', type=str, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        pages = [(f'synthetic_{args.synthetic}MB', synthetic_page(args.synthetic))]
+    else:
+        pages = load_pages(args.pages)
+        if not pages:
+            print(f"페이지가 없습니다: {args.pages or '픽스처 말뭉치'} (benchmarks/corpus.py add로 추가하거나 --synthetic 사용)")
+            sys.exit(1)
+
+    results = run(pages, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+파서 처리량 벤치마크 - 픽스처 말뭉치(tests/fixtures/pages)를 파서별로 반복 파싱해
+초당 페이지 수, 초당 경기 수, 최대 메모리(RSS)를 측정하고 저장한 기준값과 비교한다.
+최대 RSS가 다른 파서의 영향을 받지 않도록 파서마다 별도 프로세스에서 실행한다
+
+사용법:
+    python benchmarks/parser_throughput.py --repeat 50
+    python benchmarks/parser_throughput.py --save-baseline               # data/benchmarks/parser_baseline.json
+    python benchmarks/parser_throughput.py --baseline --tolerance 0.2    # 기준값보다 20% 이상 느리면 종료 코드 1
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import DATA_DIR
+from corpus import PARSERS, load_manifest, read_page, entry_date
+
+BASELINE_PATH = os.path.join(DATA_DIR, 'benchmarks', 'parser_baseline.json')
+
+def _rss_mb():
+    # 리눅스는 KB, macOS는 바이트 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def worker(name, repeat):
+    """한 파서로 해당 픽스처를 repeat번 파싱 (하위 프로세스에서 실행)"""
+    # 경기마다 남기는 INFO 로그가 측정을 좌우하지 않도록
+    logging.disable(logging.INFO)
+
+    entries = [entry for entry in load_manifest() if entry['parser'] == name]
+    parse = PARSERS[name][0]()
+    inputs = [(read_page(entry), entry_date(entry), entry.get('kwargs', {})) for entry in entries]
+    rss_before = _rss_mb()
+
+    games = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page, date, kwargs in inputs:
+            games += len(parse(page, date, **kwargs))
+    seconds = time.perf_counter() - start
+
+    return {
+        'parser': name,
+        'pages': len(inputs) * repeat,
+        'games': games,
+        'seconds': seconds,
+        'peak_rss_mb': _rss_mb(),
+        'parse_rss_mb': _rss_mb() - rss_before
+    }
+
+def measure(name, repeat):
+    """파서 하나를 새 프로세스에서 측정"""
+    command = [sys.executable, os.path.abspath(__file__), '--worker', name, '--repeat', str(repeat)]
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result['pages_per_sec'] = result['pages'] / result['seconds'] if result['seconds'] else 0
+    result['games_per_sec'] = result['games'] / result['seconds'] if result['seconds'] else 0
+    return result
+
+def compare(results, baseline, tolerance):
+    """기준값 대비 처리량이 tolerance 이상 떨어지거나 메모리가 그만큼 늘어난 항목"""
+    regressions = []
+    for result in results:
+        base = baseline.get(result['parser'])
+        if not base:
+            continue
+        if result['pages_per_sec'] < base['pages_per_sec'] * (1 - tolerance):
+            regressions.append(f"{result['parser']}: 처리량 {base['pages_per_sec']:.1f} -> {result['pages_per_sec']:.1f} 페이지/초")
+        if result['peak_rss_mb'] > base['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(f"{result['parser']}: 최대 RSS {base['peak_rss_mb']:.1f} -> {result['peak_rss_mb']:.1f}MB")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='파서 처리량 벤치마크')
+    parser.add_argument('--repeat', type=int, default=20, help='픽스처 반복 파싱 횟수')
+    parser.add_argument('--only', nargs='*', help='측정할 파서 이름')
+    parser.add_argument('--save-baseline', nargs='?', const=BASELINE_PATH, help='결과를 기준값으로 저장')
+    parser.add_argument('--baseline', nargs='?', const=BASELINE_PATH, help='저장한 기준값과 비교')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='회귀로 볼 변화 비율')
+    parser.add_argument('--worker', type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.repeat)))
+        return
+
+    names = sorted({entry['parser'] for entry in load_manifest()})
+    if args.only:
+        names = [name for name in names if name in args.only]
+    if not names:
+        print("측정할 픽스처가 없습니다 (benchmarks/corpus.py add로 추가)")
+        sys.exit(1)
+
+    results = []
+    print(f"{'파서':<46} {'페이지/초':>10} {'경기/초':>10} {'최대 RSS':>10} {'파싱 중 증가':>10}")
+    for name in names:
+        result = measure(name, args.repeat)
+        results.append(result)
+        print(f"{name:<46} {result['pages_per_sec']:10.1f} {result['games_per_sec']:10.1f} "
+              f"{result['peak_rss_mb']:8.1f}MB {result['parse_rss_mb']:8.1f}MB")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({result['parser']: result for result in results}, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.save_baseline}")
+
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"\n기준값을 읽을 수 없습니다: {e}")
+            sys.exit(1)
+
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n기준값 대비 회귀 없음 (허용 {args.tolerance:.0%})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+점수 패턴 마이크로벤치마크 - 셀마다 컴파일하지 않은 정규식 세 개를 차례로 검색하던 방식과
+미리 컴파일한 결합 패턴(score_patterns)을 큰 셀 말뭉치에서 비교한다
+
+사용법:
+    python benchmarks/score_pattern_benchmark.py                      # 합성 셀 20만 개
+    python benchmarks/score_pattern_benchmark.py --cells 1000000 --repeat 5
+    python benchmarks/score_pattern_benchmark.py --pages data/debug   # 저장된 페이지의 td/th 텍스트
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parser import make_soup, TABLE_STRAINER
+from src.score_patterns import parse_score
+from corpus import load_pages
+
+# 이전 KBOOfficialCrawler._parse_with_beautifulsoup의 패턴
+LEGACY_PATTERNS = [
+    r'(\w+)\s+(\d+)\s*:\s*(\d+)\s+(\w+)',
+    r'(\w+)\s+(\d+)\s*-\s*(\d+)\s+(\w+)',
+    r'(\w+)\s+(\d+)\s+vs\s+(\d+)\s+(\w+)',
+]
+
+TEAMS = ['KIA', 'LG', 'NC', 'KT', 'SSG', '한화', '롯데', '삼성', '두산', '키움']
+
+def legacy_parse(text):
+    for pattern in LEGACY_PATTERNS:
+        match = re.search(pattern, text)
+        if match:
+            return match.group(1), int(match.group(2)), int(match.group(3)), match.group(4)
+    return None
+
+def synthetic_cells(count, seed=0):
+    """일정 표 셀 분포를 흉내 낸 말뭉치 (점수 셀은 약 1/5)"""
+    rng = random.Random(seed)
+    cells = []
+    for _ in range(count):
+        away, home = rng.sample(TEAMS, 2)
+        kind = rng.random()
+        if kind < 0.2:
+            separator = rng.choice([' : ', ':', ' - ', ' vs '])
+            cells.append(f"{away} {rng.randint(0, 15)}{separator}{rng.randint(0, 15)} {home}")
+        elif kind < 0.4:
+            cells.append(f"{rng.randint(13, 18)}:30")
+        elif kind < 0.6:
+            cells.append(f"{away} vs {home}")
+        elif kind < 0.8:
+            cells.append(rng.choice(['잠실', '문학', '사직', '대구', '고척', '창원', '광주', '수원', '대전']))
+        else:
+            cells.append(f"10.{rng.randint(1, 31):02d}({rng.choice('월화수목금토일')}) 하이라이트 리뷰")
+    return cells
+
+def page_cells(pages):
+    """저장된 페이지의 모든 td/th 텍스트"""
+    cells = []
+    for _, html in pages:
+        soup = make_soup(html, TABLE_STRAINER)
+        cells.extend(cell.get_text(strip=True) for cell in soup.find_all(['td', 'th']))
+    return cells
+
+def measure(parse, cells, repeat):
+    """(중앙값 초, 찾은 점수 수)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = sum(1 for cell in cells if parse(cell))
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), found
+
+def main():
+    parser = argparse.ArgumentParser(description='점수 패턴 마이크로벤치마크')
+    parser.add_argument('--cells', type=int, default=200000, help='합성 셀 수')
+    parser.add_argument('--pages', nargs='*', help='합성 셀 대신 사용할 HTML 파일 또는 디렉터리 (.html, .html.gz)')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수')
+    args = parser.parse_args()
+
+    if args.pages:
+        cells = page_cells(load_pages(args.pages))
+        if not cells:
+            print(f"셀이 없습니다: {args.pages}")
+            sys.exit(1)
+    else:
+        cells = synthetic_cells(args.cells)
+
+    mismatches = sum(1 for cell in cells if legacy_parse(cell) != parse_score(cell))
+    print(f"셀 {len(cells)}개, 결과가 다른 셀 {mismatches}개")
+
+    results = {}
+    for name, parse in [('legacy (re.search x3)', legacy_parse), ('score_patterns', parse_score)]:
+        seconds, found = measure(parse, cells, args.repeat)
+        results[name] = seconds
+        print(f"  {name:<22} {seconds * 1000:8.1f}ms  {len(cells) / seconds:12,.0f}셀/초  점수 {found}개")
+
+    print(f"  속도 향상: {results['legacy (re.search x3)'] / results['score_patterns']:.2f}배")
+
+if __name__ == '__main__':
+    main()
@@ -10,8 +10,11 @@ import os
 # 프로젝트 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.unified_crawler import run_unified_crawler
+from src.unified_crawler import run_unified_crawler, run_unified_crawler_range
+from src.kbo_api_crawler import run_async_backfill
 from src.storage import Storage
+from src.source_health import get_source_health
+from src.parse_cache import ParseCache
 from src.scheduler import CrawlerScheduler as Scheduler
 from src.logger import setup_logger
 
@@ -24,6 +27,16 @@ def main():
     parser.add_argument('--winners', action='store_true', help='어제 승리팀 조회')
     parser.add_argument('--team', type=str, help='특정 팀 통계 조회')
     parser.add_argument('--test', action='store_true', help='테스트 실행 (더미 데이터)')
+    parser.add_argument('--harvest', action='store_true', help='월 일정 페이지를 한 번에 수확해 날짜별로 저장')
+    parser.add_argument('--intercept', action='store_true', help='일정 데이터 응답(JSON)을 가로채 DOM 추출 생략')
+    parser.add_argument('--end', type=str, help='범위 크롤링 종료 날짜 (YYYYMMDD, --date부터)')
+    parser.add_argument('--concurrency', type=int, help='범위 크롤링 동시 실행 수 (기본: 설정의 RANGE_CONCURRENCY, --api는 API_FETCH_CONCURRENCY)')
+    parser.add_argument('--api', action='store_true', help='범위 크롤링을 브라우저 없이 KBO API 동시 조회로 실행')
+    parser.add_argument('--record-har', type=str, help='브라우저 세션을 HAR 파일로 녹화')
+    parser.add_argument('--replay-har', type=str, help='녹화한 HAR 파일로 네트워크 없이 재생')
+    parser.add_argument('--health', action='store_true', help='데이터 소스 상태(서킷 브레이커) 조회')
+    parser.add_argument('--reset-health', nargs='?', const='', metavar='SOURCE', help='소스 차단 상태 초기화 (생략하면 전체)')
+    parser.add_argument('--clear-parse-cache', action='store_true', help='파싱 결과 캐시 삭제 (다음 실행에서 모든 페이지를 다시 파싱)')
     
     args = parser.parse_args()
     
@@ -41,6 +54,27 @@ def main():
             print("어제 경기 결과가 없습니다.")
         return
     
+    # 소스 상태 조회/초기화
+    if args.reset_health is not None:
+        get_source_health().reset(args.reset_health or None)
+        print(f"소스 상태 초기화: {args.reset_health or '전체'}")
+        return
+    
+    if args.clear_parse_cache:
+        removed = ParseCache().clear()
+        print(f"파싱 캐시 삭제: {removed}개")
+        return
+    
+    if args.health:
+        lines = get_source_health().report()
+        if lines:
+            print("\n데이터 소스 상태:")
+            for line in lines:
+                print(f"  - {line}")
+        else:
+            print("기록된 소스 상태가 없습니다.")
+        return
+    
     # 팀 통계 조회
     if args.team:
         stats = storage.get_team_stats(args.team)
@@ -55,12 +89,31 @@ def main():
         return
     
     # 크롤링 실행
-    if args.date:
+    if args.date and args.end:
+        # 날짜 범위 크롤링 (완료되는 순서대로 출력)
+        start = datetime.strptime(args.date, '%Y%m%d')
+        end = datetime.strptime(args.end, '%Y%m%d')
+        logger.info(f"범위 크롤링 시작: {start.strftime('%Y-%m-%d')} ~ {end.strftime('%Y-%m-%d')}")
+        
+        def print_result(date, games):
+            print(f"\n{date.strftime('%Y-%m-%d')} 경기 결과: {len(games)}경기")
+            for game in games:
+                print(f"  {game['away_team']} {game['away_score']} - {game['home_score']} {game['home_team']} (승: {game['winner']})")
+        
+        if args.api:
+            results = run_async_backfill(start, end, args.concurrency, on_result=print_result)
+        else:
+            results = run_unified_crawler_range(start, end, args.concurrency, harvest=args.harvest, intercept=args.intercept,
+                                                on_result=print_result, record_har=args.record_har, replay_har=args.replay_har)
+        print(f"\n총 {len(results)}일, {sum(len(g) for g in results.values())}경기")
+        
+    elif args.date:
         # 특정 날짜 크롤링
         date = datetime.strptime(args.date, '%Y%m%d')
         logger.info(f"크롤링 시작: {date.strftime('%Y-%m-%d')}")
         
-        games = run_unified_crawler(date)
+        games = run_unified_crawler(date, harvest=args.harvest, intercept=args.intercept,
+                                    record_har=args.record_har, replay_har=args.replay_har)
         
         if games:
             print(f"\n{date.strftime('%Y-%m-%d')} 경기 결과:")
@@ -74,7 +127,7 @@ def main():
         date = datetime.now() - timedelta(days=1)
         logger.info(f"크롤링 시작: {date.strftime('%Y-%m-%d')}")
         
-        games = run_unified_crawler(date)
+        games = run_unified_crawler(date, record_har=args.record_har, replay_har=args.replay_har)
         
         if games:
             print(f"\n{date.strftime('%Y-%m-%d')} 경기 결과:")
@@ -1,70 +1,32 @@
-import requests
-import json
 from datetime import datetime, timedelta
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.config import HEADERS
+from src.http_client import get_http_client
+from src.endpoint_discovery import EndpointDiscovery, SCHEDULE_CANDIDATES
 
 def test_api():
-    """네이버 스포츠 API 엔드포인트 테스트"""
-    
-    # 가능한 API 엔드포인트들
-    api_endpoints = [
-        # 일정/결과 API
-        "https://api.sports.naver.com/v1/schedule/kbaseball",
-        "https://sports.news.naver.com/kbaseball/api/schedule/result",
-        "https://api-gw.sports.naver.com/gateway/schedule/games/list",
-        
-        # 모바일 API
-        "https://m.sports.naver.com/api/kbaseball/schedule",
-        
-        # 날짜별 경기 결과
-        "https://sports.news.naver.com/ajax/schedule/games/list.nhn"
-    ]
+    """네이버 스포츠 API 엔드포인트 x 파라미터 조합을 동시에 탐색"""
     
     # 테스트할 날짜 (어제)
     yesterday = datetime.now() - timedelta(days=1)
-    date_str = yesterday.strftime("%Y%m%d")
     
-    for endpoint in api_endpoints:
-        print(f"\n테스트 엔드포인트: {endpoint}")
-        
-        # 다양한 파라미터 조합 테스트
-        params_list = [
-            {"date": date_str, "sport": "kbaseball"},
-            {"date": date_str, "leagueCode": "KBO"},
-            {"gameDate": date_str, "sport": "KBASEBALL"},
-            {"date": date_str}
-        ]
-        
-        for params in params_list:
-            try:
-                response = requests.get(endpoint, headers=HEADERS, params=params)
-                print(f"  파라미터: {params}")
-                print(f"  상태 코드: {response.status_code}")
-                
-                if response.status_code == 200:
-                    print("  ✓ 성공!")
-                    # JSON 응답인지 확인
-                    try:
-                        data = response.json()
-                        print(f"  응답 타입: JSON")
-                        print(f"  응답 키: {list(data.keys())[:5]}")
-                        
-                        # 응답 저장
-                        with open(f"data/api_response_{endpoint.split('/')[-1]}.json", "w", encoding="utf-8") as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
-                        
-                        return endpoint, params
-                    except:
-                        print(f"  응답 타입: HTML/기타")
-                        
-            except Exception as e:
-                print(f"  에러: {e}")
+    discovery = EndpointDiscovery(SCHEDULE_CANDIDATES)
+    endpoint = discovery.discover(yesterday)
+    
+    for candidate, result in sorted(discovery.last_report, key=lambda pair: pair[1]['latency_ms']):
+        print(f"\n테스트 엔드포인트: {candidate['url']}")
+        print(f"  파라미터: {result['params']}")
+        print(f"  상태 코드: {result.get('status')} ({result['latency_ms']}ms)")
+        if result['ok']:
+            print(f"  ✓ 성공! 경기 목록 경로: {'/'.join(result['path']) or '-'}, 매핑: {result['mapping']}")
+        else:
+            print(f"  에러: {result.get('error')}")
     
-    return None, None
+    if endpoint is None:
+        return None, None
+    return endpoint['url'], endpoint['params']
 
 def test_specific_api():
     """특정 API 상세 테스트"""
@@ -95,7 +57,7 @@ def test_specific_api():
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client().get(url, headers=headers, params=params)
         print(f"상태 코드: {response.status_code}")
         print(f"응답 크기: {len(response.text)} bytes")
         
@@ -0,0 +1,125 @@
+"""
+정적 리소스 디스크 캐시 - 스크립트/스타일 등을 DATA_DIR에 저장해 다음 실행에서 네트워크 없이 응답한다
+"""
+import hashlib
+import json
+import os
+import time
+from .logger import setup_logger
+from .config import BROWSER_CACHE_DIR, BROWSER_CACHE_TYPES, BROWSER_CACHE_MAX_AGE
+
+# 본문을 디코딩해서 저장하므로 원래 인코딩/길이 헤더는 버린다
+DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'set-cookie'}
+
+def _clean_headers(headers):
+    return {k: v for k, v in headers.items() if k.lower() not in DROP_HEADERS}
+
+class AssetCache:
+    """URL 단위 정적 리소스 캐시"""
+
+    def __init__(self, cache_dir=BROWSER_CACHE_DIR, resource_types=BROWSER_CACHE_TYPES,
+                 max_age=BROWSER_CACHE_MAX_AGE, logger=None):
+        self.logger = logger or setup_logger('AssetCache')
+        self.cache_dir = cache_dir
+        self.resource_types = set(resource_types)
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.bytes_served = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, url):
+        """캐시된 (status, headers, body) 반환 (없거나 만료되면 None)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if time.time() - meta['stored_at'] > self.max_age:
+                return None
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return meta['status'], meta['headers'], body
+
+    def store(self, url, status, headers, body):
+        """응답 저장 (200 응답이고 no-store가 아닐 때만)"""
+        cache_control = (headers.get('cache-control') or '').lower()
+        if status != 200 or 'no-store' in cache_control:
+            return False
+
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'status': status,
+            'headers': _clean_headers(headers),
+            'stored_at': time.time()
+        }
+        try:
+            # 본문을 먼저 쓰고 메타를 나중에 교체해 반쯤 쓰인 항목을 읽지 않도록 함
+            with open(body_path + '.tmp', 'wb') as f:
+                f.write(body)
+            os.replace(body_path + '.tmp', body_path)
+            with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_path + '.tmp', meta_path)
+        except OSError as e:
+            self.logger.warning(f"캐시 저장 실패: {url} ({e})")
+            return False
+        return True
+
+    def prune(self):
+        """만료된 항목 삭제"""
+        removed = 0
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if now - os.path.getmtime(path) > self.max_age:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            self.logger.info(f"만료된 캐시 파일 {removed}개 삭제")
+        return removed
+
+    def summary(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0
+        return f"적중 {self.hits}건 / 미스 {self.misses}건 ({hit_rate:.0f}%), 캐시 응답 {self.bytes_served / 1024:.0f}KB"
+
+    async def attach(self, page):
+        """페이지에 캐시 라우팅 등록 (차단 라우팅보다 먼저 등록해야 차단 후 폴백으로 실행됨)"""
+        async def handle(route):
+            request = route.request
+            if request.method != 'GET' or request.resource_type not in self.resource_types:
+                await route.fallback()
+                return
+
+            cached = self.lookup(request.url)
+            if cached:
+                status, headers, body = cached
+                self.hits += 1
+                self.bytes_served += len(body)
+                await route.fulfill(status=status, headers=headers, body=body)
+                return
+
+            self.misses += 1
+            try:
+                response = await route.fetch()
+                body = await response.body()
+            except Exception:
+                # 가져오기 실패 시 브라우저가 직접 요청하도록 넘김
+                await route.fallback()
+                return
+
+            self.store(request.url, response.status, response.headers, body)
+            await route.fulfill(status=response.status, headers=_clean_headers(response.headers), body=body)
+
+        await page.route('**/*', handle)
@@ -0,0 +1,235 @@
+"""
+공유 브라우저 풀 - Chromium을 한 번만 띄우고 크롤러들이 컨텍스트를 빌려 쓴다
+"""
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+from .logger import setup_logger
+from .request_blocking import RequestBlocker
+from .asset_cache import AssetCache
+from .http_cache import HttpCache
+from .rate_limiter import get_rate_limiter
+from .stage_timer import timed
+from .config import (
+    BROWSER_POOL_SIZE, BROWSER_CONTEXT_MAX_PAGES,
+    BROWSER_LAUNCH_ARGS, BROWSER_CONTEXT_OPTIONS, REQUEST_BLOCK_PROFILE,
+    BROWSER_PERSIST_STATE, BROWSER_STORAGE_STATE, HAR_NOT_FOUND, HTTP_CACHE_ENABLED
+)
+
+class BrowserPool:
+    """장수명 Chromium 인스턴스와 재사용 가능한 컨텍스트 풀"""
+
+    def __init__(self, size=BROWSER_POOL_SIZE, max_pages_per_context=BROWSER_CONTEXT_MAX_PAGES,
+                 headless=True, context_options=None, block_profile=REQUEST_BLOCK_PROFILE,
+                 persist=BROWSER_PERSIST_STATE, record_har=None, replay_har=None):
+        self.logger = setup_logger('BrowserPool')
+        self.size = size
+        self.max_pages_per_context = max_pages_per_context
+        self.headless = headless
+        self.blocker = RequestBlocker(block_profile)
+        self.context_options = dict(BROWSER_CONTEXT_OPTIONS)
+        if self.blocker.viewport:
+            self.context_options['viewport'] = self.blocker.viewport
+        if context_options:
+            self.context_options.update(context_options)
+
+        # HAR 녹화: 한 컨텍스트가 세션 전체를 기록하도록 크기 1, 재생성 없음
+        self.record_har = record_har
+        self.replay_har = replay_har
+        if record_har:
+            os.makedirs(os.path.dirname(os.path.abspath(record_har)), exist_ok=True)
+            self.size = 1
+            self.max_pages_per_context = float('inf')
+            self.context_options['record_har_path'] = record_har
+            self.context_options['record_har_mode'] = 'minimal'
+
+        # 실행 간 상태 유지: 쿠키/로컬 스토리지 파일과 정적 리소스 디스크 캐시
+        # (HAR 모드에서는 녹화/재생 결과가 저장된 상태에 흔들리지 않도록 끔)
+        if record_har or replay_har:
+            persist = False
+        self.persist = persist
+        self.storage_state_path = BROWSER_STORAGE_STATE
+        self.asset_cache = AssetCache(logger=self.logger) if persist else None
+        self.http_cache = HttpCache(logger=self.logger) if persist and HTTP_CACHE_ENABLED else None
+        # 재생 모드는 네트워크를 쓰지 않으므로 속도 제한 없음
+        self.rate_limiter = None if replay_har else get_rate_limiter()
+        self._storage_state = None
+
+        self._playwright = None
+        self._browser = None
+        self._slots = None
+        self._page_counts = {}
+        self._start_lock = asyncio.Lock()
+
+    async def start(self):
+        """브라우저 실행 (이미 실행 중이면 그대로 사용)"""
+        async with self._start_lock:
+            if self._browser is not None:
+                return self
+
+            if self.persist:
+                self._storage_state = self._load_storage_state()
+                self.asset_cache.prune()
+
+            with timed('launch'):
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless,
+                    args=BROWSER_LAUNCH_ARGS
+                )
+
+            # 슬롯마다 컨텍스트는 처음 빌릴 때 생성
+            self._slots = asyncio.Queue()
+            for _ in range(self.size):
+                self._slots.put_nowait(None)
+
+            self.logger.info(f"브라우저 풀 시작: 크기 {self.size}, 컨텍스트당 최대 {self.max_pages_per_context}페이지")
+            if self.record_har:
+                self.logger.info(f"HAR 녹화: {self.record_har}")
+            if self.replay_har:
+                self.logger.info(f"HAR 재생: {self.replay_har}")
+
+        return self
+
+    def _load_storage_state(self):
+        """저장된 쿠키/로컬 스토리지 불러오기"""
+        if not os.path.exists(self.storage_state_path):
+            return None
+
+        try:
+            with open(self.storage_state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.logger.info(f"브라우저 상태 로드: 쿠키 {len(state.get('cookies', []))}개")
+            return state
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"브라우저 상태 로드 실패: {e}")
+            return None
+
+    async def _save_storage_state(self, context):
+        """컨텍스트의 쿠키/로컬 스토리지 저장"""
+        try:
+            state = await context.storage_state()
+            os.makedirs(os.path.dirname(self.storage_state_path), exist_ok=True)
+            tmp_path = self.storage_state_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.storage_state_path)
+            # 이후 생성되는 컨텍스트도 최신 상태로 시작
+            self._storage_state = state
+        except Exception as e:
+            self.logger.warning(f"브라우저 상태 저장 실패: {e}")
+
+    async def _new_context(self):
+        """새 브라우저 컨텍스트 생성"""
+        options = dict(self.context_options)
+        if self._storage_state:
+            options['storage_state'] = self._storage_state
+        context = await self._browser.new_context(**options)
+        if self.replay_har:
+            # 녹화에 없는 요청은 네트워크로 나가지 않고 중단
+            await context.route_from_har(self.replay_har, not_found=HAR_NOT_FOUND)
+        self._page_counts[context] = 0
+        return context
+
+    async def _retire_context(self, context):
+        """사용 한도에 도달한 컨텍스트 정리"""
+        self._page_counts.pop(context, None)
+        if self.persist:
+            await self._save_storage_state(context)
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.warning(f"컨텍스트 종료 에러: {e}")
+
+    @asynccontextmanager
+    async def context(self):
+        """풀에서 컨텍스트를 빌린다"""
+        await self.start()
+
+        context = await self._slots.get()
+        try:
+            if context is None:
+                context = await self._new_context()
+            yield context
+        finally:
+            # 페이지를 많이 연 컨텍스트는 폐기하고 다음 대여 때 새로 생성
+            if context is not None and self._page_counts.get(context, 0) >= self.max_pages_per_context:
+                self.logger.info(f"컨텍스트 재생성: {self._page_counts[context]}페이지 사용")
+                await self._retire_context(context)
+                context = None
+            self._slots.put_nowait(context)
+
+    @asynccontextmanager
+    async def page(self, freeze=False):
+        """풀에서 컨텍스트를 빌려 새 페이지를 연다 (freeze면 확정된 날짜/월을 가리키는 문서/XHR 응답은 캐시로만 응답)"""
+        async with self.context() as context:
+            page = await context.new_page()
+            self._page_counts[context] = self._page_counts.get(context, 0) + 1
+            # 나중에 등록한 라우팅이 먼저 실행됨: 차단 -> HTTP 캐시 -> 속도 제한 -> 리소스 캐시
+            # (캐시 적중은 대기 없이 응답하고, 미스/재검증은 캐시가 직접 가져오기 전에 속도 제한을 거침)
+            if self.asset_cache:
+                await self.asset_cache.attach(page)
+            if self.rate_limiter:
+                await self.rate_limiter.attach(page)
+            if self.http_cache:
+                await self.http_cache.attach(page, freeze=freeze, limiter=self.rate_limiter)
+            stats = await self.blocker.attach(page)
+            try:
+                yield page
+            finally:
+                self.logger.info(f"요청 통계 ({self.blocker.profile_name}) {page.url}: {stats.summary()}")
+                try:
+                    await page.close()
+                except Exception as e:
+                    self.logger.warning(f"페이지 종료 에러: {e}")
+
+    async def close(self):
+        """모든 컨텍스트와 브라우저 종료"""
+        async with self._start_lock:
+            if self._browser is None:
+                return
+
+            while not self._slots.empty():
+                context = self._slots.get_nowait()
+                if context is not None:
+                    await self._retire_context(context)
+
+            if self.asset_cache:
+                self.logger.info(f"리소스 캐시: {self.asset_cache.summary()}")
+            if self.http_cache:
+                self.logger.info(f"HTTP 캐시: {self.http_cache.summary()}")
+
+            try:
+                await self._browser.close()
+            finally:
+                await self._playwright.stop()
+                self._browser = None
+                self._playwright = None
+                self._slots = None
+                self._page_counts.clear()
+
+            self.logger.info("브라우저 풀 종료")
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+def is_replay(pool):
+    """HAR 재생 풀인지 (네트워크에 나가지 않는 실행)"""
+    return pool is not None and bool(pool.replay_har)
+
+@asynccontextmanager
+async def borrow_page(pool=None, freeze=False):
+    """공유 풀에서 페이지를 빌린다 - 풀이 없으면 일회용 풀 사용"""
+    if pool is not None:
+        async with pool.page(freeze=freeze) as page:
+            yield page
+        return
+
+    async with BrowserPool(size=1) as temp_pool:
+        async with temp_pool.page(freeze=freeze) as page:
+            yield page
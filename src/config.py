@@ -8,6 +8,10 @@ LOG_DIR = os.path.join(BASE_DIR, 'logs')
 KBO_SCHEDULE_URL = "https://sports.news.naver.com/kbaseball/schedule/index"
 KBO_RESULT_URL = "https://sports.news.naver.com/kbaseball/schedule/result"
 
+# KBO 일정 페이지가 표를 채울 때 호출하는 데이터 XHR
+KBO_SCHEDULE_XHR = '/ws/Schedule.asmx/GetScheduleList'
+RESPONSE_CAPTURE_TIMEOUT = 10000
+
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
 HEADERS = {
@@ -18,20 +22,166 @@ HEADERS = {
     'Connection': 'keep-alive',
 }
 
-TEAM_NAMES = {
-    'KIA': 'KIA',
-    'LG': 'LG',
-    'NC': 'NC',
-    'KT': 'KT',
-    'SSG': 'SSG',
-    '한화': '한화',
-    '롯데': '롯데',
-    '삼성': '삼성',
-    '두산': '두산',
-    '키움': '키움'
+# HTTP 클라이언트 설정 (호스트별 연결 풀 재사용)
+HTTP_TIMEOUT = (3.05, 15)  # (연결, 읽기) 초
+HTTP_POOL_MAXSIZE = 10
+HTTP_RETRIES = 3
+HTTP_RETRY_STATUS = [429, 500, 502, 503, 504]
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 10
+HTTP_LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# HTTP 응답 캐시 (ETag/Last-Modified 조건부 요청, 확정된 과거 날짜는 네트워크 생략)
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, 'http_cache')
+HTTP_CACHE_FREEZE_DAYS = 2  # 경기일로부터 이 일수가 지나면 결과 확정으로 간주
+HTTP_CACHE_BROWSER_TYPES = ['document', 'xhr', 'fetch']
+
+# 비동기 API 백필 설정 (동시 요청 수, 월 단위 조회 여부 - 한 번의 요청으로 한 달치)
+API_FETCH_CONCURRENCY = 8
+API_MONTH_BATCH = True
+
+# 호스트별 요청 속도 제한 (토큰 버킷, 여러 프로세스가 SQLite 파일로 공유)
+# 도메인: (초당 요청 수, 버스트) - 하위 도메인 포함
+RATE_LIMIT_ENABLED = True
+RATE_LIMIT_DB = os.path.join(DATA_DIR, 'rate_limit.sqlite3')
+RATE_LIMITS = {
+    'koreabaseball.com': (5, 10),
+    'naver.com': (5, 10),
+    'google.com': (0.5, 2),
+    'statiz.co.kr': (2, 4),
 }
+RATE_LIMIT_DEFAULT = (10, 20)
+RATE_LIMIT_BROWSER_TYPES = ['document', 'xhr', 'fetch']
 
 SCHEDULE_TIME = "10:00"
 
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-LOG_FILE = os.path.join(LOG_DIR, f'crawler_{datetime.now().strftime("%Y%m%d")}.log')
\ No newline at end of file
+LOG_FILE = os.path.join(LOG_DIR, f'crawler_{datetime.now().strftime("%Y%m%d")}.log')
+
+# 브라우저 풀 설정
+BROWSER_POOL_SIZE = 2
+BROWSER_CONTEXT_MAX_PAGES = 20
+
+# 날짜 범위 크롤링 설정
+RANGE_CONCURRENCY = 3
+RANGE_DATE_TIMEOUT = 120
+
+# 소스 경합 설정 (주 소스 시작 후 HEDGE_DELAY초가 지나면 백업 소스를 병렬로 시작)
+ORCHESTRATOR_HEDGE_DELAY = 8
+ORCHESTRATOR_TIMEOUT = 90
+ORCHESTRATOR_BACKUPS = ['naver', 'kbo_api', 'naver_api', 'google']
+# HAR 재생 중에는 브라우저 소스만 (requests 기반 kbo_api/naver_api는 실제 네트워크로 나감)
+ORCHESTRATOR_REPLAY_BACKUPS = ['naver', 'google']
+
+# API 엔드포인트 탐색 (후보 동시 조회, 이긴 엔드포인트와 필드 매핑을 저장해 재사용)
+DISCOVERY_FILE = os.path.join(DATA_DIR, 'api_endpoint.json')
+DISCOVERY_TIMEOUT = (2, 4)  # (연결, 읽기) 초
+DISCOVERY_PROBE_DATE = '20241015'  # 경기가 있었던 날짜로 응답 형태 검증
+
+# 소스 서킷 브레이커 (연속 실패 N회면 차단, 쿨다운 후 한 번 시험 호출)
+SOURCE_HEALTH_FILE = os.path.join(DATA_DIR, 'source_health.json')
+SOURCE_FAILURE_THRESHOLD = 3
+SOURCE_COOLDOWN = 6 * 60 * 60  # 초
+
+BROWSER_LAUNCH_ARGS = ['--no-sandbox', '--disable-setuid-sandbox']
+BROWSER_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': USER_AGENT,
+    'locale': 'ko-KR',
+}
+
+# 브라우저 상태 유지 (쿠키/로컬 스토리지와 정적 리소스 캐시를 실행 간에 재사용)
+BROWSER_PERSIST_STATE = True
+BROWSER_STATE_DIR = os.path.join(DATA_DIR, 'browser')
+BROWSER_STORAGE_STATE = os.path.join(BROWSER_STATE_DIR, 'storage_state.json')
+BROWSER_CACHE_DIR = os.path.join(BROWSER_STATE_DIR, 'cache')
+BROWSER_CACHE_TYPES = ['script', 'stylesheet', 'font', 'image']
+BROWSER_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# HAR 녹화/재생 (오프라인 재현과 벤치마크용)
+HAR_DIR = os.path.join(DATA_DIR, 'har')
+HAR_DEFAULT_PATH = os.path.join(HAR_DIR, 'session.har')
+HAR_NOT_FOUND = 'abort'
+
+# 디버그 산출물 (스크린샷/HTML)
+# mode: 'off' 끔, 'failure' 실패 시에만, 'sample' 실패 시 + 성공 중 일부를 샘플링
+DEBUG_ARTIFACT_MODE = 'failure'
+DEBUG_ARTIFACT_SAMPLE_RATE = 0.05
+DEBUG_ARTIFACT_DIR = os.path.join(DATA_DIR, 'debug')
+DEBUG_ARTIFACT_MAX_FILES = 200
+DEBUG_ARTIFACT_MAX_BYTES = 100 * 1024 * 1024
+DEBUG_SCREENSHOT_QUALITY = 60
+
+
+# HTML 파서 백엔드
+# 'lxml': 일정 표/경기 박스 부분 트리만 생성 (빠르고 메모리 적음), 'html.parser': 전체 트리 (기존 동작)
+PARSER_BACKEND = 'lxml'
+
+# 파싱 결과 캐시 (파서 버전 + 페이지 내용 해시 -> 경기 목록)
+PARSE_CACHE_ENABLED = True
+PARSE_CACHE_DIR = os.path.join(DATA_DIR, 'parse_cache')
+PARSE_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# 선택자 학습 (소스/페이지 구성별로 경기를 찾은 선택자를 기억해 먼저 시도)
+SELECTOR_STATS_ENABLED = True
+SELECTOR_STATS_FILE = os.path.join(DATA_DIR, 'selector_stats.json')
+
+# 페이지 준비 판정 규칙 (소스별)
+# selector: 결과 표 선택자, response: 데이터 XHR URL 일부, stable_ms: DOM 무변화 유지 시간
+READINESS_RULES = {
+    'kbo_schedule': {
+        'selector': '#tblScheduleList td.play, table.tbl td.play',
+        'response': KBO_SCHEDULE_XHR,
+        'stable_ms': 500,
+        'timeout': 10000,
+    },
+    'kbo_schedule_update': {
+        'response': KBO_SCHEDULE_XHR,
+        'stable_ms': 300,
+        'timeout': 5000,
+    },
+    'naver_schedule': {
+        'selector': 'div.tb_wrap, table.tb_sc, div.game_box',
+        'stable_ms': 500,
+        'timeout': 10000,
+    },
+    'google_search': {
+        'selector': '#rso, #search',
+        'stable_ms': 500,
+        'timeout': 10000,
+    },
+}
+
+
+# 요청 차단 프로필 (브라우저 컨텍스트 라우팅)
+# block_types: 차단할 리소스 유형, block_domains: 광고/추적 도메인
+# allow_domains: 이 목록 밖의 제3자 도메인은 차단 (None이면 제3자 차단 안 함)
+REQUEST_BLOCK_PROFILE = 'default'
+REQUEST_BLOCK_PROFILES = {
+    'off': None,
+    'default': {
+        'block_types': ['image', 'media', 'font', 'stylesheet'],
+        'block_domains': [
+            'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
+            'google-analytics.com', 'googletagmanager.com', 'googletagservices.com',
+            'adservice.google.com', 'facebook.net', 'scorecardresearch.com', 'criteo.com',
+            'veta.naver.com', 'wcs.naver.net', 'lcs.naver.com', 'adcr.naver.com',
+        ],
+        'allow_domains': [
+            'koreabaseball.com', 'naver.com', 'naver.net', 'pstatic.net',
+            'google.com', 'google.co.kr', 'gstatic.com', 'googleapis.com',
+            'code.jquery.com', 'cdnjs.cloudflare.com', 'cdn.jsdelivr.net',
+        ],
+        'viewport': {'width': 1280, 'height': 720},
+    },
+}
+
+# 차단한 요청의 절감량 추정치 (리소스 유형별 평균 바이트)
+BLOCKED_BYTES_ESTIMATE = {
+    'image': 40000,
+    'media': 500000,
+    'font': 60000,
+    'stylesheet': 30000,
+    'script': 50000,
+}
@@ -0,0 +1,105 @@
+"""
+디버그 산출물 - 실패하거나 샘플링된 페이지만 스크린샷/HTML을 압축해 백그라운드로 저장한다
+"""
+import asyncio
+import gzip
+import os
+import random
+from datetime import datetime
+from .logger import setup_logger
+from .config import (
+    DEBUG_ARTIFACT_MODE, DEBUG_ARTIFACT_SAMPLE_RATE, DEBUG_ARTIFACT_DIR,
+    DEBUG_ARTIFACT_MAX_FILES, DEBUG_ARTIFACT_MAX_BYTES, DEBUG_SCREENSHOT_QUALITY
+)
+
+ARTIFACT_MODES = ('off', 'failure', 'sample')
+
+class DebugArtifacts:
+    """모드에 따라 페이지 스냅샷을 저장하고 디렉터리 용량을 제한"""
+
+    def __init__(self, mode=DEBUG_ARTIFACT_MODE, sample_rate=DEBUG_ARTIFACT_SAMPLE_RATE,
+                 directory=DEBUG_ARTIFACT_DIR, max_files=DEBUG_ARTIFACT_MAX_FILES,
+                 max_bytes=DEBUG_ARTIFACT_MAX_BYTES, logger=None):
+        if mode not in ARTIFACT_MODES:
+            raise ValueError(f"알 수 없는 디버그 모드: {mode}")
+
+        self.logger = logger or setup_logger('DebugArtifacts')
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._pending = set()
+
+    def should_capture(self, failed):
+        """이번 페이지를 저장할지 결정"""
+        if self.mode == 'off':
+            return False
+        if failed:
+            return True
+        return self.mode == 'sample' and random.random() < self.sample_rate
+
+    async def capture(self, page, name, failed=False):
+        """페이지 스냅샷을 떠서 백그라운드 저장 예약 (저장 작업 반환, 저장 안 하면 None)"""
+        if not self.should_capture(failed):
+            return None
+
+        try:
+            # 페이지가 닫히기 전에 데이터만 받아두고, 압축/쓰기는 스레드에서 처리
+            html = await page.content()
+            screenshot = await page.screenshot(type='jpeg', quality=DEBUG_SCREENSHOT_QUALITY)
+        except Exception as e:
+            self.logger.warning(f"디버그 스냅샷 실패 ({name}): {e}")
+            return None
+
+        prefix = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{name}_{'fail' if failed else 'sample'}"
+        task = asyncio.ensure_future(asyncio.to_thread(self._write, prefix, html, screenshot))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    async def flush(self):
+        """예약된 저장 작업 완료 대기"""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _write(self, prefix, html, screenshot):
+        """HTML(gzip)과 스크린샷(JPEG) 저장 후 보존 한도 적용"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            html_path = os.path.join(self.directory, prefix + '.html.gz')
+            with gzip.open(html_path, 'wt', encoding='utf-8') as f:
+                f.write(html)
+            with open(os.path.join(self.directory, prefix + '.jpg'), 'wb') as f:
+                f.write(screenshot)
+            self.logger.info(f"디버그 산출물 저장: {html_path}")
+            self.enforce_retention()
+        except OSError as e:
+            self.logger.warning(f"디버그 산출물 저장 실패: {e}")
+
+    def enforce_retention(self):
+        """파일 수/총 용량 한도를 넘으면 오래된 파일부터 삭제"""
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort(reverse=True)
+        kept_bytes = 0
+        removed = 0
+        for index, (_, size, path) in enumerate(entries):
+            kept_bytes += size
+            if index >= self.max_files or kept_bytes > self.max_bytes:
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+
+        if removed:
+            self.logger.info(f"디버그 산출물 정리: {removed}개 삭제")
+        return removed
@@ -0,0 +1,317 @@
+"""
+경기 결과 API 엔드포인트 탐색 - 후보 URL을 짧은 타임아웃으로 동시에 조회해 응답 형태를 검증하고,
+이긴 엔드포인트와 필드 매핑을 저장해 다음 실행부터 바로 사용 (실패하면 다시 탐색)
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from .logger import setup_logger
+from .http_client import HttpClient
+from .rate_limiter import get_rate_limiter
+from .source_health import get_source_health
+from .team_registry import get_team_registry
+from .config import HEADERS, DISCOVERY_FILE, DISCOVERY_TIMEOUT, DISCOVERY_PROBE_DATE
+
+MOBILE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+    'Referer': 'https://m.sports.naver.com/kbaseball/schedule'
+}
+
+XHR_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json, text/javascript, */*; q=0.01',
+    'X-Requested-With': 'XMLHttpRequest',
+    'Referer': 'https://sports.news.naver.com/kbaseball/schedule/index'
+}
+
+# 후보 엔드포인트 ({date}는 YYYYMMDD로 치환)
+MOBILE_CANDIDATES = [
+    {'url': "https://m.sports.naver.com/kbaseball/api/game/gameListByDate",
+     'params': {'date': '{date}', 'leagueCode': 'KBO'}, 'headers': MOBILE_HEADERS},
+    {'url': "https://m-sports.naver.com/kbaseball/api/game/gameListByDate",
+     'params': {'date': '{date}'}, 'headers': MOBILE_HEADERS},
+    {'url': "https://api.sports.naver.com/kbaseball/schedule/daily",
+     'params': {'date': '{date}'}, 'headers': MOBILE_HEADERS},
+    {'url': "https://m.sports.naver.com/api/kbaseball/schedule",
+     'params': {'date': '{date}'}, 'headers': MOBILE_HEADERS},
+    {'url': "https://m-sports.naver.com/api/kbo/schedule/list",
+     'params': {'date': '{date}'}, 'headers': MOBILE_HEADERS},
+]
+
+DIRECT_CANDIDATES = [
+    {'url': "https://sports.news.naver.com/kbaseball/schedule/gameList.nhn",
+     'params': {'date': '{date}'}, 'headers': XHR_HEADERS},
+    {'url': "https://api-gw.sports.naver.com/schedule/games",
+     'params': {'date': '{date}', 'discipline': 'kbaseball'}, 'headers': XHR_HEADERS},
+    {'url': "https://sports.news.naver.com/ajax/main/scoreboard/todayGames.nhn",
+     'params': {'sports': 'kbaseball', 'date': '{date}'}, 'headers': XHR_HEADERS},
+]
+
+# 일정/결과 API 후보 x 파라미터 조합
+SCHEDULE_CANDIDATES = [
+    {'url': url, 'params': params, 'headers': HEADERS}
+    for url in [
+        "https://api.sports.naver.com/v1/schedule/kbaseball",
+        "https://sports.news.naver.com/kbaseball/api/schedule/result",
+        "https://api-gw.sports.naver.com/gateway/schedule/games/list",
+        "https://m.sports.naver.com/api/kbaseball/schedule",
+        "https://sports.news.naver.com/ajax/schedule/games/list.nhn",
+    ]
+    for params in [
+        {'date': '{date}', 'sport': 'kbaseball'},
+        {'date': '{date}', 'leagueCode': 'KBO'},
+        {'gameDate': '{date}', 'sport': 'KBASEBALL'},
+        {'date': '{date}'},
+    ]
+]
+
+CANDIDATES = MOBILE_CANDIDATES + DIRECT_CANDIDATES + SCHEDULE_CANDIDATES
+
+# 경기 필드별로 알려진 키 이름
+FIELD_KEYS = {
+    'away_team': ['awayTeamName', 'away_team', 'awayTeam', 'aTeam', 'awayNm'],
+    'home_team': ['homeTeamName', 'home_team', 'homeTeam', 'hTeam', 'homeNm'],
+    'away_score': ['awayTeamScore', 'away_score', 'awayScore', 'aScore', 'asc'],
+    'home_score': ['homeTeamScore', 'home_score', 'homeScore', 'hScore', 'hsc'],
+}
+DATE_KEYS = ['gameDate', 'date', 'G_DT', 'gdate']
+STATUS_KEYS = ['statusCode', 'gameStatus', 'status', 'statusInfo', 'gmsc', 'state']
+# 종료된 경기의 상태 값 (대문자 비교)
+FINAL_STATUSES = {'RESULT', 'FINAL', 'END', 'F', '종료', '경기종료'}
+MAX_DEPTH = 4
+
+def _is_score(value):
+    return isinstance(value, int) or (isinstance(value, str) and value.strip().isdigit())
+
+def infer_schema(items):
+    """경기 dict 목록에서 필드 매핑 추론 (팀/점수 키가 모두 있어야 함, 없으면 None)"""
+    sample = [item for item in items[:5] if isinstance(item, dict)]
+    if not sample:
+        return None
+
+    mapping = {}
+    for field, keys in FIELD_KEYS.items():
+        check = _is_score if field.endswith('score') else (lambda v: isinstance(v, str) and v.strip())
+        key = next((k for k in keys if any(check(item.get(k)) for item in sample)), None)
+        if key is None:
+            return None
+        mapping[field] = key
+    mapping['date'] = next((k for k in DATE_KEYS if any(k in item for item in sample)), None)
+    mapping['status'] = next((k for k in STATUS_KEYS if any(k in item for item in sample)), None)
+    return mapping
+
+def find_games(data, path=(), depth=0):
+    """응답 JSON에서 경기 목록 위치와 매핑 찾기 - (경로, 매핑) 또는 None"""
+    if isinstance(data, list):
+        mapping = infer_schema(data)
+        return (list(path), mapping) if mapping else None
+    if isinstance(data, dict) and depth < MAX_DEPTH:
+        for key, value in data.items():
+            found = find_games(value, path + (key,), depth + 1)
+            if found:
+                return found
+    return None
+
+def extract_games(data, path, mapping, date, teams=None):
+    """저장된 경로/매핑으로 종료 경기 목록 추출 (경로가 없으면 ValueError - 응답 형태가 바뀜)
+
+    팀 이름은 레지스트리의 정규 이름으로 바꾸고, 알 수 없는 팀의 경기는 제외
+    """
+    teams = teams or get_team_registry()
+    items = data
+    for key in path:
+        if not isinstance(items, dict) or key not in items:
+            raise ValueError(f"응답에 경로 없음: {'/'.join(path)}")
+        items = items[key]
+    if not isinstance(items, list):
+        raise ValueError(f"경기 목록이 아님: {'/'.join(path)}")
+
+    games = []
+    date_digits = date.strftime('%Y%m%d')
+    for item in items:
+        # 날짜 필드가 있으면 다른 날짜 경기는 제외
+        if mapping.get('date'):
+            item_digits = ''.join(ch for ch in str(item.get(mapping['date'], '')) if ch.isdigit())[:8]
+            if len(item_digits) == 8 and item_digits != date_digits:
+                continue
+        if mapping.get('status') and str(item.get(mapping['status'], '')).strip().upper() not in FINAL_STATUSES:
+            # 예정/진행 중/취소 경기
+            continue
+        try:
+            away_score = int(item[mapping['away_score']])
+            home_score = int(item[mapping['home_score']])
+        except (KeyError, TypeError, ValueError):
+            # 점수가 없는 경기 (예정/취소)
+            continue
+        if not mapping.get('status') and away_score == home_score == 0:
+            # 상태 필드가 없으면 0:0은 시작 전 경기로 봄
+            continue
+
+        away_team = teams.canonical(str(item.get(mapping['away_team'], '')))
+        home_team = teams.canonical(str(item.get(mapping['home_team'], '')))
+        if away_team is None or home_team is None:
+            continue
+        if away_score > home_score:
+            winner = away_team
+        elif home_score > away_score:
+            winner = home_team
+        else:
+            winner = "무승부"
+
+        games.append({
+            'date': date.strftime('%Y-%m-%d'),
+            'away_team': away_team,
+            'home_team': home_team,
+            'away_score': away_score,
+            'home_score': home_score,
+            'winner': winner
+        })
+    return games
+
+class EndpointDiscovery:
+    """후보 엔드포인트 동시 탐색과 이긴 엔드포인트 재사용"""
+
+    def __init__(self, candidates=CANDIDATES, path=DISCOVERY_FILE, timeout=DISCOVERY_TIMEOUT,
+                 source_name='naver_api', http=None, limiter=None, health=None, logger=None):
+        self.logger = logger or setup_logger('EndpointDiscovery')
+        self.candidates = candidates
+        self.path = path
+        self.source_name = source_name
+        # 탐색은 짧은 타임아웃, 재시도 없음, 캐시 없음
+        # 속도 제한은 공유하되 응답 시간에 대기가 섞이지 않도록 요청 직전에 직접 거침
+        self.http = http or HttpClient(timeout=timeout, retries=0)
+        self.limiter = limiter or (None if http else get_rate_limiter())
+        self.health = health or get_source_health()
+        self.teams = get_team_registry()
+        self.last_report = []
+
+    def _request(self, candidate, date):
+        date_str = date.strftime('%Y%m%d')
+        params = {k: v.replace('{date}', date_str) for k, v in (candidate.get('params') or {}).items()}
+        return candidate['url'].replace('{date}', date_str), params, candidate.get('headers') or HEADERS
+
+    def _wait(self, url):
+        if self.limiter is not None:
+            self.limiter.acquire(url)
+
+    def probe(self, candidate, date):
+        """후보 하나 조회 - 결과 dict (ok, status, latency_ms, path, mapping, error)"""
+        url, params, headers = self._request(candidate, date)
+        result = {'url': url, 'params': params, 'ok': False}
+        self._wait(url)
+        start = time.perf_counter()
+        try:
+            response = self.http.get(url, params=params, headers=headers)
+            result['status'] = response.status_code
+            if response.status_code != 200:
+                result['error'] = f"HTTP {response.status_code}"
+                return result
+            found = find_games(response.json())
+            if not found:
+                result['error'] = '경기 목록 형태 아님'
+                return result
+            result.update(ok=True, path=found[0], mapping=found[1])
+        except ValueError:
+            result['error'] = 'JSON 아님'
+        except Exception as e:
+            result['error'] = e.__class__.__name__
+        finally:
+            result['latency_ms'] = round((time.perf_counter() - start) * 1000)
+        return result
+
+    def discover(self, date=None):
+        """모든 후보를 동시에 조회해 가장 빨리 검증된 엔드포인트 저장 - 저장한 항목 또는 None"""
+        date = date or datetime.strptime(DISCOVERY_PROBE_DATE, '%Y%m%d')
+        self.logger.info(f"엔드포인트 탐색: 후보 {len(self.candidates)}개")
+        self.last_report = []
+
+        with ThreadPoolExecutor(max_workers=len(self.candidates) or 1) as executor:
+            futures = {executor.submit(self.probe, candidate, date): candidate for candidate in self.candidates}
+            for future in as_completed(futures):
+                self.last_report.append((futures[future], future.result()))
+
+        valid = [(candidate, result) for candidate, result in self.last_report if result['ok']]
+        if not valid:
+            self.logger.warning("검증된 엔드포인트 없음")
+            return None
+
+        candidate, result = min(valid, key=lambda pair: pair[1]['latency_ms'])
+        endpoint = {
+            'url': candidate['url'],
+            'params': candidate.get('params') or {},
+            'headers': candidate.get('headers') or HEADERS,
+            'path': result['path'],
+            'mapping': result['mapping'],
+            'latency_ms': result['latency_ms'],
+            'discovered_at': datetime.now().isoformat(timespec='seconds')
+        }
+        self.save(endpoint)
+        self.logger.info(f"엔드포인트 채택: {endpoint['url']} ({result['latency_ms']}ms, 경로 {'/'.join(result['path']) or '-'})")
+        return endpoint
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, endpoint):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(endpoint, f, ensure_ascii=False, indent=2)
+            os.replace(self.path + '.tmp', self.path)
+        except OSError as e:
+            self.logger.warning(f"엔드포인트 저장 실패: {e}")
+
+    def forget(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _fetch(self, endpoint, date):
+        """엔드포인트 조회 - 4xx나 응답 형태가 바뀐 경우 ValueError, 5xx/타임아웃/연결 오류는 requests 예외"""
+        url, params, headers = self._request(endpoint, date)
+        self._wait(url)
+        response = self.http.get(url, params=params, headers=headers)
+        if 400 <= response.status_code < 500:
+            raise ValueError(f"HTTP {response.status_code}")
+        response.raise_for_status()
+        return extract_games(response.json(), endpoint['path'], endpoint['mapping'], date, self.teams)
+
+    def get_game_results(self, date):
+        """저장된 엔드포인트로 바로 조회, 엔드포인트가 사라졌거나 형태가 바뀌었으면 한 번 다시 탐색"""
+        endpoint = self.load()
+        if endpoint:
+            try:
+                games = self._fetch(endpoint, date)
+                self.health.record_success(self.source_name)
+                return games
+            except ValueError as e:
+                self.logger.warning(f"저장된 엔드포인트 실패, 다시 탐색: {endpoint['url']} ({e})")
+                self.forget()
+            except Exception as e:
+                # 일시적인 장애는 이번 실행의 실패로만 기록하고 엔드포인트는 유지
+                self.logger.error(f"엔드포인트 조회 에러: {endpoint['url']} ({e.__class__.__name__}: {e})")
+                self.health.record_failure(self.source_name, e)
+                return []
+
+        endpoint = self.discover()
+        if endpoint is None:
+            self.health.record_failure(self.source_name, '검증된 엔드포인트 없음')
+            return []
+
+        try:
+            games = self._fetch(endpoint, date)
+        except Exception as e:
+            self.logger.error(f"엔드포인트 조회 에러: {e}")
+            self.health.record_failure(self.source_name, e)
+            return []
+        self.health.record_success(self.source_name)
+        return games
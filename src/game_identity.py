@@ -0,0 +1,75 @@
+"""
+경기 식별 키와 중복 제거 - (날짜, 홈팀 ID, 원정팀 ID, 경기 번호)가 같은 경기는 한 번만 남긴다.
+경기 번호를 주지 않는 소스(화면 텍스트)는 같은 대진의 서로 다른 점수를 더블헤더 1, 2차전으로 본다
+"""
+from .team_registry import get_team_registry
+
+class GameSet:
+    """넣은 순서를 유지하는 경기 집합 - 추가/확인 모두 O(1)"""
+
+    def __init__(self, registry=None):
+        self.registry = registry or get_team_registry()
+        self.games = []
+        self._keys = set()
+        # (날짜, 홈, 원정, 원정 점수, 홈 점수) - 경기 번호 없이 들어온 같은 텍스트 반복 확인용
+        self._scores = set()
+        # (날짜, 홈, 원정) -> 지금까지 받은 경기 수
+        self._counts = {}
+        # 같은 이름이 수백 번 반복되는 페이지에서 레지스트리 검색을 한 번만 하도록
+        self._team_ids = {}
+
+    def _team(self, name):
+        """팀 ID (레지스트리에 없는 이름은 이름 그대로)"""
+        if name not in self._team_ids:
+            team_id = self.registry.find(name)
+            self._team_ids[name] = team_id if team_id is not None else name
+        return self._team_ids[name]
+
+    def matchup(self, game):
+        """(날짜, 홈팀 ID, 원정팀 ID)"""
+        return game['date'], self._team(game['home_team']), self._team(game['away_team'])
+
+    def key(self, game, game_no=1):
+        """경기 식별 키 (날짜, 홈팀 ID, 원정팀 ID, 경기 번호)"""
+        return self.matchup(game) + (game_no,)
+
+    def add(self, game, game_no=None):
+        """새 경기면 추가하고 True, 이미 있으면 False"""
+        matchup = self.matchup(game)
+        scores = matchup + (game['away_score'], game['home_score'])
+
+        if game_no is None:
+            if scores in self._scores:
+                return False
+            game_no = self._counts.get(matchup, 0) + 1
+
+        key = matchup + (game_no,)
+        if key in self._keys:
+            return False
+
+        self._keys.add(key)
+        self._scores.add(scores)
+        self._counts[matchup] = max(self._counts.get(matchup, 0), game_no)
+        self.games.append(game)
+        return True
+
+    def extend(self, games):
+        """여러 경기 추가 - 새로 추가된 수"""
+        return sum(1 for game in games if self.add(game))
+
+    def __contains__(self, game):
+        matchup = self.matchup(game)
+        return matchup + (game['away_score'], game['home_score']) in self._scores
+
+    def __iter__(self):
+        return iter(self.games)
+
+    def __len__(self):
+        return len(self.games)
+
+def dedupe_games(*sources):
+    """여러 경기 목록을 순서대로 합치며 중복 제거"""
+    merged = GameSet()
+    for games in sources:
+        merged.extend(games)
+    return merged.games
@@ -1,18 +1,22 @@
 """
 구글 검색 결과에서 KBO 경기 정보 크롤링
 """
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import json
 import re
 from .logger import setup_logger
-from .config import DATA_DIR, TEAM_NAMES
+from .config import DATA_DIR
+from .http_client import get_http_client
+from .team_registry import get_team_registry
+from .game_identity import GameSet
 import os
 
 class GoogleCrawler:
     def __init__(self):
         self.logger = setup_logger('GoogleCrawler')
+        self.http = get_http_client()
+        self.teams = get_team_registry()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -34,7 +38,7 @@ class GoogleCrawler:
         search_url = f"https://www.google.com/search?q={search_query}&hl=ko"
         
         try:
-            response = requests.get(search_url, headers=self.headers)
+            response = self.http.get(search_url, headers=self.headers)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -57,7 +61,7 @@ class GoogleCrawler:
     
     def _parse_google_sports_widget(self, soup, date):
         """구글 스포츠 위젯에서 경기 정보 파싱"""
-        games = []
+        games = GameSet()
         
         # 구글 스포츠 위젯 선택자들
         widget_selectors = [
@@ -75,8 +79,7 @@ class GoogleCrawler:
                 widget_text = widget.get_text()
                 
                 # KBO 팀 이름이 포함된 위젯인지 확인
-                kbo_teams = ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데']
-                if any(team in widget_text for team in kbo_teams):
+                if self.teams.find(widget_text) is not None:
                     self.logger.info("KBO 경기 위젯 발견!")
                     
                     # 경기 정보 추출
@@ -96,7 +99,7 @@ class GoogleCrawler:
                                 score2 = score2_elem.get_text(strip=True)
                                 
                                 # 팀 이름과 점수 검증
-                                if team1 in kbo_teams and team2 in kbo_teams and score1.isdigit() and score2.isdigit():
+                                if self.teams.is_team(team1) and self.teams.is_team(team2) and score1.isdigit() and score2.isdigit():
                                     score1 = int(score1)
                                     score2 = int(score2)
                                     
@@ -111,17 +114,18 @@ class GoogleCrawler:
                                         'winner': winner
                                     }
                                     
-                                    games.append(game_info)
-                                    self.logger.info(f"경기 발견: {team1} {score1} - {score2} {team2}")
+                                    # 중첩된 요소마다 같은 경기가 반복되므로 한 번만
+                                    if games.add(game_info):
+                                        self.logger.info(f"경기 발견: {team1} {score1} - {score2} {team2}")
                                     
                         except Exception as e:
                             continue
         
-        return games
+        return games.games
     
     def _parse_search_results(self, soup, date):
         """일반 검색 결과에서 경기 정보 찾기"""
-        games = []
+        games = GameSet()
         
         # 검색 결과 항목들
         search_results = soup.find_all(['div', 'g'], class_=['g', 'tF2Cxc'])
@@ -142,8 +146,7 @@ class GoogleCrawler:
                     team1, score1, score2, team2 = match
                     
                     # KBO 팀인지 확인
-                    kbo_teams = ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데']
-                    if team1 in kbo_teams and team2 in kbo_teams:
+                    if self.teams.is_team(team1) and self.teams.is_team(team2):
                         score1 = int(score1)
                         score2 = int(score2)
                         
@@ -159,11 +162,10 @@ class GoogleCrawler:
                         }
                         
                         # 중복 체크
-                        if game_info not in games:
-                            games.append(game_info)
+                        if games.add(game_info):
                             self.logger.info(f"경기 발견: {team1} {score1} - {score2} {team2}")
         
-        return games
+        return games.games
     
     def get_live_scores(self):
         """실시간 경기 스코어 가져오기"""
@@ -174,7 +176,7 @@ class GoogleCrawler:
         search_url = f"https://www.google.com/search?q={search_query}&hl=ko"
         
         try:
-            response = requests.get(search_url, headers=self.headers)
+            response = self.http.get(search_url, headers=self.headers)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -2,18 +2,24 @@
 Playwright를 사용한 구글 검색 결과 크롤링
 """
 import asyncio
-from playwright.async_api import async_playwright
 from datetime import datetime, timedelta
 import json
 import re
 from bs4 import BeautifulSoup
 from .logger import setup_logger
-from .config import DATA_DIR, TEAM_NAMES
+from .config import DATA_DIR
+from .browser_pool import borrow_page
+from .page_readiness import goto_ready
+from .debug_artifacts import DebugArtifacts
+from .game_identity import GameSet
+from .team_registry import TEAM_NAMES
 import os
 
 class GooglePlaywrightCrawler:
-    def __init__(self):
+    def __init__(self, pool=None):
         self.logger = setup_logger('GooglePlaywrightCrawler')
+        self.pool = pool
+        self.artifacts = DebugArtifacts(logger=self.logger)
     
     async def get_game_results(self, date=None):
         """구글 검색으로 KBO 경기 결과 가져오기"""
@@ -24,33 +30,20 @@ class GooglePlaywrightCrawler:
         
         games = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            # 한국어 설정
-            await page.set_extra_http_headers({
-                'Accept-Language': 'ko-KR,ko;q=0.9'
-            })
-            
+        # 공유 풀의 컨텍스트는 한국어 로캘이고 요청 차단/HTTP 캐시/속도 제한이 적용됨
+        async with borrow_page(self.pool) as page:
             try:
                 # 구글 검색
                 search_query = "KBO 경기결과"
                 search_url = f"https://www.google.com/search?q={search_query}&hl=ko"
                 
                 self.logger.info(f"구글 검색: {search_url}")
-                await page.goto(search_url, wait_until='networkidle')
-                
                 # 스포츠 카드가 로드될 때까지 대기
-                await page.wait_for_timeout(3000)
-                
-                # 스크린샷 저장 (디버깅용)
-                await page.screenshot(path="data/google_sports_screenshot.png")
-                self.logger.info("스크린샷 저장: data/google_sports_screenshot.png")
+                await goto_ready(page, search_url, 'google_search', self.logger)
                 
                 # JavaScript로 데이터 추출
                 games_data = await page.evaluate("""
-                    () => {
+                    (kboTeams) => {
                         const games = [];
                         
                         // 구글 스포츠 카드 선택자들
@@ -62,9 +55,6 @@ class GooglePlaywrightCrawler:
                             'div[data-hveid]'
                         ];
                         
-                        // KBO 팀 목록
-                        const kboTeams = ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데'];
-                        
                         // 모든 요소 검색
                         const allElements = document.querySelectorAll('*');
                         
@@ -99,11 +89,12 @@ class GooglePlaywrightCrawler:
                         
                         return uniqueGames.slice(0, 10);  // 최대 10개
                     }
-                """)
+                """, list(TEAM_NAMES))
                 
                 self.logger.info(f"발견된 게임 데이터: {len(games_data)}개")
                 
-                # 게임 데이터 파싱
+                # 게임 데이터 파싱 (같은 경기는 한 번만)
+                found = GameSet()
                 for game_data in games_data:
                     try:
                         text = game_data['text']
@@ -138,11 +129,12 @@ class GooglePlaywrightCrawler:
                                 'winner': winner
                             }
                             
-                            games.append(game_info)
-                            self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
+                            if found.add(game_info):
+                                self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
                             
                     except Exception as e:
                         self.logger.error(f"게임 파싱 에러: {e}")
+                games = found.games
                 
                 # HTML도 파싱 시도
                 if not games:
@@ -152,21 +144,22 @@ class GooglePlaywrightCrawler:
             except Exception as e:
                 self.logger.error(f"구글 크롤링 에러: {e}")
                 
-            finally:
-                await browser.close()
+            await self.artifacts.capture(page, f"google_sports_{date.strftime('%Y%m%d')}", failed=not games)
         
+        # 스냅샷은 이미 메모리에 있으므로 페이지를 반납한 뒤 파일 저장만 기다림
+        await self.artifacts.flush()
         return games
     
     def _parse_html_content(self, html, date):
         """HTML 콘텐츠에서 경기 정보 추출"""
-        games = []
+        games = GameSet()
         soup = BeautifulSoup(html, 'html.parser')
         
         # 텍스트 기반 검색
         text = soup.get_text()
         
-        # KBO 팀 목록
-        kbo_teams = ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데']
+        # KBO 팀 목록 (공용 팀 레지스트리의 정규 이름)
+        kbo_teams = list(TEAM_NAMES)
         
         # 경기 패턴 찾기
         for i, team1 in enumerate(kbo_teams):
@@ -196,14 +189,13 @@ class GooglePlaywrightCrawler:
                                 'winner': winner
                             }
                             
-                            if game_info not in games:
-                                games.append(game_info)
+                            if games.add(game_info):
                                 self.logger.info(f"HTML 파싱 경기: {team1} {score1} - {score2} {team2}")
                                 
                         except Exception as e:
                             continue
         
-        return games
+        return games.games
     
     async def run(self, date=None):
         """크롤러 실행"""
@@ -2,18 +2,21 @@
 실제 작동하는 구글 검색 기반 KBO 크롤러
 """
 import asyncio
-from playwright.async_api import async_playwright
 from datetime import datetime, timedelta
 import json
 import re
 from bs4 import BeautifulSoup
 from .logger import setup_logger
 from .config import DATA_DIR
+from .browser_pool import borrow_page
+from .page_readiness import goto_ready
+from .team_registry import TEAM_NAMES
 import os
 
 class GoogleRealCrawler:
-    def __init__(self):
+    def __init__(self, pool=None):
         self.logger = setup_logger('GoogleRealCrawler')
+        self.pool = pool
         
     async def get_game_results(self, date=None):
         """구글 검색으로 KBO 경기 결과 가져오기"""
@@ -24,37 +27,22 @@ class GoogleRealCrawler:
         
         games = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='ko-KR'
-            )
-            
-            page = await context.new_page()
-            
+        async with borrow_page(self.pool) as page:
             try:
                 # 구글 검색 - 날짜 없이
                 search_query = "KBO 경기결과"
                 search_url = f"https://www.google.com/search?q={search_query}&hl=ko"
                 
                 self.logger.info(f"검색: {search_query}")
-                await page.goto(search_url)
-                await page.wait_for_timeout(5000)
+                await goto_ready(page, search_url, 'google_search', self.logger)
                 
                 # HTML 콘텐츠 가져오기
                 content = await page.content()
                 
                 # JavaScript로 데이터 추출
                 extracted_data = await page.evaluate("""
-                    () => {
+                    (kboTeams) => {
                         const results = [];
-                        const kboTeams = ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데'];
                         
                         // 모든 텍스트 노드 검색
                         const walker = document.createTreeWalker(
@@ -125,7 +113,7 @@ class GoogleRealCrawler:
                         
                         return results;
                     }
-                """)
+                """, list(TEAM_NAMES))
                 
                 self.logger.info(f"추출된 데이터: {len(extracted_data)}개")
                 
@@ -178,8 +166,7 @@ class GoogleRealCrawler:
                     
                     for match in tving_matches:
                         team1, score, team2 = match
-                        if team1 in ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데'] and \
-                           team2 in ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데']:
+                        if team1 in TEAM_NAMES and team2 in TEAM_NAMES:
                             
                             # 다음 점수 찾기
                             next_score_match = re.search(f"{team2}\\.\\s+(\\d+)", text[text.find(match[0]):])
@@ -207,9 +194,6 @@ class GoogleRealCrawler:
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
-                
-            finally:
-                await browser.close()
         
         return games
     
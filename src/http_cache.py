@@ -0,0 +1,251 @@
+"""
+HTTP 응답 디스크 캐시 - 메서드+URL+본문 단위로 저장하고 ETag/Last-Modified로 재검증, 확정된 과거 날짜는 동결
+"""
+import calendar
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qsl
+from .logger import setup_logger
+from .config import HTTP_CACHE_DIR, HTTP_CACHE_FREEZE_DAYS, HTTP_CACHE_BROWSER_TYPES
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 버린다
+DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'set-cookie', 'connection'}
+
+def is_final_date(date, freeze_days=HTTP_CACHE_FREEZE_DAYS):
+    """경기 결과가 더 바뀌지 않는 날짜인지 (정정 가능성을 고려해 며칠 여유)"""
+    return date.date() <= (datetime.now() - timedelta(days=freeze_days)).date()
+
+def is_final_month(year, month, freeze_days=HTTP_CACHE_FREEZE_DAYS):
+    """월의 마지막 날까지 확정됐는지 (월 단위 페이지/응답용)"""
+    last_day = calendar.monthrange(year, month)[1]
+    return is_final_date(datetime(year, month, last_day), freeze_days)
+
+def request_period(url, body=None):
+    """요청이 가리키는 기간의 마지막 날 - URL 쿼리/폼 본문의 date=YYYYMMDD 또는 seasonId(year)+gameMonth(month)
+
+    기간을 알 수 없으면 None
+    """
+    params = parse_qsl(urlparse(url).query)
+    if body:
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', errors='replace')
+        params += parse_qsl(body)
+    params = {k.lower(): v for k, v in params}
+
+    date = params.get('date') or params.get('gamedate') or ''
+    if re.fullmatch(r'\d{8}', date):
+        try:
+            return datetime.strptime(date, '%Y%m%d')
+        except ValueError:
+            pass
+
+    year = params.get('seasonid') or params.get('year') or ''
+    month = params.get('gamemonth') or params.get('month') or ''
+    if year.isdigit() and month.isdigit() and 1 <= int(month) <= 12:
+        year, month = int(year), int(month)
+        return datetime(year, month, calendar.monthrange(year, month)[1])
+    return None
+
+def is_final_request(url, body=None, freeze_days=HTTP_CACHE_FREEZE_DAYS):
+    """요청이 확정된 날짜/월을 가리키는지 (기간을 알 수 없으면 None)"""
+    period = request_period(url, body)
+    if period is None:
+        return None
+    return is_final_date(period, freeze_days)
+
+# 페이지 -> (캐시, 동결 캐시로 응답했거나 동결해 저장한 키) - 결과가 비면 invalidate_page로 삭제
+_page_frozen = weakref.WeakKeyDictionary()
+
+def invalidate_page(page):
+    """페이지가 동결 캐시에서 받았거나 동결해 저장한 응답 삭제 (동의 화면/에러 페이지가 계속 재생되지 않도록)
+
+    삭제한 건수 반환 - 페이지 등록은 유지하므로 같은 페이지에서 이후에 동결한 응답도 다시 삭제할 수 있음
+    """
+    cache, keys = _page_frozen.get(page, (None, set()))
+    count = len(keys)
+    for key in keys:
+        cache.invalidate(key)
+    keys.clear()
+    if count:
+        cache.logger.info(f"동결 응답 삭제: {count}건 ({page.url})")
+    return count
+
+def cache_key(method, url, body=None):
+    """메서드+URL+본문 해시"""
+    digest = hashlib.sha256(f"{method.upper()} {url}\n".encode('utf-8'))
+    if body:
+        digest.update(body if isinstance(body, bytes) else str(body).encode('utf-8'))
+    return digest.hexdigest()
+
+class CacheEntry:
+    """캐시 항목 한 개"""
+
+    def __init__(self, meta, body):
+        self.meta = meta
+        self.body = body
+
+    @property
+    def status(self):
+        return self.meta['status']
+
+    @property
+    def headers(self):
+        return self.meta['headers']
+
+    @property
+    def frozen(self):
+        return self.meta.get('frozen', False)
+
+    def conditional_headers(self):
+        """재검증용 요청 헤더"""
+        headers = {}
+        lowered = {k.lower(): v for k, v in self.headers.items()}
+        if 'etag' in lowered:
+            headers['If-None-Match'] = lowered['etag']
+        if 'last-modified' in lowered:
+            headers['If-Modified-Since'] = lowered['last-modified']
+        return headers
+
+class HttpCache:
+    """조건부 요청을 지원하는 응답 캐시"""
+
+    def __init__(self, directory=HTTP_CACHE_DIR, browser_types=HTTP_CACHE_BROWSER_TYPES, logger=None):
+        self.logger = logger or setup_logger('HttpCache')
+        self.directory = directory
+        self.browser_types = set(browser_types)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, key):
+        """캐시 항목 반환 (없으면 None)"""
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(meta, body)
+
+    def store(self, key, method, url, status, headers, body, frozen=False):
+        """응답 저장 - 동결 대상이거나 재검증 헤더가 있는 200 응답만"""
+        headers = {k: v for k, v in headers.items() if k.lower() not in DROP_HEADERS}
+        lowered = {k.lower() for k in headers}
+        cache_control = next((v for k, v in headers.items() if k.lower() == 'cache-control'), '').lower()
+        if status != 200 or 'no-store' in cache_control:
+            return False
+        if not frozen and not lowered & {'etag', 'last-modified'}:
+            return False
+
+        meta_path, body_path = self._paths(key)
+        meta = {
+            'method': method,
+            'url': url,
+            'status': status,
+            'headers': headers,
+            'frozen': frozen,
+            'stored_at': time.time()
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(body_path + '.tmp', 'wb') as f:
+                f.write(body)
+            os.replace(body_path + '.tmp', body_path)
+            with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_path + '.tmp', meta_path)
+        except OSError as e:
+            self.logger.warning(f"HTTP 캐시 저장 실패: {url} ({e})")
+            return False
+        return True
+
+    def invalidate(self, key):
+        """항목 삭제 (동결했는데 결과가 비어 있던 경우 등)"""
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def record(self, outcome):
+        """hit: 네트워크 생략, revalidated: 304 재사용, miss: 전체 응답 수신"""
+        with self._lock:
+            if outcome == 'hit':
+                self.hits += 1
+            elif outcome == 'revalidated':
+                self.revalidated += 1
+            else:
+                self.misses += 1
+
+    def hit_rate(self):
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+    def summary(self):
+        return (f"적중 {self.hits}건, 재검증 {self.revalidated}건, 미스 {self.misses}건 "
+                f"(적중률 {self.hit_rate() * 100:.0f}%)")
+
+    async def attach(self, page, freeze=False, limiter=None):
+        """페이지 문서/XHR 요청에 캐시 라우팅 등록 (freeze면 확정된 날짜/월을 가리키는 요청은 네트워크 생략)
+
+        limiter: 캐시 미스/재검증으로 네트워크에 나갈 때만 거치는 속도 제한기
+        """
+        frozen_keys = set()
+        _page_frozen[page] = (self, frozen_keys)
+
+        async def handle(route):
+            request = route.request
+            if request.resource_type not in self.browser_types:
+                await route.fallback()
+                return
+
+            key = cache_key(request.method, request.url, request.post_data_buffer)
+            entry = self.lookup(key)
+            # 페이지가 동결 모드여도 확정된 날짜/월을 가리키는 요청만 동결 (같은 페이지의 이번 달 XHR 등은 제외)
+            final = freeze and is_final_request(request.url, request.post_data_buffer) is True
+            if entry and entry.frozen and final:
+                self.record('hit')
+                frozen_keys.add(key)
+                await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+                return
+
+            if limiter:
+                await limiter.acquire_async(request.url)
+            try:
+                if entry:
+                    headers = dict(request.headers)
+                    headers.update(entry.conditional_headers())
+                    response = await route.fetch(headers=headers)
+                else:
+                    response = await route.fetch()
+                body = await response.body() if response.status != 304 else None
+            except Exception:
+                await route.fallback()
+                return
+
+            if response.status == 304 and entry:
+                self.record('revalidated')
+                await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+                return
+
+            self.record('miss')
+            if self.store(key, request.method, request.url, response.status, response.headers, body, frozen=final) and final:
+                frozen_keys.add(key)
+            await route.fulfill(status=response.status,
+                                headers={k: v for k, v in response.headers.items() if k.lower() not in DROP_HEADERS},
+                                body=body)
+
+        await page.route('**/*', handle)
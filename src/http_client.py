@@ -0,0 +1,227 @@
+"""
+공유 HTTP 클라이언트 - 호스트별 연결 풀(keep-alive), 필수 타임아웃, 속도 제한, 5xx/429 재시도와 지연 시간 분포 기록
+"""
+import asyncio
+import bisect
+import random
+import threading
+import time
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from .logger import setup_logger
+from .http_cache import HttpCache, cache_key, is_final_request
+from .rate_limiter import get_rate_limiter
+from .config import (
+    HTTP_TIMEOUT, HTTP_POOL_MAXSIZE, HTTP_RETRIES, HTTP_RETRY_STATUS,
+    HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX, HTTP_LATENCY_BUCKETS_MS, HTTP_CACHE_ENABLED
+)
+
+class LatencyHistogram:
+    """호스트 한 개의 응답 시간 분포 (버킷 상한 ms 기준)"""
+
+    def __init__(self, buckets=HTTP_LATENCY_BUCKETS_MS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.errors = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms, error=False, retry=False):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, elapsed_ms)] += 1
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.errors += error
+            self.retries += retry
+
+    def percentile(self, q):
+        """q 분위가 속한 버킷 상한 (마지막 버킷이면 inf)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def summary(self):
+        mean = self.total_ms / self.count if self.count else 0
+        return (f"{self.count}건, 평균 {mean:.0f}ms, p50 <= {self.percentile(0.5)}ms, "
+                f"p95 <= {self.percentile(0.95)}ms, 재시도 {self.retries}회, 실패 {self.errors}건")
+
+class HttpClient:
+    """호스트별 Session을 재사용하는 HTTP 클라이언트"""
+
+    def __init__(self, timeout=HTTP_TIMEOUT, retries=HTTP_RETRIES, retry_status=HTTP_RETRY_STATUS,
+                 backoff_base=HTTP_BACKOFF_BASE, backoff_max=HTTP_BACKOFF_MAX, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 cache=None, limiter=None):
+        self.logger = setup_logger('HttpClient')
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_status = set(retry_status)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache
+        self.limiter = limiter
+        self.histograms = {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url):
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _session(self, host):
+        """호스트 전용 Session (연결 풀 유지)"""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                # 재시도는 직접 처리하므로 어댑터 재시도는 끔
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=0)
+                session.mount(host, adapter)
+                self._sessions[host] = session
+                self.histograms.setdefault(host, LatencyHistogram())
+            return session
+
+    def _backoff(self, attempt, response=None):
+        """지수 백오프 + 지터 (429의 Retry-After가 있으면 우선)"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(int(retry_after), self.backoff_max)
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.5)
+
+    def request(self, method, url, freeze=False, use_cache=True, **kwargs):
+        """요청 실행 (캐시 조회 후 네트워크) - freeze면 확정된 응답으로 보고 다음부터 네트워크 생략"""
+        if self.cache is None or not use_cache:
+            return self._send(method, url, **kwargs)
+
+        # 키는 파라미터가 붙은 최종 URL과 본문 기준
+        prepared = requests.Request(method, url, params=kwargs.get('params'), data=kwargs.get('data'),
+                                    json=kwargs.get('json')).prepare()
+        key = cache_key(method, prepared.url, prepared.body)
+        entry = self.cache.lookup(key)
+
+        # 요청이 가리키는 기간이 아직 확정 전이면 예전에 동결된 항목이라도 다시 확인
+        if entry and entry.frozen and is_final_request(prepared.url, prepared.body) is not False:
+            self.cache.record('hit')
+            return self._cached_response(entry, prepared.url)
+
+        if entry:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **entry.conditional_headers())
+
+        response = self._send(method, url, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.cache.record('revalidated')
+            return self._cached_response(entry, prepared.url)
+
+        self.cache.record('miss')
+        self.cache.store(key, method, prepared.url, response.status_code, response.headers, response.content, frozen=freeze)
+        return response
+
+    def _cached_response(self, entry, url):
+        """캐시 항목을 requests.Response로 변환"""
+        response = requests.Response()
+        response.status_code = entry.status
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = url
+        return response
+
+    def invalidate(self, method, url, **kwargs):
+        """캐시 항목 삭제 (동결했지만 내용이 비어 있던 응답 등)"""
+        if self.cache is None:
+            return
+        prepared = requests.Request(method, url, params=kwargs.get('params'), data=kwargs.get('data'),
+                                    json=kwargs.get('json')).prepare()
+        self.cache.invalidate(cache_key(method, prepared.url, prepared.body))
+
+    def _send(self, method, url, **kwargs):
+        """네트워크 요청 (타임아웃 필수, 5xx/429와 연결 오류는 재시도)"""
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+
+        host = self._host(url)
+        session = self._session(host)
+        histogram = self.histograms[host]
+
+        for attempt in range(self.retries + 1):
+            if self.limiter is not None:
+                # 재시도도 한 번의 요청으로 계산 (대기 시간은 지연 분포에서 제외)
+                self.limiter.acquire(url)
+            start = time.perf_counter()
+            last_attempt = attempt >= self.retries
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                histogram.record((time.perf_counter() - start) * 1000, error=last_attempt, retry=not last_attempt)
+                if last_attempt:
+                    raise
+                delay = self._backoff(attempt)
+                self.logger.warning(f"{method} {url} 연결 실패 ({e.__class__.__name__}), {delay:.1f}초 후 재시도")
+            else:
+                retry = response.status_code in self.retry_status and not last_attempt
+                histogram.record((time.perf_counter() - start) * 1000,
+                                 error=response.status_code >= 400 and not retry, retry=retry)
+                if not retry:
+                    return response
+                delay = self._backoff(attempt, response)
+                self.logger.warning(f"{method} {url} 응답 {response.status_code}, {delay:.1f}초 후 재시도")
+
+            time.sleep(delay)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    async def arequest(self, method, url, **kwargs):
+        """비동기 요청 - 연결 풀을 공유하며 스레드에서 실행"""
+        return await asyncio.to_thread(self.request, method, url, **kwargs)
+
+    async def aget(self, url, **kwargs):
+        return await self.arequest('GET', url, **kwargs)
+
+    async def apost(self, url, **kwargs):
+        return await self.arequest('POST', url, **kwargs)
+
+    def log_latency_report(self):
+        """호스트별 지연 시간 분포 로그"""
+        for host, histogram in sorted(self.histograms.items()):
+            if histogram.count:
+                self.logger.info(f"HTTP 지연 {host}: {histogram.summary()}")
+        if self.cache is not None:
+            self.logger.info(f"HTTP 캐시: {self.cache.summary()}")
+        if self.limiter is not None and self.limiter.waited:
+            self.logger.info(f"HTTP {self.limiter.summary()}")
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+_default_client = None
+_default_lock = threading.Lock()
+
+def get_http_client():
+    """프로세스 공용 HTTP 클라이언트"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient(cache=HttpCache() if HTTP_CACHE_ENABLED else None,
+                                         limiter=get_rate_limiter())
+        return _default_client
@@ -1,23 +1,58 @@
-import requests
+import asyncio
 from datetime import datetime, timedelta
 import json
 import os
+import re
 from .logger import setup_logger
-from .config import DATA_DIR, TEAM_NAMES
+from .config import DATA_DIR, API_FETCH_CONCURRENCY, API_MONTH_BATCH
+from .http_client import get_http_client
+from .http_cache import is_final_date, is_final_month
+from .source_health import get_source_health
+from .team_registry import get_team_registry
+from .source_orchestrator import NoGames
 
 class KBOAPICrawler:
     def __init__(self):
         self.logger = setup_logger('KBOAPICrawler')
         self.base_url = "https://www.koreabaseball.com"
+        self.http = get_http_client()
+        self.health = get_source_health()
+        self.teams = get_team_registry()
         
     def get_game_results(self, date=None):
         """KBO 공식 사이트에서 경기 결과 가져오기"""
         if date is None:
             date = datetime.now() - timedelta(days=1)
             
+        url, headers, data = self._schedule_request(date)
+        
+        try:
+            self.logger.info(f"KBO API 호출: {url}")
+            response = self.http.post(url, headers=headers, data=data, freeze=is_final_date(date))
+            return self._parse_response(response, date, data)
+                
+        except Exception as e:
+            self.logger.error(f"API 호출 에러: {e}")
+            self.health.record_failure('kbo_api', e)
+            return []
+            
+    def get_month_results(self, year, month):
+        """한 달치 경기 결과를 한 번에 조회해 날짜별로 나눔 ({'YYYY-MM-DD': [경기]})"""
+        url, headers, data = self._schedule_request(datetime(year, month, 1), month_batch=True)
+        
+        try:
+            self.logger.info(f"KBO API 월 단위 호출: {year}-{month:02d}")
+            response = self.http.post(url, headers=headers, data=data, freeze=is_final_month(year, month))
+            return self.group_by_date(self._parse_response(response, None, data))
+            
+        except Exception as e:
+            self.logger.error(f"API 호출 에러 ({year}-{month:02d}): {e}")
+            self.health.record_failure('kbo_api', e)
+            return {}
+            
+    def _schedule_request(self, date, month_batch=False):
+        """GetScheduleList 요청 (url, headers, data) - month_batch면 날짜 대신 시즌/월로 조회"""
         date_str = date.strftime('%Y%m%d')
-        year = date.year
-        month = date.month
         
         # KBO 공식 API 엔드포인트
         url = f"{self.base_url}/ws/Schedule.asmx/GetScheduleList"
@@ -37,37 +72,70 @@ class KBOAPICrawler:
             'tmId': ''
         }
         
-        try:
-            self.logger.info(f"KBO API 호출: {url}")
-            response = requests.post(url, headers=headers, data=data)
+        if month_batch:
+            del data['date']
+            data['seasonId'] = str(date.year)
+            data['gameMonth'] = f'{date.month:02d}'
+        
+        return url, headers, data
+        
+    def _parse_response(self, response, date, data=None):
+        """API 응답을 경기 목록으로 변환 (date가 None이면 응답의 모든 날짜)"""
+        if response.status_code == 200:
+            result = response.json()
+            self.health.record_success('kbo_api')
             
-            if response.status_code == 200:
-                result = response.json()
-                
-                if 'd' in result and 'list' in result['d']:
-                    games = result['d']['list']
-                    return self.parse_games(games, date)
-                else:
-                    self.logger.warning("예상치 못한 API 응답 형식")
-                    return []
+            if 'd' in result and 'list' in result['d']:
+                rows = result['d']['list']
+                games = self.parse_games(rows, date)
             else:
-                self.logger.error(f"API 호출 실패: {response.status_code}")
-                return []
+                self.logger.warning("예상치 못한 API 응답 형식")
+                rows = None
+                games = []
                 
-        except Exception as e:
-            self.logger.error(f"API 호출 에러: {e}")
+            # 날짜별 조회에 다른 날짜 경기가 섞여 오면 요청한 날짜만 남김
+            if date is not None:
+                games = [g for g in games if g['date'] == date.strftime('%Y-%m-%d')]
+                
+                # 지난 날짜인데 응답에 그 날짜 경기 행이 하나도 없으면 경기가 없는 날로 확인
+                if not games and rows is not None and date.date() < datetime.now().date():
+                    if not any(self._game_date(row, date).date() == date.date() for row in rows):
+                        self.logger.info(f"경기가 없는 날: {date.strftime('%Y-%m-%d')}")
+                        return NoGames()
+                
+            # 종료 경기가 없는 응답은 캐시에 남기지 않아 다음 실행에서 다시 조회
+            if not games and data is not None:
+                self.http.invalidate('POST', response.url, data=data)
+            return games
+        else:
+            self.logger.error(f"API 호출 실패: {response.status_code}")
+            self.health.record_failure('kbo_api', f"HTTP {response.status_code}")
             return []
             
+    def _game_date(self, game, date):
+        """경기 행의 날짜 (날짜 필드가 없으면 요청 날짜)"""
+        for key in ('gameDate', 'G_DT', 'date'):
+            digits = re.sub(r'\D', '', str(game.get(key) or ''))[:8]
+            if len(digits) == 8:
+                return datetime.strptime(digits, '%Y%m%d')
+        return date
+        
     def parse_games(self, games, date):
-        """게임 데이터 파싱"""
+        """게임 데이터 파싱 - 각 경기는 행에 적힌 경기 날짜로 기록 (월 단위 응답 분리용)"""
         results = []
         
         for game in games:
             try:
                 # 경기가 종료된 경우만 처리
                 if game.get('status') == '종료' or game.get('gmsc') == 'F':
-                    away_team = game.get('awayNm', '').strip()
-                    home_team = game.get('homeNm', '').strip()
+                    game_date = self._game_date(game, date)
+                    if game_date is None:
+                        self.logger.warning(f"경기 날짜를 알 수 없어 건너뜀: {game}")
+                        continue
+                    away_name = game.get('awayNm', '').strip()
+                    home_name = game.get('homeNm', '').strip()
+                    away_team = self.teams.canonical(away_name, away_name)
+                    home_team = self.teams.canonical(home_name, home_name)
                     away_score = int(game.get('asc', 0))
                     home_score = int(game.get('hsc', 0))
                     
@@ -80,7 +148,7 @@ class KBOAPICrawler:
                         winner = "무승부"
                         
                     game_info = {
-                        'date': date.strftime('%Y-%m-%d'),
+                        'date': game_date.strftime('%Y-%m-%d'),
                         'away_team': away_team,
                         'home_team': home_team,
                         'away_score': away_score,
@@ -99,6 +167,13 @@ class KBOAPICrawler:
                 
         return results
         
+    def group_by_date(self, games):
+        """경기 목록을 날짜별로 묶음"""
+        by_date = {}
+        for game in games:
+            by_date.setdefault(game['date'], []).append(game)
+        return by_date
+        
     def save_results(self, games, date):
         """결과 저장"""
         if not games:
@@ -139,6 +214,7 @@ class KBOAPICrawler:
         self.logger.info(f"크롤링 시작: {date.strftime('%Y-%m-%d')}")
         
         games = self.get_game_results(date)
+        self.http.log_latency_report()
         
         if games:
             self.save_results(games, date)
@@ -146,6 +222,95 @@ class KBOAPICrawler:
         else:
             self.logger.warning("크롤링된 경기 결과가 없습니다.")
             return []
+            
+    def run_month(self, year, month):
+        """한 번의 요청으로 한 달치를 조회해 날짜별 결과 파일 저장"""
+        by_date = self.get_month_results(year, month)
+        self.http.log_latency_report()
+        
+        for date_str, games in sorted(by_date.items()):
+            self.save_results(games, datetime.strptime(date_str, '%Y-%m-%d'))
+            
+        self.logger.info(f"{year}-{month:02d}: {len(by_date)}일, {sum(len(g) for g in by_date.values())}경기")
+        return by_date
+
+class AsyncKBOAPICrawler(KBOAPICrawler):
+    """여러 날짜를 동시에 조회하는 비동기 KBO API 크롤러 (시즌 백필용)"""
+    
+    def __init__(self, concurrency=API_FETCH_CONCURRENCY, month_batch=API_MONTH_BATCH):
+        self.logger = setup_logger('AsyncKBOAPICrawler')
+        self.base_url = "https://www.koreabaseball.com"
+        self.http = get_http_client()
+        self.health = get_source_health()
+        self.teams = get_team_registry()
+        self.concurrency = concurrency
+        self.month_batch = month_batch
+        
+    async def fetch_date(self, date, semaphore):
+        """한 날짜 조회 (동시 요청 수 제한, 호스트 속도 제한은 HTTP 클라이언트가 적용) - (날짜, 경기) 반환"""
+        url, headers, data = self._schedule_request(date)
+        
+        async with semaphore:
+            try:
+                response = await self.http.apost(url, headers=headers, data=data, freeze=is_final_date(date))
+                return date, self._parse_response(response, date, data)
+            except Exception as e:
+                self.logger.error(f"API 호출 에러 ({date.strftime('%Y-%m-%d')}): {e}")
+                self.health.record_failure('kbo_api', e)
+                return date, []
+                
+    async def _fetch_one(self, date, semaphore):
+        return [await self.fetch_date(date, semaphore)]
+        
+    async def fetch_month(self, dates, semaphore):
+        """같은 달의 날짜들을 한 번에 조회 - [(날짜, 경기)] 반환"""
+        async with semaphore:
+            by_date = await asyncio.to_thread(self.get_month_results, dates[0].year, dates[0].month)
+        return [(date, by_date.get(date.strftime('%Y-%m-%d'), [])) for date in dates]
+        
+    async def fetch_range(self, start, end, save=True):
+        """날짜 범위를 동시에 조회해 응답이 오는 순서대로 (날짜, 경기) 반환하고 바로 저장"""
+        dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        if self.month_batch:
+            # 월 단위: 요청 한 번으로 그 달의 모든 날짜를 채움
+            months = {}
+            for date in dates:
+                months.setdefault((date.year, date.month), []).append(date)
+            tasks = [asyncio.create_task(self.fetch_month(month_dates, semaphore)) for month_dates in months.values()]
+        else:
+            tasks = [asyncio.create_task(self._fetch_one(date, semaphore)) for date in dates]
+        
+        self.logger.info(f"API 백필 시작: {start.strftime('%Y-%m-%d')} ~ {end.strftime('%Y-%m-%d')}, "
+                         f"{len(dates)}일, 요청 {len(tasks)}건, 동시 {self.concurrency}개")
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for date, games in await next_done:
+                    if save and games:
+                        # 파일 쓰기는 스레드에서 처리해 다른 응답 처리를 막지 않음
+                        await asyncio.to_thread(self.save_results, games, date)
+                    yield date, games
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.http.log_latency_report()
+
+def run_async_backfill(start, end, concurrency=None, on_result=None):
+    """동기 환경에서 비동기 API 백필 실행 (on_result로 완료 순서대로 결과 전달, concurrency가 없으면 API_FETCH_CONCURRENCY)"""
+    concurrency = concurrency or API_FETCH_CONCURRENCY
+    async def _run_all():
+        crawler = AsyncKBOAPICrawler(concurrency=concurrency)
+        results = {}
+        async for date, games in crawler.fetch_range(start, end):
+            results[date] = games
+            if on_result:
+                on_result(date, games)
+        return results
+        
+    return asyncio.run(_run_all())
 
 # 대안: 정적 HTML 파싱 방식
 def crawl_with_requests(date=None):
@@ -167,7 +332,7 @@ def crawl_with_requests(date=None):
     }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = get_http_client().get(url, headers=headers, freeze=is_final_month(year, month))
         response.encoding = 'utf-8'
         
         if response.status_code == 200:
@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import json
@@ -6,7 +5,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.config import HEADERS, TEAM_NAMES
+from src.config import HEADERS
+from src.http_client import get_http_client
 
 def test_kbo_official():
     """KBO 공식 홈페이지 크롤링 테스트"""
@@ -33,7 +33,7 @@ def test_kbo_official():
     print(f"날짜: {test_date.strftime('%Y-%m-%d')}")
     
     try:
-        response = requests.get(base_url, headers=HEADERS, params=params)
+        response = get_http_client().get(base_url, headers=HEADERS, params=params)
         response.encoding = 'utf-8'
         
         print(f"상태 코드: {response.status_code}")
@@ -113,7 +113,7 @@ def test_statiz():
     print(f"URL: {url}")
     
     try:
-        response = requests.get(url, headers=HEADERS, params=params)
+        response = get_http_client().get(url, headers=HEADERS, params=params)
         response.encoding = 'utf-8'
         
         print(f"상태 코드: {response.status_code}")
@@ -2,19 +2,34 @@
 KBO 공식 사이트 크롤러 - 실제 작동 버전
 """
 import asyncio
-from playwright.async_api import async_playwright
 from datetime import datetime, timedelta
 import json
-import re
-from bs4 import BeautifulSoup
+import time
 from .logger import setup_logger
 from .config import DATA_DIR
+from .browser_pool import borrow_page
+from .page_readiness import PageReadiness, goto_ready
+from .response_capture import capture_json
+from .debug_artifacts import DebugArtifacts
+from .http_cache import is_final_month, invalidate_page
+from .parser import GameParser, make_soup, TABLE_STRAINER
+from .score_patterns import parse_score, SCORE_JS
+from .team_registry import get_team_registry
+from .game_identity import GameSet
+from .parse_cache import cached_parse, get_parse_cache
+from .stage_timer import record_stage, timed
 import os
 
 class KBOOfficialCrawler:
-    def __init__(self):
+    def __init__(self, pool=None, intercept=False):
         self.logger = setup_logger('KBOOfficialCrawler')
         self.base_url = "https://www.koreabaseball.com"
+        self.pool = pool
+        self.intercept = intercept
+        self.parser = GameParser()
+        self.teams = get_team_registry()
+        self.parse_cache = get_parse_cache()
+        self.artifacts = DebugArtifacts(logger=self.logger)
         
     async def get_game_results(self, date=None):
         """KBO 공식 사이트에서 경기 결과 가져오기"""
@@ -25,32 +40,33 @@ class KBOOfficialCrawler:
         
         games = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            page = await context.new_page()
-            
+        async with borrow_page(self.pool, freeze=is_final_month(date.year, date.month)) as page:
             try:
+                # 가로채기 모드: 해당 월 일정 데이터 응답을 바로 파싱
+                if self.intercept:
+                    url = f"{self.base_url}/schedule/schedule.aspx?year={date.year}&month={date.month:02d}"
+                    payload = await capture_json(page, url, logger=self.logger)
+                    if payload is not None:
+                        with timed('extraction'):
+                            games = self.parser.parse_kbo_official(payload, date)
+                        if not games:
+                            # 동결된 응답이 빈 일정이면 다음 실행에서 다시 받음
+                            invalidate_page(page)
+                        return games
+                    self.logger.warning("데이터 응답 없음, DOM 추출로 전환")
+                
                 # KBO 일정 페이지 접속
                 url = f"{self.base_url}/schedule/schedule.aspx"
                 self.logger.info(f"접속 URL: {url}")
                 
-                await page.goto(url, wait_until='networkidle')
-                await page.wait_for_timeout(3000)
+                await goto_ready(page, url, 'kbo_schedule', self.logger)
                 
                 # 년월 선택
                 year = date.year
                 month = date.month
                 
                 # JavaScript로 년월 설정
+                readiness = PageReadiness(page, 'kbo_schedule_update', self.logger).arm()
                 await page.evaluate(f"""
                     () => {{
                         // 년도 선택
@@ -69,31 +85,24 @@ class KBOOfficialCrawler:
                     }}
                 """)
                 
-                await page.wait_for_timeout(2000)
+                await readiness.wait()
                 
                 # 조회 버튼 클릭 (있는 경우)
+                readiness = PageReadiness(page, 'kbo_schedule_update', self.logger).arm()
                 try:
-                    await page.click('button[type="submit"], input[type="submit"], button.btn-search')
-                    await page.wait_for_timeout(3000)
-                except:
-                    pass
-                
-                # 스크린샷 저장 (디버깅용)
-                screenshot_path = f"data/kbo_official_{date.strftime('%Y%m%d')}.png"
-                await page.screenshot(path=screenshot_path, full_page=True)
-                self.logger.info(f"스크린샷 저장: {screenshot_path}")
+                    await page.click('button[type="submit"], input[type="submit"], button.btn-search', timeout=2000)
+                    await readiness.wait()
+                except Exception:
+                    readiness.cancel()
                 
                 # HTML 가져오기
                 content = await page.content()
                 
-                # HTML 저장 (디버깅용)
-                html_path = f"data/kbo_official_{date.strftime('%Y%m%d')}.html"
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
                 # JavaScript로 경기 데이터 추출
+                extraction_start = time.perf_counter()
                 games_data = await page.evaluate("""
                     () => {
+                        """ + SCORE_JS + """
                         const games = [];
                         
                         // 테이블 찾기
@@ -110,16 +119,15 @@ class KBOOfficialCrawler:
                                 cells.forEach(cell => {
                                     const text = cell.innerText || cell.textContent || '';
                                     
-                                    // 점수 패턴 찾기 (예: "SSG 5 : 3 LG")
-                                    const scorePattern = /(\\w+)\\s+(\\d+)\\s*:\\s*(\\d+)\\s+(\\w+)/;
-                                    const match = text.match(scorePattern);
+                                    // 점수 패턴 찾기 (예: "SSG 5 : 3 LG", "SSG 5 - 3 LG", "SSG 5 vs 3 LG")
+                                    const match = searchScore(text);
                                     
                                     if (match) {
                                         games.push({
-                                            awayTeam: match[1],
-                                            awayScore: parseInt(match[2]),
-                                            homeScore: parseInt(match[3]),
-                                            homeTeam: match[4],
+                                            awayTeam: match[0],
+                                            awayScore: match[1],
+                                            homeScore: match[2],
+                                            homeTeam: match[3],
                                             cellText: text,
                                             date: cell.getAttribute('data-date') || ''
                                         });
@@ -129,14 +137,14 @@ class KBOOfficialCrawler:
                                     const links = cell.querySelectorAll('a');
                                     links.forEach(link => {
                                         const linkText = link.innerText || link.textContent || '';
-                                        const linkMatch = linkText.match(scorePattern);
+                                        const linkMatch = searchScore(linkText);
                                         
                                         if (linkMatch) {
                                             games.push({
-                                                awayTeam: linkMatch[1],
-                                                awayScore: parseInt(linkMatch[2]),
-                                                homeScore: parseInt(linkMatch[3]),
-                                                homeTeam: linkMatch[4],
+                                                awayTeam: linkMatch[0],
+                                                awayScore: linkMatch[1],
+                                                homeScore: linkMatch[2],
+                                                homeTeam: linkMatch[3],
                                                 linkText: linkText,
                                                 href: link.href
                                             });
@@ -164,11 +172,12 @@ class KBOOfficialCrawler:
                 
                 self.logger.info(f"JavaScript 추출 결과: {len(games_data)}개")
                 
-                # 추출된 데이터를 표준 형식으로 변환
+                # 추출된 데이터를 표준 형식으로 변환 (정규화 후 같은 경기는 한 번만)
+                found = GameSet()
                 for game_data in games_data:
                     try:
-                        away_team = self._normalize_team_name(game_data['awayTeam'])
-                        home_team = self._normalize_team_name(game_data['homeTeam'])
+                        away_team = self.teams.canonical(game_data['awayTeam'])
+                        home_team = self.teams.canonical(game_data['homeTeam'])
                         away_score = game_data['awayScore']
                         home_score = game_data['homeScore']
                         
@@ -184,31 +193,40 @@ class KBOOfficialCrawler:
                                 'winner': winner
                             }
                             
-                            games.append(game_info)
-                            self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
+                            if found.add(game_info):
+                                self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
                             
                     except Exception as e:
                         self.logger.error(f"게임 파싱 에러: {e}")
+                games = found.games
                 
                 # JavaScript 추출이 실패한 경우 BeautifulSoup 사용
                 if not games:
                     self.logger.info("JavaScript 추출 실패, BeautifulSoup 시도")
                     games = self._parse_with_beautifulsoup(content, date)
+                record_stage('extraction', time.perf_counter() - extraction_start)
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
                 import traceback
                 traceback.print_exc()
                 
-            finally:
-                await browser.close()
+            if not games:
+                # 동의 화면/에러 페이지 등이 동결돼 계속 재생되지 않도록
+                invalidate_page(page)
+                
+            # 디버그용 스냅샷은 실패했거나 샘플링된 경우에만 (저장은 백그라운드)
+            await self.artifacts.capture(page, f"kbo_official_{date.strftime('%Y%m%d')}", failed=not games)
         
+        # 스냅샷은 이미 메모리에 있으므로 페이지를 반납한 뒤 파일 저장만 기다림
+        await self.artifacts.flush()
         return games
     
+    @cached_parse('KBOOfficialCrawler._parse_with_beautifulsoup')
     def _parse_with_beautifulsoup(self, html, date):
         """BeautifulSoup으로 HTML 파싱"""
-        games = []
-        soup = BeautifulSoup(html, 'html.parser')
+        games = GameSet()
+        soup = make_soup(html, TABLE_STRAINER)
         
         # 다양한 패턴으로 경기 찾기
         # 1. 테이블에서 찾기
@@ -223,77 +241,33 @@ class KBOOfficialCrawler:
                 for cell in cells:
                     cell_text = cell.get_text(strip=True)
                     
-                    # 점수 패턴 매칭
-                    patterns = [
-                        r'(\w+)\s+(\d+)\s*:\s*(\d+)\s+(\w+)',  # SSG 5 : 3 LG
-                        r'(\w+)\s+(\d+)\s*-\s*(\d+)\s+(\w+)',  # SSG 5 - 3 LG
-                        r'(\w+)\s+(\d+)\s+vs\s+(\d+)\s+(\w+)', # SSG 5 vs 3 LG
-                    ]
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, cell_text)
-                        if match:
-                            away_team = self._normalize_team_name(match.group(1))
-                            away_score = int(match.group(2))
-                            home_score = int(match.group(3))
-                            home_team = self._normalize_team_name(match.group(4))
+                    # 점수 패턴 매칭 (":", "-", "vs" 표기를 한 번에)
+                    score = parse_score(cell_text)
+                    if score:
+                        away_team = self.teams.canonical(score[0])
+                        away_score = score[1]
+                        home_score = score[2]
+                        home_team = self.teams.canonical(score[3])
+                        
+                        if away_team and home_team:
+                            winner = away_team if away_score > home_score else home_team
                             
-                            if away_team and home_team:
-                                winner = away_team if away_score > home_score else home_team
-                                
-                                game_info = {
-                                    'date': date.strftime('%Y-%m-%d'),
-                                    'away_team': away_team,
-                                    'home_team': home_team,
-                                    'away_score': away_score,
-                                    'home_score': home_score,
-                                    'winner': winner
-                                }
-                                
-                                # 중복 체크
-                                if game_info not in games:
-                                    games.append(game_info)
-                                    self.logger.info(f"BS 경기: {away_team} {away_score} - {home_score} {home_team}")
-                            break
-        
-        return games
-    
-    def _normalize_team_name(self, name):
-        """팀 이름 정규화"""
-        team_mapping = {
-            'SSG': 'SSG',
-            '랜더스': 'SSG',
-            'LG': 'LG',
-            '트윈스': 'LG',
-            'NC': 'NC',
-            '다이노스': 'NC',
-            '키움': '키움',
-            '히어로즈': '키움',
-            '두산': '두산',
-            '베어스': '두산',
-            '한화': '한화',
-            '이글스': '한화',
-            '삼성': '삼성',
-            '라이온즈': '삼성',
-            'KIA': 'KIA',
-            '타이거즈': 'KIA',
-            'KT': 'KT',
-            '위즈': 'KT',
-            '롯데': '롯데',
-            '자이언츠': '롯데'
-        }
-        
-        # 정확한 매칭
-        if name in team_mapping:
-            return team_mapping[name]
-        
-        # 부분 매칭
-        for key, value in team_mapping.items():
-            if key in name or name in key:
-                return value
+                            game_info = {
+                                'date': date.strftime('%Y-%m-%d'),
+                                'away_team': away_team,
+                                'home_team': home_team,
+                                'away_score': away_score,
+                                'home_score': home_score,
+                                'winner': winner
+                            }
+                            
+                            # 중복 체크
+                            if games.add(game_info):
+                                self.logger.info(f"BS 경기: {away_team} {away_score} - {home_score} {home_team}")
         
-        return None
+        return games.games
     
+    @timed('save')
     def save_results(self, games, date):
         """결과 저장"""
         if not games:
@@ -0,0 +1,141 @@
+"""
+페이지 준비 대기 엔진 - 고정 sleep 대신 선택자/XHR 응답/DOM 안정 신호 중 먼저 오는 것을 기다린다
+(데이터 응답을 기다리는 규칙에서 DOM 안정은 시간 초과 때의 대체 신호)
+"""
+import asyncio
+import time
+from .logger import setup_logger
+from .config import READINESS_RULES
+from .stage_timer import record_stage, timed
+
+# DOM 변경이 quietMs 동안 없으면 참을 반환
+DOM_STABLE_JS = """
+    (quietMs) => {
+        if (!window.__readinessObserver) {
+            window.__readinessLastMutation = performance.now();
+            window.__readinessObserver = new MutationObserver(() => {
+                window.__readinessLastMutation = performance.now();
+            });
+            window.__readinessObserver.observe(document, {
+                subtree: true, childList: true, characterData: true
+            });
+        }
+        return document.readyState !== 'loading'
+            && performance.now() - window.__readinessLastMutation >= quietMs;
+    }
+"""
+
+class PageReadiness:
+    """소스별 규칙에 따라 페이지 준비 상태를 기다린다"""
+
+    def __init__(self, page, source, logger=None):
+        if source not in READINESS_RULES:
+            raise ValueError(f"알 수 없는 준비 규칙: {source}")
+
+        self.page = page
+        self.source = source
+        self.rule = READINESS_RULES[source]
+        self.logger = logger or setup_logger('PageReadiness')
+        self._response_task = None
+
+    def arm(self):
+        """응답 신호는 내비게이션/클릭 전에 미리 등록해야 놓치지 않는다"""
+        pattern = self.rule.get('response')
+        if pattern and self._response_task is None:
+            self._response_task = asyncio.ensure_future(self.page.wait_for_event(
+                'response',
+                predicate=lambda response: pattern in response.url,
+                timeout=self.rule['timeout']
+            ))
+        return self
+
+    def cancel(self):
+        """등록해 둔 응답 대기 취소"""
+        if self._response_task is not None:
+            self._response_task.cancel()
+            self._response_task = None
+
+    async def wait(self):
+        """가장 먼저 도착한 신호 이름 반환 (시간 초과 시 None)"""
+        timeout = self.rule['timeout']
+        start = time.perf_counter()
+
+        signals = {}
+        if self.rule.get('selector'):
+            signals['selector'] = asyncio.ensure_future(
+                self.page.wait_for_selector(self.rule['selector'], state='attached', timeout=timeout)
+            )
+        if self._response_task is not None:
+            signals['response'] = self._response_task
+        if self.rule.get('stable_ms'):
+            signals['dom_stable'] = asyncio.ensure_future(
+                self.page.wait_for_function(DOM_STABLE_JS, arg=self.rule['stable_ms'],
+                                            polling=100, timeout=timeout)
+            )
+
+        names = {task: name for name, task in signals.items()}
+        pending = set(names)
+        winner = None
+        deadline = start + timeout / 1000
+        # 데이터 응답을 기다리는 규칙에서는 DOM이 조용해도 XHR이 아직 진행 중일 수 있으므로
+        # DOM 안정은 선택자/응답이 끝내 오지 않았을 때만 쓰는 대체 신호
+        stable_fallback = 'response' in signals
+        stable = False
+
+        while pending and winner is None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None or winner is not None:
+                    continue
+                if names[task] == 'dom_stable' and stable_fallback:
+                    stable = True
+                else:
+                    winner = names[task]
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._response_task = None
+
+        if winner is None and stable:
+            self.logger.warning(f"데이터 응답 없이 DOM 안정으로 진행 ({self.source})")
+            winner = 'dom_stable'
+
+        # 응답이 먼저 오면 표가 그려질 때까지 짧게 더 기다림 (선택자가 없으면 응답 뒤 DOM 안정)
+        remaining_ms = (deadline - time.perf_counter()) * 1000
+        if winner == 'response' and remaining_ms > 0:
+            try:
+                if self.rule.get('selector'):
+                    await self.page.wait_for_selector(self.rule['selector'], state='attached',
+                                                      timeout=min(remaining_ms, 2000))
+                elif self.rule.get('stable_ms'):
+                    await self.page.wait_for_function(DOM_STABLE_JS, arg=self.rule['stable_ms'],
+                                                      polling=100, timeout=min(remaining_ms, 2000))
+            except Exception:
+                pass
+
+        elapsed = time.perf_counter() - start
+        record_stage('wait', elapsed)
+        elapsed_ms = elapsed * 1000
+        if winner:
+            self.logger.info(f"페이지 준비 완료 ({self.source}): {winner}, {elapsed_ms:.0f}ms")
+        else:
+            self.logger.warning(f"페이지 준비 시간 초과 ({self.source}): {elapsed_ms:.0f}ms")
+
+        return winner
+
+async def goto_ready(page, url, source, logger=None):
+    """페이지 이동 후 준비 신호까지 대기"""
+    readiness = PageReadiness(page, source, logger).arm()
+    try:
+        with timed('navigation'):
+            await page.goto(url, wait_until='domcontentloaded')
+    except Exception:
+        readiness.cancel()
+        raise
+    return await readiness.wait()
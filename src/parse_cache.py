@@ -0,0 +1,185 @@
+"""
+파싱 결과 디스크 캐시 - (파서 이름, 파서 버전, 페이지 내용 SHA-256, 날짜)로 경기 목록을 저장해
+내용이 바뀌지 않은 페이지는 다시 파싱하지 않는다. 총 용량을 넘으면 가장 오래 쓰지 않은 항목부터 지운다
+"""
+import functools
+import hashlib
+import json
+import os
+import threading
+from .logger import setup_logger
+from .config import PARSE_CACHE_ENABLED, PARSE_CACHE_DIR, PARSE_CACHE_MAX_BYTES
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 모든 HTML 파서가 공유하는 모듈 - 이 중 하나만 고쳐도 모든 파서 버전이 바뀜
+SHARED_MODULES = ['parser.py', 'score_patterns.py', 'team_registry.py', 'game_identity.py']
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def parser_version(func):
+    """파서가 정의된 모듈과 공유 파싱 모듈의 소스 해시 (선택자를 고치면 자동으로 바뀜)"""
+    paths = [func.__code__.co_filename] + [os.path.join(SRC_DIR, name) for name in SHARED_MODULES]
+    digest = hashlib.sha256()
+    for path in dict.fromkeys(paths):
+        try:
+            digest.update(_file_digest(path).encode('ascii'))
+        except OSError:
+            digest.update(path.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+class ParseCache:
+    """내용 해시 기반 파싱 결과 캐시"""
+
+    def __init__(self, directory=PARSE_CACHE_DIR, max_bytes=PARSE_CACHE_MAX_BYTES, logger=None):
+        self.logger = logger or setup_logger('ParseCache')
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes = None
+        self._lock = threading.Lock()
+
+    def key(self, name, version, content, date, extra=None):
+        """캐시 키 - 파서와 입력이 모두 같을 때만 같음"""
+        digest = hashlib.sha256(f"{name}\n{version}\n{date}\n{extra}\n".encode('utf-8'))
+        digest.update(content.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def lookup(self, key):
+        """저장된 경기 목록 (없으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                games = json.load(f)
+            # 사용 시각 갱신 (용량 정리 시 최근에 쓴 항목을 남김)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return games
+
+    def store(self, key, games):
+        """경기 목록 저장 후 용량 한도 확인"""
+        path = self._path(key)
+        try:
+            data = json.dumps(games, ensure_ascii=False).encode('utf-8')
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(path + '.tmp', path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"파싱 캐시 저장 실패: {e}")
+            return False
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan()[1]
+            else:
+                self._total_bytes += len(data)
+            over = self._total_bytes > self.max_bytes
+        if over:
+            self.evict()
+        return True
+
+    def _scan(self):
+        """(항목 목록 [(사용 시각, 크기, 경로)], 총 크기)"""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries, 0
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries, sum(size for _, size, _ in entries)
+
+    def evict(self):
+        """총 용량이 한도의 90% 이하가 될 때까지 오래 쓰지 않은 항목부터 삭제"""
+        with self._lock:
+            entries, total = self._scan()
+            entries.sort()
+            removed = 0
+            target = self.max_bytes * 0.9
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self._total_bytes = total
+        if removed:
+            self.logger.info(f"파싱 캐시 정리: {removed}개 삭제")
+        return removed
+
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            entries, _ = self._scan()
+            for _, _, path in entries:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
+        return len(entries)
+
+    def summary(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0
+        return f"적중 {self.hits}건 / 미스 {self.misses}건 ({hit_rate:.0f}%)"
+
+def cached_parse(name):
+    """(self, html, date) 파서 메서드에 파싱 캐시 적용 - 인스턴스의 parse_cache가 None이면 그대로 실행"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, html, date, *args, **kwargs):
+            cache = getattr(self, 'parse_cache', None)
+            if cache is None or not isinstance(html, str):
+                return func(self, html, date, *args, **kwargs)
+
+            date_key = date.strftime('%Y-%m-%d') if hasattr(date, 'strftime') else str(date)
+            # 백엔드가 다른 GameParser 등 인스턴스 설정도 키에 포함
+            extra = (getattr(self, 'backend', None), args, sorted(kwargs.items()))
+            key = cache.key(name, parser_version(func), html, date_key, extra)
+
+            games = cache.lookup(key)
+            if games is not None:
+                return games
+
+            games = func(self, html, date, *args, **kwargs)
+            cache.store(key, games)
+            return games
+        return wrapper
+    return decorator
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_parse_cache():
+    """프로세스 공용 파싱 캐시 (PARSE_CACHE_ENABLED가 False면 None)"""
+    global _cache
+    if not PARSE_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ParseCache()
+        return _cache
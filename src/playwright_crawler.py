@@ -1,16 +1,33 @@
 import asyncio
-from playwright.async_api import async_playwright
 from datetime import datetime, timedelta
 import json
 import re
 from bs4 import BeautifulSoup
 from .logger import setup_logger
-from .config import DATA_DIR, TEAM_NAMES
+from .config import DATA_DIR
+from .browser_pool import borrow_page, is_replay
+from .page_readiness import PageReadiness, goto_ready
+from .response_capture import capture_json
+from .parser import GameParser, make_soup, NAVER_SCHEDULE_STRAINER
+from .score_patterns import parse_score
+from .team_registry import TEAM_NAMES
+from .game_identity import GameSet
+from .parse_cache import cached_parse, get_parse_cache
+from .selector_stats import cascade, layout_of, get_selector_stats
+from .stage_timer import timed
+from .http_cache import is_final_date, is_final_month, invalidate_page
+from .source_health import get_source_health
 import os
 
 class PlaywrightCrawler:
-    def __init__(self):
+    def __init__(self, pool=None, intercept=False):
         self.logger = setup_logger('PlaywrightCrawler')
+        self.pool = pool
+        self.intercept = intercept
+        self.parser = GameParser()
+        self.health = get_source_health(offline=is_replay(pool))
+        self.parse_cache = get_parse_cache()
+        self.selector_stats = get_selector_stats()
         
     async def crawl_naver_sports(self, date=None):
         """네이버 스포츠에서 KBO 경기 결과 크롤링"""
@@ -22,49 +39,64 @@ class PlaywrightCrawler:
         
         games = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
+        async with borrow_page(self.pool, freeze=is_final_date(date)) as page:
             try:
                 # 네이버 스포츠 KBO 일정 페이지
                 url = f"https://sports.news.naver.com/kbaseball/schedule/index?date={date_str}"
                 self.logger.info(f"페이지 접속: {url}")
                 
-                await page.goto(url, wait_until='networkidle')
-                
-                # JavaScript 렌더링 대기
-                await page.wait_for_timeout(2000)
-                
-                # 경기 결과 테이블 대기
-                try:
-                    await page.wait_for_selector('div.tb_wrap', timeout=5000)
-                except:
+                # 경기 결과 테이블 대기 (준비 시간 초과는 소스 실패로 기록)
+                if not await goto_ready(page, url, 'naver_schedule', self.logger):
                     self.logger.warning("경기 결과 테이블을 찾을 수 없음")
+                    self.health.record_failure('naver', '경기 결과 테이블 대기 시간 초과')
+                else:
+                    self.health.record_success('naver')
                 
-                # HTML 가져오기
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # 경기 결과 파싱
-                games = self._parse_naver_games(soup, date)
-                
-                if not games:
-                    # 다른 선택자로 시도
-                    self.logger.info("대체 선택자로 파싱 시도")
-                    games = await self._parse_naver_games_alternative(page, date)
+                with timed('extraction'):
+                    # HTML 파싱과 JavaScript 추출 중 이 소스에서 마지막으로 경기를 찾은 방법부터 시도
+                    for method in self._naver_methods():
+                        if method == 'html':
+                            # 경기 결과 파싱 (같은 페이지 내용이면 캐시된 결과)
+                            games = self._parse_naver_html(await page.content(), date)
+                        else:
+                            self.logger.info("JavaScript 추출로 파싱 시도")
+                            games = await self._parse_naver_games_alternative(page, date)
+                        if self.selector_stats is not None:
+                            self.selector_stats.record('naver', 'page', method, bool(games))
+                        if games:
+                            break
                 
             except Exception as e:
                 self.logger.error(f"네이버 스포츠 크롤링 에러: {e}")
+                self.health.record_failure('naver', e)
                 
-            finally:
-                await browser.close()
+            if not games:
+                # 동의 화면/에러 페이지 등이 동결돼 계속 재생되지 않도록
+                invalidate_page(page)
                 
         return games
     
+    def _naver_methods(self):
+        """네이버 일정 페이지 추출 방법 시도 순서"""
+        methods = ['html', 'javascript']
+        if self.selector_stats is None:
+            return methods
+        return self.selector_stats.order('naver', 'page', methods)
+    
+    @cached_parse('PlaywrightCrawler._parse_naver_html')
+    def _parse_naver_html(self, html, date):
+        """네이버 스포츠 HTML에서 일정 표 부분 트리만 만들어 파싱"""
+        return self._parse_naver_games(make_soup(html, NAVER_SCHEDULE_STRAINER), date)
+    
     def _parse_naver_games(self, soup, date):
-        """네이버 스포츠 HTML 파싱"""
-        games = []
+        """네이버 스포츠 HTML 파싱 (이 페이지 구성에서 마지막으로 경기를 찾은 구조부터)"""
+        methods = {'table': self._parse_naver_tables, 'game_box': self._parse_naver_boxes}
+        return cascade(self.selector_stats, 'naver_schedule', layout_of(soup), list(methods),
+                       lambda name: methods[name](soup, date))
+    
+    def _parse_naver_tables(self, soup, date):
+        """일정 표(table.tb_sc) 구조 파싱"""
+        games = GameSet()
         
         # 방법 1: 테이블 구조 파싱
         tables = soup.find_all('table', class_='tb_sc')
@@ -77,8 +109,8 @@ class PlaywrightCrawler:
                     # 팀 이름 찾기
                     team_spans = row.find_all('span', class_='team_name')
                     if len(team_spans) >= 2:
-                        away_team = team_spans[0].get_text(strip=True)
-                        home_team = team_spans[1].get_text(strip=True)
+                        away_team = self.parser.parse_team_name(team_spans[0].get_text(strip=True))
+                        home_team = self.parser.parse_team_name(team_spans[1].get_text(strip=True))
                         
                         # 점수 찾기
                         score_ems = row.find_all('em', class_='score')
@@ -100,52 +132,57 @@ class PlaywrightCrawler:
                                     'winner': winner
                                 }
                                 
-                                games.append(game_info)
-                                self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
+                                if games.add(game_info):
+                                    self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
                                 
                 except Exception as e:
                     continue
         
+        return games.games
+    
+    def _parse_naver_boxes(self, soup, date):
+        """경기 박스(div.game_box) 구조 파싱"""
+        games = GameSet()
+        
         # 방법 2: 경기 박스 구조 파싱
-        if not games:
-            game_boxes = soup.find_all('div', class_='game_box')
-            
-            for box in game_boxes:
-                try:
-                    # 팀 정보
-                    teams = box.find_all('span', class_='team')
-                    if len(teams) >= 2:
-                        away_team = teams[0].get_text(strip=True)
-                        home_team = teams[1].get_text(strip=True)
+        game_boxes = soup.find_all('div', class_='game_box')
+        
+        for box in game_boxes:
+            try:
+                # 팀 정보
+                teams = box.find_all('span', class_='team')
+                if len(teams) >= 2:
+                    away_team = self.parser.parse_team_name(teams[0].get_text(strip=True))
+                    home_team = self.parser.parse_team_name(teams[1].get_text(strip=True))
+                    
+                    # 점수 정보
+                    scores = box.find_all('span', class_='num')
+                    if len(scores) >= 2:
+                        away_score = int(scores[0].get_text(strip=True))
+                        home_score = int(scores[1].get_text(strip=True))
                         
-                        # 점수 정보
-                        scores = box.find_all('span', class_='num')
-                        if len(scores) >= 2:
-                            away_score = int(scores[0].get_text(strip=True))
-                            home_score = int(scores[1].get_text(strip=True))
-                            
-                            winner = away_team if away_score > home_score else home_team
-                            
-                            game_info = {
-                                'date': date.strftime('%Y-%m-%d'),
-                                'away_team': away_team,
-                                'home_team': home_team,
-                                'away_score': away_score,
-                                'home_score': home_score,
-                                'winner': winner
-                            }
-                            
-                            games.append(game_info)
+                        winner = away_team if away_score > home_score else home_team
+                        
+                        game_info = {
+                            'date': date.strftime('%Y-%m-%d'),
+                            'away_team': away_team,
+                            'home_team': home_team,
+                            'away_score': away_score,
+                            'home_score': home_score,
+                            'winner': winner
+                        }
+                        
+                        if games.add(game_info):
                             self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
-                            
-                except Exception as e:
-                    continue
+                        
+            except Exception as e:
+                continue
         
-        return games
+        return games.games
     
     async def _parse_naver_games_alternative(self, page, date):
         """JavaScript 실행으로 데이터 추출"""
-        games = []
+        games = GameSet()
         
         try:
             # JavaScript로 데이터 직접 추출
@@ -196,12 +233,12 @@ class PlaywrightCrawler:
                         'home_score': data['homeScore'],
                         'winner': data['awayTeam'] if data['awayScore'] > data['homeScore'] else data['homeTeam']
                     }
-                    games.append(game_info)
+                    games.add(game_info)
                     
         except Exception as e:
             self.logger.error(f"JavaScript 파싱 에러: {e}")
             
-        return games
+        return games.games
     
     async def crawl_kbo_official(self, date=None):
         """KBO 공식 사이트 크롤링"""
@@ -212,40 +249,57 @@ class PlaywrightCrawler:
         
         games = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
+        async with borrow_page(self.pool, freeze=is_final_month(date.year, date.month)) as page:
             try:
                 # KBO 일정 페이지
                 url = f"https://www.koreabaseball.com/Schedule/Schedule.aspx?seriesId=0&year={date.year}&month={date.month:02d}"
                 
-                await page.goto(url, wait_until='networkidle')
-                await page.wait_for_timeout(3000)
+                # 가로채기 모드: 일정 데이터 응답을 받는 즉시 파싱
+                if self.intercept:
+                    payload = await capture_json(page, url, logger=self.logger)
+                    if payload is not None:
+                        self.health.record_success('kbo_official')
+                        with timed('extraction'):
+                            games = self.parser.parse_kbo_official(payload, date)
+                        if not games:
+                            # 동결된 응답이 빈 일정이면 다음 실행에서 다시 받음
+                            invalidate_page(page)
+                        return games
+                    self.logger.warning("데이터 응답 없음, DOM 추출로 전환")
+                
+                if await goto_ready(page, url, 'kbo_schedule', self.logger):
+                    self.health.record_success('kbo_official')
+                else:
+                    self.health.record_failure('kbo_official', '일정 표 대기 시간 초과')
                 
                 # 해당 날짜 클릭 (달력에서)
                 day_selector = f'td[onclick*="{date.day}"]'
+                readiness = PageReadiness(page, 'kbo_schedule_update', self.logger).arm()
                 try:
                     await page.click(day_selector)
-                    await page.wait_for_timeout(2000)
-                except:
+                    await readiness.wait()
+                except Exception:
+                    readiness.cancel()
                     self.logger.warning(f"날짜 선택 실패: {date.day}")
                 
                 # HTML 파싱
-                content = await page.content()
-                games = self._parse_kbo_games(content, date)
+                with timed('extraction'):
+                    content = await page.content()
+                    games = self._parse_kbo_games(content, date)
                 
             except Exception as e:
                 self.logger.error(f"KBO 공식 사이트 크롤링 에러: {e}")
+                self.health.record_failure('kbo_official', e)
                 
-            finally:
-                await browser.close()
+            if not games:
+                invalidate_page(page)
                 
         return games
     
+    @cached_parse('PlaywrightCrawler._parse_kbo_games')
     def _parse_kbo_games(self, html, date):
         """KBO 공식 사이트 HTML 파싱"""
-        games = []
+        games = GameSet()
         soup = BeautifulSoup(html, 'html.parser')
         
         # 경기 결과 링크 찾기
@@ -253,15 +307,15 @@ class PlaywrightCrawler:
         
         for link in game_links:
             try:
-                link_text = link.get_text(strip=True)
+                # 태그 사이에 공백을 넣어 "SSG5:3LG"처럼 붙지 않게 함
+                link_text = link.get_text(' ', strip=True)
                 
                 # 점수 패턴 매칭
-                match = re.search(r'(\w+)\s*(\d+):(\d+)\s*(\w+)', link_text)
-                if match:
-                    away_team = match.group(1)
-                    away_score = int(match.group(2))
-                    home_score = int(match.group(3))
-                    home_team = match.group(4)
+                score = parse_score(link_text)
+                if score:
+                    away_team, away_score, home_score, home_team = score
+                    away_team = self.parser.parse_team_name(away_team)
+                    home_team = self.parser.parse_team_name(home_team)
                     
                     winner = away_team if away_score > home_score else home_team
                     
@@ -274,24 +328,26 @@ class PlaywrightCrawler:
                         'winner': winner
                     }
                     
-                    games.append(game_info)
-                    self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
+                    if games.add(game_info):
+                        self.logger.info(f"경기 발견: {away_team} {away_score} - {home_score} {home_team}")
                     
             except Exception as e:
                 continue
                 
-        return games
+        return games.games
     
     async def run(self, date=None):
         """크롤러 실행"""
         if date is None:
             date = datetime.now() - timedelta(days=1)
             
-        # 네이버 스포츠 시도
-        games = await self.crawl_naver_sports(date)
+        # 네이버 스포츠 시도 (차단된 소스는 건너뜀)
+        games = []
+        if self.health.allow('naver'):
+            games = await self.crawl_naver_sports(date)
         
         # 실패 시 KBO 공식 사이트 시도
-        if not games:
+        if not games and self.health.allow('kbo_official'):
             self.logger.info("네이버 스포츠 실패, KBO 공식 사이트 시도")
             games = await self.crawl_kbo_official(date)
         
@@ -305,6 +361,7 @@ class PlaywrightCrawler:
             self.save_results(dummy_games, date)
             return dummy_games
     
+    @timed('save')
     def save_results(self, games, date):
         """결과 저장"""
         if not games:
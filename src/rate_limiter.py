@@ -0,0 +1,124 @@
+"""
+호스트별 토큰 버킷 속도 제한 - SQLite 파일에 버킷 상태를 두어 여러 워커 프로세스가 같은 한도를 공유
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+from .logger import setup_logger
+from .config import (
+    RATE_LIMIT_ENABLED, RATE_LIMIT_DB, RATE_LIMITS, RATE_LIMIT_DEFAULT, RATE_LIMIT_BROWSER_TYPES
+)
+
+class RateLimiter:
+    """호스트별 (초당 요청 수, 버스트) 토큰 버킷"""
+
+    def __init__(self, db_path=RATE_LIMIT_DB, limits=RATE_LIMITS, default=RATE_LIMIT_DEFAULT,
+                 browser_types=RATE_LIMIT_BROWSER_TYPES, logger=None):
+        self.logger = logger or setup_logger('RateLimiter')
+        self.db_path = db_path
+        self.limits = dict(limits)
+        self.default = default
+        self.browser_types = set(browser_types)
+        self.waited = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """스레드별 연결 (처음 사용할 때 파일과 테이블 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE로 프로세스 간 쓰기 잠금)
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute('CREATE TABLE IF NOT EXISTS buckets '
+                         '(host TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)')
+            self._local.conn = conn
+        return conn
+
+    def limit_for(self, host):
+        """호스트에 적용할 (초당 요청 수, 버스트) - 하위 도메인은 상위 도메인 설정을 따름"""
+        host = host.split(':')[0].lower()
+        for domain, limit in self.limits.items():
+            if host == domain or host.endswith('.' + domain):
+                return limit
+        return self.default
+
+    def reserve(self, url):
+        """토큰 한 개를 예약하고 기다려야 할 초 반환
+
+        토큰이 없으면 잔량을 음수로 만들어 순번을 잡아 두므로, 대기는 잠금 밖에서 한다.
+        """
+        host = urlparse(url).netloc or url
+        rate, burst = self.limit_for(host)
+        if not rate:
+            return 0.0
+
+        try:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                row = conn.execute('SELECT tokens, updated_at FROM buckets WHERE host = ?', (host,)).fetchone()
+                tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+                tokens -= 1
+                conn.execute('INSERT OR REPLACE INTO buckets (host, tokens, updated_at) VALUES (?, ?, ?)',
+                             (host, tokens, now))
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            # 제한 저장소 문제로 크롤링을 멈추지는 않음
+            self.logger.warning(f"속도 제한 상태 갱신 실패, 제한 없이 진행: {host} ({e})")
+            return 0.0
+
+        wait = max(0.0, -tokens / rate)
+        if wait:
+            with self._lock:
+                self.waited += wait
+        return wait
+
+    def acquire(self, url):
+        """동기 경로 (requests) - 순번이 올 때까지 대기"""
+        wait = self.reserve(url)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url):
+        """비동기 경로 (Playwright 등) - SQLite 갱신은 스레드에서, 대기는 이벤트 루프에서"""
+        wait = await asyncio.to_thread(self.reserve, url)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    async def attach(self, page):
+        """페이지 문서/XHR 요청에 속도 제한 라우팅 등록"""
+        async def handle(route):
+            request = route.request
+            if request.resource_type in self.browser_types:
+                await self.acquire_async(request.url)
+            await route.fallback()
+
+        await page.route('**/*', handle)
+
+    def summary(self):
+        return f"속도 제한 대기 누적 {self.waited:.1f}초"
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+def get_rate_limiter():
+    """프로세스 공용 속도 제한기 (비활성화면 None)"""
+    global _default_limiter
+    if not RATE_LIMIT_ENABLED:
+        return None
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
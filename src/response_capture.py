@@ -0,0 +1,70 @@
+"""
+응답 가로채기 - 일정 데이터 XHR의 JSON을 DOM 추출 없이 바로 받아온다
+"""
+import asyncio
+import json
+from .logger import setup_logger
+from .config import KBO_SCHEDULE_XHR, RESPONSE_CAPTURE_TIMEOUT
+from .stage_timer import timed
+
+class ResponseCapture:
+    """URL 패턴에 맞는 응답 JSON을 수집"""
+
+    def __init__(self, page, url_pattern=KBO_SCHEDULE_XHR, logger=None):
+        self.page = page
+        self.url_pattern = url_pattern
+        self.logger = logger or setup_logger('ResponseCapture')
+        self.payloads = []
+        self._arrived = asyncio.Event()
+
+    def start(self):
+        """응답 리스너 등록 (내비게이션 전에 호출)"""
+        self.page.on('response', self._on_response)
+        return self
+
+    def stop(self):
+        """응답 리스너 해제"""
+        try:
+            self.page.remove_listener('response', self._on_response)
+        except Exception:
+            pass
+
+    async def _on_response(self, response):
+        if self.url_pattern not in response.url or not response.ok:
+            return
+
+        try:
+            payload = await response.json()
+        except Exception as e:
+            self.logger.warning(f"응답 JSON 파싱 실패: {response.url} ({e})")
+            return
+
+        # ASMX 응답은 {"d": "<json 문자열>"} 형태일 수 있음
+        if isinstance(payload, dict) and isinstance(payload.get('d'), str):
+            try:
+                payload = json.loads(payload['d'])
+            except ValueError:
+                pass
+
+        self.payloads.append(payload)
+        self._arrived.set()
+
+    async def wait(self, timeout=RESPONSE_CAPTURE_TIMEOUT):
+        """첫 번째 응답 JSON 반환 (시간 초과 시 None)"""
+        try:
+            await asyncio.wait_for(self._arrived.wait(), timeout / 1000)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"데이터 응답 시간 초과: {self.url_pattern}")
+            return None
+        return self.payloads[0]
+
+async def capture_json(page, url, url_pattern=KBO_SCHEDULE_XHR, timeout=RESPONSE_CAPTURE_TIMEOUT, logger=None):
+    """페이지를 열고 데이터 응답이 오는 즉시 JSON 반환 (레이아웃 완료를 기다리지 않음)"""
+    capture = ResponseCapture(page, url_pattern, logger).start()
+    try:
+        with timed('navigation'):
+            await page.goto(url, wait_until='commit')
+        with timed('wait'):
+            return await capture.wait(timeout)
+    finally:
+        capture.stop()
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from .unified_crawler import UnifiedCrawler
 from .logger import setup_logger
 from .config import SCHEDULE_TIME
+from .http_client import get_http_client
 import sys
 
 class CrawlerScheduler:
@@ -36,6 +37,7 @@ class CrawlerScheduler:
         except Exception as e:
             self.logger.error(f"크롤링 중 에러 발생: {e}")
             
+        get_http_client().log_latency_report()
         self.logger.info("일일 크롤링 완료")
         
     def setup_schedule(self):
@@ -0,0 +1,105 @@
+"""
+점수 패턴 엔진 - "팀 5 : 3 팀", "팀 5 - 3 팀", "팀 5 vs 3 팀" 세 가지 표기를 미리 컴파일한 정규식 하나로 찾는다.
+"KIA5vs3LG"처럼 팀/점수/구분자 사이 공백이 없어도 찾는다. 파이썬 파서와 페이지 안의 JavaScript가 같은 패턴 소스를 공유한다
+"""
+import json
+import re
+
+# 파이썬 re와 JavaScript RegExp가 똑같이 해석하는 문법만 사용 (\w, \d 대신 명시적인 문자 클래스)
+# 팀 이름에 숫자를 넣지 않아야 공백 없는 표기에서 팀과 점수가 나뉨 ("18:30 KT 3 : 3 삼성"의 시각도 팀이 아님)
+TEAM = r'([A-Za-z가-힣]+)'
+SCORE = r'([0-9]+)'
+
+# (구분자, 패턴) - 우선순위 순. 한 셀에 여러 표기가 섞여 있으면 앞의 표기를 먼저 본다
+SEPARATORS = [
+    (':', r'\s*:\s*'),   # SSG 5 : 3 LG
+    ('-', r'\s*-\s*'),   # SSG 5 - 3 LG
+    ('vs', r'\s*vs\s*'), # SSG 5 vs 3 LG, KIA 5vs3 LG
+]
+
+def _source(separator):
+    return TEAM + r'\s*' + SCORE + separator + SCORE + r'\s*' + TEAM
+
+SCORE_SOURCE = _source('(?:' + '|'.join(pattern for _, pattern in SEPARATORS) + ')')
+SCORE_PATTERN = re.compile(SCORE_SOURCE)
+
+# 구분자별 패턴 - 여러 표기가 섞인 셀에서만 사용
+SEPARATOR_PATTERNS = [(token, re.compile(_source(pattern))) for token, pattern in SEPARATORS]
+
+def separator_of(match):
+    """매치에 쓰인 구분자 (':', '-', 'vs')"""
+    return match.string[match.end(2):match.start(3)].strip()
+
+def search_score(text):
+    """첫 번째 점수 표기 매치 (그룹: 원정팀, 원정 점수, 홈 점수, 홈팀), 없으면 None"""
+    match = SCORE_PATTERN.search(text)
+    if match is None:
+        return None
+
+    # 대부분의 셀은 표기가 하나라 여기서 끝남. 우선순위가 더 높은 구분자가 텍스트에 있을 때만 구분자별로 다시 찾음
+    found = separator_of(match)
+    for token, pattern in SEPARATOR_PATTERNS:
+        if token == found:
+            return match
+        if token in text:
+            higher = pattern.search(text)
+            if higher:
+                return higher
+    return match
+
+def parse_score(text):
+    """(원정팀, 원정 점수, 홈 점수, 홈팀) 또는 None"""
+    match = search_score(text)
+    if match is None:
+        return None
+    return match.group(1), int(match.group(2)), int(match.group(3)), match.group(4)
+
+def find_scores(text):
+    """텍스트 안의 모든 점수 표기 - (원정팀, 원정 점수, 홈 점수, 홈팀) 목록
+
+    구분자별로 겹치지 않는 매치를 구분자 우선순위 순서로 모은 것과 같다.
+    구분자가 한 종류뿐인 텍스트(대부분)는 결합 패턴 한 번으로 끝난다.
+    """
+    if sum(token in text for token, _ in SEPARATORS) > 1:
+        matches = [match for _, pattern in SEPARATOR_PATTERNS for match in pattern.finditer(text)]
+    else:
+        matches = SCORE_PATTERN.finditer(text)
+    return [(match.group(1), int(match.group(2)), int(match.group(3)), match.group(4)) for match in matches]
+
+# 페이지 안에서 쓰는 같은 엔진 (page.evaluate 스크립트 앞부분에 붙여 넣음)
+# searchScore(text)는 search_score, findScores(text)는 find_scores와 같은 결과를 [원정팀, 원정 점수, 홈 점수, 홈팀]으로 반환
+SCORE_JS = """
+const scorePattern = new RegExp(%(source)s);
+const scoreGlobalPattern = new RegExp(%(source)s, 'g');
+const scoreSeparators = %(separators)s.map(([token, source]) => [token, new RegExp(source)]);
+const scoreTuple = (m) => [m[1], parseInt(m[2], 10), parseInt(m[3], 10), m[4]];
+const searchScore = (text) => {
+    const match = text.match(scorePattern);
+    if (!match) {
+        return null;
+    }
+    const found = match[0].slice(match[1].length).trimStart().slice(match[2].length).trimStart();
+    for (const [token, pattern] of scoreSeparators) {
+        if (found.startsWith(token)) {
+            return scoreTuple(match);
+        }
+        if (text.includes(token)) {
+            const higher = text.match(pattern);
+            if (higher) {
+                return scoreTuple(higher);
+            }
+        }
+    }
+    return scoreTuple(match);
+};
+const scoreGlobalSeparators = scoreSeparators.map(([token, pattern]) => [token, new RegExp(pattern.source, 'g')]);
+const findScores = (text) => {
+    if (scoreSeparators.filter(([token]) => text.includes(token)).length > 1) {
+        return scoreGlobalSeparators.flatMap(([token, pattern]) => Array.from(text.matchAll(pattern), scoreTuple));
+    }
+    return Array.from(text.matchAll(scoreGlobalPattern), scoreTuple);
+};
+""" % {
+    'source': json.dumps(SCORE_SOURCE),
+    'separators': json.dumps([[token, _source(pattern)] for token, pattern in SEPARATORS]),
+}
@@ -0,0 +1,138 @@
+"""
+선택자/추출 방법 학습 - 소스와 페이지 구성별로 마지막에 경기를 찾아낸 방법을 기억해 다음 페이지에서 먼저 시도한다.
+기록은 JSON 파일에 저장해 실행 간에 유지하므로 보통은 선택자 한 번으로 끝난다
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from .logger import setup_logger
+from .config import SELECTOR_STATS_ENABLED, SELECTOR_STATS_FILE
+
+def layout_of(soup):
+    """페이지 구성 식별자 - 부분 트리의 첫 요소 (예: 'div.sch_tb')"""
+    first = soup.find(True)
+    if first is None:
+        return ''
+    return first.name + ''.join('.' + name for name in first.get('class', []))
+
+class SelectorStats:
+    """(소스, 페이지 구성)별 방법 기록 - 최근에 성공한 방법을 먼저, 나머지는 기본 순서대로"""
+
+    def __init__(self, path=SELECTOR_STATS_FILE, logger=None):
+        self.logger = logger or setup_logger('SelectorStats')
+        self.path = path
+        self._stats = None
+        # 이번 실행에서 바뀐 키 (저장 시 다른 프로세스가 쓴 키는 그대로 둠)
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _entries(self, key):
+        if self._stats is None:
+            self._stats = self._load()
+        return self._stats.get(key, {})
+
+    @staticmethod
+    def _key(source, layout):
+        return f"{source}|{layout}"
+
+    @staticmethod
+    def _best(entries):
+        succeeded = [(stat.get('last_success', 0), name) for name, stat in entries.items() if stat.get('last_success')]
+        return max(succeeded)[1] if succeeded else None
+
+    def order(self, source, layout, strategies):
+        """시도 순서 - 마지막 성공 시각이 최근인 방법부터, 성공한 적 없는 방법은 기본 순서"""
+        with self._lock:
+            entries = self._entries(self._key(source, layout))
+        return sorted(strategies, key=lambda name: -entries.get(name, {}).get('last_success', 0))
+
+    def record(self, source, layout, strategy, success):
+        """시도 결과 기록 - 가장 먼저 시도할 방법이 바뀌면 바로 저장"""
+        key = self._key(source, layout)
+        with self._lock:
+            entries = self._entries(key)
+            best = self._best(entries)
+            stat = entries.setdefault(strategy, {'hits': 0, 'misses': 0})
+            if success:
+                stat['hits'] += 1
+                stat['last_success'] = time.time()
+            else:
+                stat['misses'] += 1
+            self._stats[key] = entries
+            self._dirty.add(key)
+            changed = self._best(entries) != best
+
+        if changed:
+            self.logger.info(f"선택자 순서 갱신: {source} ({layout or '-'}) -> {strategy}")
+            self.save()
+
+    def save(self):
+        """바뀐 키만 파일의 최신 내용에 합쳐 저장"""
+        with self._lock:
+            if not self._dirty:
+                return
+            stats = self._load()
+            for key in self._dirty:
+                stats[key] = self._stats[key]
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                    json.dump(stats, f, ensure_ascii=False, indent=2)
+                os.replace(self.path + '.tmp', self.path)
+            except OSError as e:
+                self.logger.warning(f"선택자 기록 저장 실패: {e}")
+                return
+            self._stats = stats
+            self._dirty.clear()
+
+    def report(self):
+        """(소스, 페이지 구성)별 방법 요약 줄 목록"""
+        with self._lock:
+            if self._stats is None:
+                self._stats = self._load()
+            stats = dict(self._stats)
+        lines = []
+        for key, entries in sorted(stats.items()):
+            parts = [f"{name} {stat['hits']}/{stat['hits'] + stat['misses']}" for name, stat in
+                     sorted(entries.items(), key=lambda item: -item[1].get('last_success', 0))]
+            lines.append(f"{key}: {', '.join(parts)}")
+        return lines
+
+def cascade(stats, source, layout, strategies, attempt):
+    """학습한 순서로 방법을 시도해 처음 경기를 찾은 결과 반환 (stats가 None이면 기본 순서, 기록 안 함)
+
+    strategies: 기본 순서의 방법 이름 목록, attempt(name): 경기 목록
+    """
+    order = stats.order(source, layout, strategies) if stats is not None else strategies
+    for name in order:
+        games = attempt(name)
+        if stats is not None:
+            stats.record(source, layout, name, bool(games))
+        if games:
+            return games
+    return []
+
+_default_stats = None
+_default_lock = threading.Lock()
+
+def get_selector_stats():
+    """프로세스 공용 선택자 기록 (SELECTOR_STATS_ENABLED가 False면 None, 종료 시 남은 기록 저장)"""
+    global _default_stats
+    if not SELECTOR_STATS_ENABLED:
+        return None
+    with _default_lock:
+        if _default_stats is None:
+            _default_stats = SelectorStats()
+            atexit.register(_default_stats.save)
+        return _default_stats
@@ -1,12 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import json
 import os
 import re
 from .logger import setup_logger
 from .storage import Storage
-from .config import DATA_DIR, TEAM_NAMES
+from .config import DATA_DIR
+from .http_client import get_http_client
+from .http_cache import is_final_date
+from .source_health import get_source_health
+from .parser import make_soup, KBO_HTML_STRAINER
+from .team_registry import get_team_registry
+from .game_identity import GameSet
+from .parse_cache import cached_parse, get_parse_cache
 
 class SimpleCrawler:
     """간단한 KBO 크롤러 - 대체 데이터 소스 사용"""
@@ -14,6 +19,10 @@ class SimpleCrawler:
     def __init__(self):
         self.logger = setup_logger('SimpleCrawler')
         self.storage = Storage()
+        self.http = get_http_client()
+        self.health = get_source_health()
+        self.teams = get_team_registry()
+        self.parse_cache = get_parse_cache()
         
     def crawl_games(self, date=None):
         """경기 결과 크롤링"""
@@ -23,10 +32,11 @@ class SimpleCrawler:
         # 여러 소스 시도
         results = []
         
-        # 1. KBO 공식 사이트 시도
-        results = self.crawl_kbo_official(date)
+        # 1. KBO 공식 사이트 시도 (차단된 소스는 타임아웃을 기다리지 않고 건너뜀)
+        if self.health.allow('kbo_html'):
+            results = self.crawl_kbo_official(date)
         
-        if not results:
+        if not results and self.health.allow('naver_mobile'):
             # 2. 네이버 스포츠 모바일 시도
             results = self.crawl_naver_mobile(date)
             
@@ -54,22 +64,26 @@ class SimpleCrawler:
                 'date': date.strftime('%Y%m%d')
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, freeze=is_final_date(date))
             
             if response.status_code == 200:
+                self.health.record_success('kbo_html')
                 return self.parse_kbo_html(response.text, date)
             else:
                 self.logger.error(f"KBO 사이트 접속 실패: {response.status_code}")
+                self.health.record_failure('kbo_html', f"HTTP {response.status_code}")
                 return []
                 
         except Exception as e:
             self.logger.error(f"KBO 크롤링 에러: {e}")
+            self.health.record_failure('kbo_html', e)
             return []
             
+    @cached_parse('SimpleCrawler.parse_kbo_html')
     def parse_kbo_html(self, html, date):
         """KBO HTML 파싱"""
-        games = []
-        soup = BeautifulSoup(html, 'html.parser')
+        games = GameSet(self.teams)
+        soup = make_soup(html, KBO_HTML_STRAINER)
         
         # 경기 결과 테이블 찾기 (여러 선택자 시도)
         selectors = [
@@ -87,21 +101,22 @@ class SimpleCrawler:
                 for element in elements:
                     game = self.extract_game_from_element(element, date)
                     if game:
-                        games.append(game)
+                        games.add(game)
                         
                 if games:
                     break
                     
-        return games
+        return games.games
         
     def extract_game_from_element(self, element, date):
         """HTML 요소에서 게임 정보 추출"""
         try:
             # 팀명 찾기
-            team_elements = element.find_all(text=re.compile('(KIA|LG|NC|KT|SSG|한화|롯데|삼성|두산|키움)'))
-            if len(team_elements) >= 2:
-                away_team = self.normalize_team_name(team_elements[0].strip())
-                home_team = self.normalize_team_name(team_elements[1].strip())
+            # 구단명과 애칭이 다른 문자열로 나뉘어도 한 팀으로 보도록 요소 텍스트 전체에서 찾음
+            team_ids = self.teams.find_all(' '.join(element.stripped_strings))
+            if len(team_ids) >= 2:
+                away_team = self.teams.name(team_ids[0])
+                home_team = self.teams.name(team_ids[1])
             else:
                 return None
                 
@@ -139,30 +154,6 @@ class SimpleCrawler:
             self.logger.debug(f"요소 파싱 실패: {e}")
             return None
             
-    def normalize_team_name(self, name):
-        """팀 이름 정규화"""
-        name = name.strip()
-        
-        # 팀명 매핑
-        mappings = {
-            'KIA타이거즈': 'KIA', 'KIA': 'KIA',
-            'LG트윈스': 'LG', 'LG': 'LG',
-            'NC다이노스': 'NC', 'NC': 'NC',
-            'KT위즈': 'KT', 'KT': 'KT',
-            'SSG랜더스': 'SSG', 'SSG': 'SSG',
-            '한화이글스': '한화', '한화': '한화',
-            '롯데자이언츠': '롯데', '롯데': '롯데',
-            '삼성라이온즈': '삼성', '삼성': '삼성',
-            '두산베어스': '두산', '두산': '두산',
-            '키움히어로즈': '키움', '키움': '키움'
-        }
-        
-        for full_name, short_name in mappings.items():
-            if full_name in name or name in full_name:
-                return short_name
-                
-        return name
-        
     def crawl_naver_mobile(self, date):
         """네이버 모바일 스포츠 크롤링"""
         try:
@@ -174,17 +165,20 @@ class SimpleCrawler:
                 'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers)
             
             if response.status_code == 200:
-                # 모바일 페이지도 동적 렌더링일 가능성이 높음
+                # 모바일 페이지도 동적 렌더링일 가능성이 높음 (정적 HTML로는 결과를 얻을 수 없으므로 실패로 기록)
                 self.logger.warning("네이버 모바일도 동적 페이지")
+                self.health.record_failure('naver_mobile', '동적 페이지')
                 return []
             else:
+                self.health.record_failure('naver_mobile', f"HTTP {response.status_code}")
                 return []
                 
         except Exception as e:
             self.logger.error(f"네이버 모바일 크롤링 에러: {e}")
+            self.health.record_failure('naver_mobile', e)
             return []
             
     def get_dummy_data(self, date):
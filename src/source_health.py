@@ -0,0 +1,205 @@
+"""
+데이터 소스 상태 관리 (서킷 브레이커) - 연속 실패한 소스는 일정 시간 건너뛰고, 시간이 지나면 한 번만 시험 호출
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+try:
+    import fcntl
+except ImportError:
+    # Windows에는 fcntl이 없음 - 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+from .logger import setup_logger
+from .config import SOURCE_HEALTH_FILE, SOURCE_FAILURE_THRESHOLD, SOURCE_COOLDOWN
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class SourceHealth:
+    """소스별 서킷 브레이커 (상태는 JSON 파일에 저장해 실행/프로세스 간 공유)
+
+    closed: 정상 호출. 연속 실패가 threshold에 닿으면 open.
+    open: 호출하지 않고 바로 건너뜀. cooldown이 지나면 half_open으로 바꾸고 한 번 시험 호출.
+    half_open: 시험 호출 중. 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(self, path=SOURCE_HEALTH_FILE, threshold=SOURCE_FAILURE_THRESHOLD, cooldown=SOURCE_COOLDOWN,
+                 logger=None):
+        self.logger = logger or setup_logger('SourceHealth')
+        self.path = path
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, states):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(states, f, ensure_ascii=False, indent=2)
+            os.replace(self.path + '.tmp', self.path)
+        except OSError as e:
+            self.logger.warning(f"소스 상태 저장 실패: {e}")
+
+    @contextmanager
+    def _locked(self):
+        """스레드 잠금과 옆 파일(.lock)의 프로세스 간 잠금 - 읽고 바꿔 저장하는 사이에 다른 프로세스가 끼어들지 않도록"""
+        with self._lock:
+            lock_file = None
+            if fcntl is not None:
+                try:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    lock_file = open(self.path + '.lock', 'a')
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                except OSError as e:
+                    self.logger.warning(f"소스 상태 잠금 실패: {e}")
+                    if lock_file is not None:
+                        lock_file.close()
+                        lock_file = None
+            try:
+                yield
+            finally:
+                if lock_file is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                    lock_file.close()
+
+    def _update(self, name, change):
+        """파일에서 최신 상태를 읽어 한 소스만 바꾸고 저장 (다른 프로세스의 갱신을 덮어쓰지 않도록)"""
+        with self._locked():
+            states = self._load()
+            state = states.setdefault(name, {'state': CLOSED, 'failures': 0})
+            result = change(state, time.time())
+            self._save(states)
+            return result
+
+    def state(self, name):
+        return self._load().get(name, {'state': CLOSED, 'failures': 0})
+
+    def allow(self, name):
+        """호출해도 되는지 (open이면 False, cooldown이 지났으면 시험 호출 한 번 허용)"""
+        if self.state(name)['state'] == CLOSED:
+            return True
+
+        def change(state, now):
+            if state['state'] == CLOSED:
+                return True
+            # 시험 호출이 cooldown 안에 끝나지 않았으면(프로세스 종료 등) 다시 허용
+            since = state.get('probe_at') if state['state'] == HALF_OPEN else state.get('opened_at')
+            if now - (since or 0) < self.cooldown:
+                return False
+            state['state'] = HALF_OPEN
+            state['probe_at'] = now
+            self.logger.info(f"소스 시험 호출: {name}")
+            return True
+
+        allowed = self._update(name, change)
+        if not allowed:
+            self.logger.info(f"소스 건너뜀 (차단 중): {name}")
+        return allowed
+
+    def record_success(self, name):
+        def change(state, now):
+            if state['state'] != CLOSED:
+                self.logger.info(f"소스 복구: {name}")
+            state.update(state=CLOSED, failures=0, last_success=now)
+            state.pop('probe_at', None)
+            state.pop('opened_at', None)
+
+        self._update(name, change)
+
+    def record_failure(self, name, error=None):
+        def change(state, now):
+            state['failures'] = state.get('failures', 0) + 1
+            state['last_failure'] = now
+            state['last_error'] = str(error) if error is not None else None
+            if state['state'] == HALF_OPEN or state['failures'] >= self.threshold:
+                if state['state'] != OPEN:
+                    self.logger.warning(f"소스 차단: {name} (연속 실패 {state['failures']}회, {self.cooldown}초 후 재시도)")
+                state['state'] = OPEN
+                state['opened_at'] = now
+                state.pop('probe_at', None)
+
+        self._update(name, change)
+
+    def release(self, name):
+        """결과 없이 취소된 시험 호출 반납 - 원래 차단 시각 그대로 open으로 되돌림 (half_open이 아니면 그대로)"""
+        if self.state(name)['state'] != HALF_OPEN:
+            return
+
+        def change(state, now):
+            if state['state'] == HALF_OPEN:
+                state['state'] = OPEN
+                state.pop('probe_at', None)
+
+        self._update(name, change)
+
+    def reset(self, name=None):
+        """상태 초기화 (name이 없으면 전체)"""
+        with self._locked():
+            states = self._load()
+            if name is None:
+                states = {}
+            else:
+                states.pop(name, None)
+            self._save(states)
+
+    def report(self):
+        """소스별 상태 요약 줄 목록"""
+        lines = []
+        now = time.time()
+        for name, state in sorted(self._load().items()):
+            line = f"{name}: {state['state']}, 연속 실패 {state.get('failures', 0)}회"
+            if state['state'] == OPEN:
+                remaining = self.cooldown - (now - state.get('opened_at', 0))
+                line += f", 재시도까지 {max(0, remaining):.0f}초"
+            if state.get('last_success'):
+                line += f", 마지막 성공 {datetime.fromtimestamp(state['last_success']).strftime('%Y-%m-%d %H:%M')}"
+            if state.get('last_error'):
+                line += f", 마지막 에러: {state['last_error']}"
+            lines.append(line)
+        return lines
+
+class NullSourceHealth:
+    """아무것도 기록하지 않는 소스 상태 (HAR 재생처럼 실제 소스를 부르지 않는 실행용)"""
+
+    def allow(self, name):
+        return True
+
+    def record_success(self, name):
+        pass
+
+    def record_failure(self, name, error=None):
+        pass
+
+    def release(self, name):
+        pass
+
+    def state(self, name):
+        return {'state': CLOSED, 'failures': 0}
+
+_default_health = None
+_default_lock = threading.Lock()
+
+def get_source_health(offline=False):
+    """프로세스 공용 소스 상태 (offline이면 기록하지 않는 상태 - 재생 결과로 실제 소스를 차단하지 않도록)"""
+    global _default_health
+    if offline:
+        return NullSourceHealth()
+    with _default_lock:
+        if _default_health is None:
+            _default_health = SourceHealth()
+        return _default_health
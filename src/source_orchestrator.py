@@ -0,0 +1,142 @@
+"""
+소스 경합 실행기 - 주 소스를 먼저 돌리고 일정 시간 뒤 백업 소스를 병렬로 띄워 가장 먼저 검증된 결과를 쓴다
+(서킷 브레이커로 차단된 소스는 시작하지 않는다)
+"""
+import asyncio
+import time
+from .logger import setup_logger
+from .config import ORCHESTRATOR_HEDGE_DELAY, ORCHESTRATOR_TIMEOUT
+from .team_registry import TEAM_NAMES
+
+VALID_TEAMS = set(TEAM_NAMES.values())
+
+class NoGames(list):
+    """소스가 해당 날짜에 경기가 없음을 확인한 결과 (일정에 그 날짜가 있지만 종료 경기가 없음) - 빈 목록처럼 쓴다"""
+
+def validate_games(games, date):
+    """경기 목록이 해당 날짜의 정상 결과인지 확인 (경기 없음이 확인된 빈 결과도 정상)"""
+    if not games:
+        return isinstance(games, NoGames)
+
+    date_str = date.strftime('%Y-%m-%d')
+    for game in games:
+        try:
+            away_team, home_team = game['away_team'], game['home_team']
+            away_score, home_score = int(game['away_score']), int(game['home_score'])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        if game.get('date', date_str) != date_str:
+            return False
+        if away_team not in VALID_TEAMS or home_team not in VALID_TEAMS or away_team == home_team:
+            return False
+        if away_score < 0 or home_score < 0:
+            return False
+
+    return True
+
+class SourceOrchestrator:
+    """주 소스 + 지연 시작 백업 소스 경합"""
+
+    def __init__(self, sources, hedge_delay=ORCHESTRATOR_HEDGE_DELAY, timeout=ORCHESTRATOR_TIMEOUT,
+                 validator=validate_games, health=None, logger=None):
+        # sources: [(이름, date를 받아 경기 목록을 돌려주는 코루틴 함수), ...] - 첫 번째가 주 소스
+        self.sources = sources
+        self.health = health
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+        self.validator = validator
+        self.logger = logger or setup_logger('SourceOrchestrator')
+        self.last_report = {}
+
+    async def run(self, date):
+        """가장 먼저 검증을 통과한 (소스 이름, 경기 목록) 반환 (모두 실패하면 (None, []))"""
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        hedge_at = start + self.hedge_delay
+        self.last_report = {name: 'not_started' for name, _ in self.sources}
+
+        running = {}
+
+        def launch(name, factory):
+            # 차단 여부는 실제로 시작할 때만 확인 (쿨다운이 지난 소스는 이때 시험 호출로 바뀜)
+            if self.health is not None and not self.health.allow(name):
+                self.last_report[name] = 'skipped'
+                return
+            running[asyncio.ensure_future(factory(date))] = name
+            self.last_report[name] = 'running'
+
+        # 주 소스가 차단돼 있으면 running이 비어 백업 소스가 곧바로 시작됨
+        launch(*self.sources[0])
+        backups = list(self.sources[1:])
+
+        try:
+            while True:
+                now = time.perf_counter()
+                # 주 소스가 일찍 실패했거나 헤지 시간이 지나면 백업 소스를 한꺼번에 시작
+                if backups and (not running or now >= hedge_at):
+                    self.logger.info(f"백업 소스 시작: {', '.join(name for name, _ in backups)} ({(now - start) * 1000:.0f}ms)")
+                    for name, factory in backups:
+                        launch(name, factory)
+                    backups = []
+
+                if not running:
+                    if all(state == 'skipped' for state in self.last_report.values()):
+                        self.logger.warning("모든 소스가 차단 상태")
+                    break
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self.logger.warning(f"소스 경합 시간 초과: {self.timeout}초")
+                    break
+
+                wait_time = min(remaining, hedge_at - now) if backups else remaining
+                done, _ = await asyncio.wait(running, timeout=wait_time, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    name = running.pop(task)
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+
+                    if task.exception() is not None:
+                        self.last_report[name] = 'error'
+                        self.logger.warning(f"소스 실패 ({name}): {task.exception()!r}, {elapsed_ms:.0f}ms")
+                        self._record(name, False, task.exception())
+                        continue
+
+                    games = task.result()
+                    if not self.validator(games, date):
+                        self.last_report[name] = 'invalid'
+                        self.logger.warning(f"소스 결과 검증 실패 ({name}): {len(games or [])}경기, {elapsed_ms:.0f}ms")
+                        # 빈 결과는 경기가 없는 날일 수 있으므로 실패로 세지 않음
+                        if games:
+                            self._record(name, False, '결과 검증 실패')
+                        continue
+
+                    self._record(name, True)
+                    self.last_report[name] = 'won'
+                    if games:
+                        self.logger.info(f"소스 채택 ({name}): {len(games)}경기, {elapsed_ms:.0f}ms")
+                    else:
+                        self.logger.info(f"소스 채택 ({name}): 경기 없는 날 확인, {elapsed_ms:.0f}ms")
+                    return name, games
+
+            return None, []
+
+        finally:
+            # 진 소스는 취소 (스레드로 돌던 동기 소스는 결과만 버려짐)
+            for task, name in running.items():
+                task.cancel()
+                self.last_report[name] = 'cancelled'
+            await asyncio.gather(*running, return_exceptions=True)
+            # 결과 없이 취소된 시험 호출은 반납 (다음 실행에서 다시 시험할 수 있도록)
+            if self.health is not None:
+                for name in running.values():
+                    self.health.release(name)
+
+    def _record(self, name, success, error=None):
+        if self.health is None:
+            return
+        if success:
+            self.health.record_success(name)
+        else:
+            self.health.record_failure(name, error)
@@ -0,0 +1,66 @@
+"""
+단계별 시간 측정 - 브라우저 실행/이동/대기/추출/저장 구간의 소요 시간을 모은다
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+STAGES = ['launch', 'navigation', 'wait', 'extraction', 'save']
+
+# 현재 실행 흐름에서 활성화된 측정기 (없으면 측정하지 않음)
+_current_timer = ContextVar('stage_timer', default=None)
+
+class StageTimer:
+    """단계 이름별 소요 시간 기록"""
+
+    def __init__(self):
+        self.samples = {}
+
+    def record(self, stage, seconds):
+        self.samples.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def activate(self):
+        """이 블록 안(그리고 여기서 만든 태스크)의 측정을 이 객체에 기록"""
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+    def summary(self):
+        """단계별 횟수/합계/평균/최대 (ms)"""
+        result = {}
+        for stage in STAGES + sorted(set(self.samples) - set(STAGES)):
+            values = self.samples.get(stage)
+            if not values:
+                continue
+            result[stage] = {
+                'count': len(values),
+                'total_ms': sum(values) * 1000,
+                'mean_ms': sum(values) / len(values) * 1000,
+                'max_ms': max(values) * 1000
+            }
+        return result
+
+    def report(self):
+        lines = [f"{'단계':<12}{'횟수':>6}{'합계(ms)':>12}{'평균(ms)':>12}{'최대(ms)':>12}"]
+        for stage, stat in self.summary().items():
+            lines.append(f"{stage:<12}{stat['count']:>6}{stat['total_ms']:>12.1f}"
+                         f"{stat['mean_ms']:>12.1f}{stat['max_ms']:>12.1f}")
+        return '\n'.join(lines)
+
+def record_stage(stage, seconds):
+    """활성화된 측정기가 있으면 기록"""
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.record(stage, seconds)
+
+@contextmanager
+def timed(stage):
+    """블록 실행 시간을 단계로 기록 (측정기가 없으면 아무 일도 하지 않음)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start)
@@ -0,0 +1,125 @@
+"""
+팀 이름 레지스트리 - 약칭/구단명/애칭/영문명/KBO 팀 코드를 정규 팀 이름과 고정 정수 ID로 바꾼다.
+별칭을 트라이 하나로 미리 만들어 두고 텍스트를 한 번 훑어 가장 왼쪽에서 시작하는 가장 긴 별칭을 찾는다.
+영문 별칭은 앞뒤가 영문자가 아닐 때만 인정한다 ("since"의 NC, "Algorithm"의 LG 등 제외)
+"""
+import re
+import threading
+
+# (팀 ID, 정규 이름, 텍스트 안에서 찾는 별칭, 그 자체로만 인정하는 코드)
+# ID는 저장된 결과와 비교하므로 바꾸지 않는다 (새 별칭은 목록 끝에 추가)
+TEAMS = [
+    (1, 'KIA', ['KIA', 'KIA타이거즈', '기아', '타이거즈', 'Tigers'], ['HT']),
+    (2, '삼성', ['삼성', '삼성라이온즈', '라이온즈', 'Samsung', 'Lions'], ['SS']),
+    (3, 'LG', ['LG', 'LG트윈스', '트윈스', 'Twins'], []),
+    (4, '두산', ['두산', '두산베어스', '베어스', 'Doosan', 'Bears'], ['OB']),
+    (5, 'KT', ['KT', 'KT위즈', '위즈', 'Wiz'], []),
+    (6, 'SSG', ['SSG', 'SSG랜더스', '랜더스', 'Landers', 'SK와이번스', '와이번스'], ['SK']),
+    (7, '롯데', ['롯데', '롯데자이언츠', '자이언츠', 'Lotte', 'Giants'], ['LT']),
+    (8, '한화', ['한화', '한화이글스', '이글스', 'Hanwha', 'Eagles'], ['HH']),
+    (9, 'NC', ['NC', 'NC다이노스', '다이노스', 'Dinos'], []),
+    (10, '키움', ['키움', '키움히어로즈', '히어로즈', 'Kiwoom', 'Heroes', '넥센'], ['WO']),
+]
+
+# 정규 이름 -> 정규 이름 (이전 config.TEAM_NAMES와 같은 형태)
+TEAM_NAMES = {name: name for _, name, _, _ in TEAMS}
+
+_SPACES = re.compile(r'\s+')
+
+def _fold(text):
+    """대소문자 무시, 연속 공백은 하나로 (공백은 영문 별칭의 경계)"""
+    return _SPACES.sub(' ', text).casefold()
+
+def _latin(char):
+    return char.isascii() and char.isalpha()
+
+class TeamRegistry:
+    """별칭 트라이 기반 팀 이름 해석기"""
+
+    def __init__(self, teams=TEAMS):
+        self.names = {team_id: name for team_id, name, _, _ in teams}
+        self.ids = {name: team_id for team_id, name in self.names.items()}
+        self.codes = {}
+        # 트라이 노드: {문자: 자식 노드}, 별칭이 끝나는 노드는 None 키에 팀 ID
+        self.trie = {}
+        for team_id, name, aliases, codes in teams:
+            for alias in [name] + aliases:
+                node = self.trie
+                for char in _fold(alias):
+                    node = node.setdefault(char, {})
+                node[None] = team_id
+            for code in codes:
+                self.codes[code] = team_id
+
+    def _match_at(self, text, start):
+        """start에서 시작하는 가장 긴 별칭의 (끝 위치, 팀 ID) - 영문 단어 중간에서 시작하거나 끝나면 제외"""
+        if start > 0 and _latin(text[start]) and _latin(text[start - 1]):
+            return None
+        node = self.trie
+        found = None
+        for pos in range(start, len(text)):
+            node = node.get(text[pos])
+            if node is None:
+                break
+            if None in node and not (_latin(text[pos]) and pos + 1 < len(text) and _latin(text[pos + 1])):
+                found = (pos + 1, node[None])
+        return found
+
+    def find_all(self, text):
+        """텍스트 안의 팀 ID 목록 (나온 순서, 겹치지 않게, "LG Twins"처럼 연달아 나온 같은 팀은 한 번)"""
+        if not text:
+            return []
+        folded = _fold(text)
+        found = []
+        start = 0
+        while start < len(folded):
+            match = self._match_at(folded, start)
+            if match:
+                start, team_id = match
+                if not found or found[-1] != team_id:
+                    found.append(team_id)
+            else:
+                start += 1
+        return found
+
+    def find(self, text):
+        """텍스트에 처음 나오는 팀 ID, 없으면 None"""
+        if not text:
+            return None
+        stripped = text.strip()
+        if stripped in self.codes:
+            return self.codes[stripped]
+        folded = _fold(stripped)
+        for start in range(len(folded)):
+            match = self._match_at(folded, start)
+            if match:
+                return match[1]
+        return None
+
+    def name(self, team_id):
+        """팀 ID -> 정규 이름"""
+        return self.names.get(team_id)
+
+    def canonical(self, text, default=None):
+        """텍스트 -> 정규 팀 이름 (찾지 못하면 default)"""
+        team_id = self.find(text)
+        return self.names[team_id] if team_id is not None else default
+
+    def is_team(self, name):
+        """정규 팀 이름인지"""
+        return name in self.ids
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_team_registry():
+    """프로세스 공용 팀 레지스트리"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TeamRegistry()
+        return _registry
+
+def canonical_team(text, default=None):
+    """공용 레지스트리로 정규 팀 이름 찾기"""
+    return get_team_registry().canonical(text, default)
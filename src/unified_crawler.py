@@ -2,21 +2,48 @@
 통합 크롤러 - KBO 공식 사이트 기반
 """
 import asyncio
-from playwright.async_api import async_playwright
 from datetime import datetime, timedelta
 import json
 import re
 from bs4 import BeautifulSoup
 from .logger import setup_logger
-from .config import DATA_DIR
+from .config import DATA_DIR, RANGE_CONCURRENCY, RANGE_DATE_TIMEOUT, ORCHESTRATOR_BACKUPS, ORCHESTRATOR_REPLAY_BACKUPS
+from .browser_pool import BrowserPool, borrow_page, is_replay
+from .page_readiness import PageReadiness, goto_ready
+from .response_capture import capture_json
+from .parser import GameParser
+from .score_patterns import SCORE_JS
+from .team_registry import get_team_registry, TEAM_NAMES
+from .game_identity import GameSet
+from .stage_timer import timed
+from .source_orchestrator import SourceOrchestrator, NoGames
+from .source_health import get_source_health
+from .http_cache import is_final_month, invalidate_page
+from .playwright_crawler import PlaywrightCrawler
+from .kbo_api_crawler import KBOAPICrawler
+from .google_real_crawler import GoogleRealCrawler
+from .endpoint_discovery import EndpointDiscovery
 import os
 
 class UnifiedCrawler:
     """KBO 공식 사이트를 메인으로 사용하는 통합 크롤러"""
     
-    def __init__(self):
+    def __init__(self, pool=None, harvest=False, intercept=False, backups=None):
         self.logger = setup_logger('UnifiedCrawler')
         self.base_url = "https://www.koreabaseball.com"
+        self.pool = pool
+        self.harvest = harvest
+        self.intercept = intercept
+        self.parser = GameParser()
+        self.teams = get_team_registry()
+        # HAR 재생 중에는 네트워크에 나가는 소스를 빼고, 재생 결과로 소스 상태를 바꾸지 않음
+        replay = is_replay(pool)
+        if backups is None:
+            backups = ORCHESTRATOR_REPLAY_BACKUPS if replay else ORCHESTRATOR_BACKUPS
+        self.backups = backups
+        self.health = get_source_health(offline=replay)
+        self._month_harvests = {}
+        self._month_locks = {}
         
     async def get_game_results(self, date=None):
         """경기 결과 가져오기 - KBO 공식 사이트 우선"""
@@ -25,33 +52,42 @@ class UnifiedCrawler:
             
         self.logger.info(f"통합 크롤러 시작: {date.strftime('%Y-%m-%d')}")
         
-        # 1차: KBO 공식 사이트
-        games = await self._crawl_kbo_official(date)
+        # KBO 공식 사이트를 먼저 시도하고, 늦어지거나 실패하면 백업 소스와 경합
+        orchestrator = SourceOrchestrator(self._build_sources(date), health=self.health, logger=self.logger)
+        name, games = await orchestrator.run(date)
         
-        # 2차: 실패 시 백업 소스 사용 (향후 구현)
-        if not games:
-            self.logger.warning("KBO 공식 사이트 크롤링 실패, 백업 소스 시도")
-            # TODO: 백업 크롤러 구현
+        if name is None:
+            self.logger.warning(f"모든 소스 실패: {orchestrator.last_report}")
             
         return games
     
+    def _build_sources(self, date):
+        """경합에 참여할 소스 목록 (첫 번째가 주 소스)"""
+        # 1차: KBO 공식 사이트 (수확 모드면 월 단위로 한 번만 렌더링)
+        primary = self._get_from_month_harvest if self.harvest else self._crawl_kbo_official
+        sources = [('kbo_official', primary)]
+        
+        backups = {
+            'naver': lambda d: PlaywrightCrawler(pool=self.pool).crawl_naver_sports(d),
+            # 동기 크롤러는 스레드에서 실행
+            'kbo_api': lambda d: asyncio.to_thread(KBOAPICrawler().get_game_results, d),
+            'naver_api': lambda d: asyncio.to_thread(EndpointDiscovery().get_game_results, d),
+            'google': lambda d: GoogleRealCrawler(pool=self.pool).get_game_results(d),
+        }
+        for name in self.backups:
+            # 구글 검색은 날짜를 지정할 수 없어 최근 경기에만 사용
+            if name == 'google' and (datetime.now() - date).days > 1:
+                continue
+            sources.append((name, backups[name]))
+            
+        return sources
+    
     async def _crawl_kbo_official(self, date):
         """KBO 공식 사이트 크롤링"""
         games = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            page = await context.new_page()
-            
+        # 월 일정 페이지이므로 월 전체가 확정됐을 때만 캐시 동결
+        async with borrow_page(self.pool, freeze=is_final_month(date.year, date.month)) as page:
             try:
                 # 특정 날짜의 일정 페이지 직접 접속
                 year = date.year
@@ -59,119 +95,344 @@ class UnifiedCrawler:
                 url = f"{self.base_url}/schedule/schedule.aspx?year={year}&month={month:02d}"
                 
                 self.logger.info(f"접속 URL: {url}")
-                await page.goto(url, wait_until='networkidle')
-                await page.wait_for_timeout(3000)
+                
+                # 가로채기 모드: 데이터 응답 JSON을 받는 즉시 파싱
+                if self.intercept:
+                    payload = await capture_json(page, url, logger=self.logger)
+                    if payload is not None:
+                        self.health.record_success('kbo_official')
+                        with timed('extraction'):
+                            games = self.parser.parse_kbo_official(payload, date)
+                        if games:
+                            return games
+                        if not invalidate_page(page):
+                            if self.parser.covers_date(payload, date):
+                                # 네트워크에서 받은 일정에 있는 날짜인데 종료 경기가 없음 - 백업 소스로 다시 확인하지 않음
+                                return NoGames()
+                            return games
+                        # 동결 캐시가 재생했거나 동결해 저장한 일정은 경기 없음의 근거로 쓰지 않음 (삭제 후 DOM으로 확인)
+                        self.logger.warning("동결된 일정 응답에 경기 없음, DOM 추출로 확인")
+                    else:
+                        self.logger.warning("데이터 응답 없음, DOM 추출로 전환")
+                
+                if await goto_ready(page, url, 'kbo_schedule', self.logger):
+                    self.health.record_success('kbo_official')
+                else:
+                    self.health.record_failure('kbo_official', '일정 표 대기 시간 초과')
                 
                 # 날짜 클릭 시도
                 day = date.day
+                readiness = None
                 try:
                     # 날짜 셀 클릭
                     date_selector = f'td:has-text("{day}")'
+                    readiness = PageReadiness(page, 'kbo_schedule_update', self.logger).arm()
                     await page.click(date_selector)
-                    await page.wait_for_timeout(2000)
-                except:
-                    self.logger.warning(f"날짜 {day} 클릭 실패")
+                    await readiness.wait()
+                except Exception as e:
+                    if readiness is not None:
+                        readiness.cancel()
+                    self.logger.warning(f"날짜 {day} 클릭 실패: {e}")
                 
                 # 경기 데이터 추출
-                games_data = await self._extract_games_data(page)
+                with timed('extraction'):
+                    games_data = await self._extract_games_data(page)
                 
-                # 데이터 파싱 및 정제
-                seen_games = set()
+                # 데이터 파싱 및 정제 (정규화한 팀 기준으로 같은 경기는 한 번만)
+                found = GameSet(self.teams)
                 
                 for game_data in games_data:
                     try:
-                        # 중복 체크
-                        game_key = f"{game_data['awayTeam']}-{game_data['homeTeam']}-{game_data['awayScore']}-{game_data['homeScore']}"
-                        if game_key in seen_games:
-                            continue
-                        seen_games.add(game_key)
-                        
-                        away_team = self._normalize_team_name(game_data['awayTeam'])
-                        home_team = self._normalize_team_name(game_data['homeTeam'])
+                        game_info = self._to_game_info(game_data, date)
                         
-                        if away_team and home_team:
-                            game_info = {
-                                'date': date.strftime('%Y-%m-%d'),
-                                'away_team': away_team,
-                                'home_team': home_team,
-                                'away_score': game_data['awayScore'],
-                                'home_score': game_data['homeScore'],
-                                'winner': away_team if game_data['awayScore'] > game_data['homeScore'] else home_team
-                            }
-                            
-                            games.append(game_info)
-                            self.logger.info(f"경기: {away_team} {game_data['awayScore']} - {game_data['homeScore']} {home_team}")
+                        if game_info and found.add(game_info):
+                            self.logger.info(f"경기: {game_info['away_team']} {game_info['away_score']} - {game_info['home_score']} {game_info['home_team']}")
                             
                     except Exception as e:
                         self.logger.error(f"게임 파싱 에러: {e}")
+                games = found.games
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
+                self.health.record_failure('kbo_official', e)
                 
-            finally:
-                await browser.close()
+            if not games:
+                # 동의 화면/에러 페이지 등이 동결돼 계속 재생되지 않도록
+                invalidate_page(page)
         
         return games
     
-    async def _extract_games_data(self, page):
-        """페이지에서 경기 데이터 추출"""
+    async def _get_from_month_harvest(self, date):
+        """월 수확 결과에서 해당 날짜 경기 조회 (없으면 월 페이지 수확)"""
+        # 오늘 이후 경기는 아직 끝나지 않았을 수 있으므로 일 단위로 크롤링
+        if date.date() >= datetime.now().date():
+            return await self._crawl_kbo_official(date)
+            
+        key = (date.year, date.month)
+        lock = self._month_locks.setdefault(key, asyncio.Lock())
+        
+        # 같은 달을 동시에 여러 번 렌더링하지 않도록 잠금
+        async with lock:
+            games = self._get_harvested_games(date)
+            if games is None:
+                await self.harvest_month(date.year, date.month)
+                games = self._get_harvested_games(date)
+                
+        if games is None:
+            # 수확에 실패했거나 수확 범위 밖의 날짜
+            return await self._crawl_kbo_official(date)
+        # 수확한 일정 범위 안에서 경기가 없는 날
+        return games or NoGames()
+    
+    def _get_harvested_games(self, date):
+        """수확된 월 데이터에서 날짜별 경기 반환 (수확 범위 밖이면 None)"""
+        key = (date.year, date.month)
+        harvest = self._month_harvests.get(key)
+        
+        if harvest is None:
+            harvest = self._load_month_harvest(date.year, date.month)
+            if harvest is None:
+                return None
+            self._month_harvests[key] = harvest
+            
+        # 수확 시점 이전에 끝난 날짜만 신뢰
+        harvested_at = datetime.fromisoformat(harvest['harvested_at'])
+        if date.date() >= harvested_at.date():
+            return None
+            
+        date_str = date.strftime('%Y-%m-%d')
+        if date_str in harvest['days']:
+            return harvest['days'][date_str]
+            
+        # 수확한 일정 표의 첫 날짜~마지막 날짜 사이만 '경기 없는 날'로 봄 (범위 밖은 일 단위로 크롤링)
+        first_day, last_day = harvest.get('first_day'), harvest.get('last_day')
+        if first_day and last_day and first_day <= date_str <= last_day:
+            return []
+        return None
+    
+    def _month_harvest_path(self, year, month):
+        """월 수확 파일 경로"""
+        return os.path.join(DATA_DIR, f'kbo_month_{year}{month:02d}.json')
+    
+    def _load_month_harvest(self, year, month):
+        """디스크에 저장된 월 수확 결과 로드"""
+        filepath = self._month_harvest_path(year, month)
+        if not os.path.exists(filepath):
+            return None
+            
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"월 수확 파일 로드 실패: {e}")
+            return None
+    
+    async def harvest_month(self, year, month):
+        """월 일정 페이지를 한 번 렌더링해 모든 종료 경기를 날짜별로 저장"""
+        days = {}
+        scheduled = []
+        
+        async with borrow_page(self.pool, freeze=is_final_month(year, month)) as page:
+            try:
+                url = f"{self.base_url}/schedule/schedule.aspx?year={year}&month={month:02d}"
+                
+                self.logger.info(f"월 수확 URL: {url}")
+                
+                payload = None
+                if self.intercept:
+                    payload = await capture_json(page, url, logger=self.logger)
+                    
+                if payload is not None:
+                    # 월 전체 응답을 날짜별로 분리
+                    with timed('extraction'):
+                        for game_info in self.parser.parse_kbo_official(payload, datetime(year, month, 1), whole_month=True):
+                            days.setdefault(game_info['date'], []).append(game_info)
+                        scheduled = self.parser.schedule_dates(payload, year)
+                else:
+                    if not await goto_ready(page, url, 'kbo_schedule', self.logger):
+                        self.logger.warning(f"월 일정 표 대기 시간 초과, 수확하지 않음: {year}-{month:02d}")
+                        invalidate_page(page)
+                        return None
+                    with timed('extraction'):
+                        days, scheduled = await self._harvest_from_dom(page, year)
+                        
+            except Exception as e:
+                self.logger.error(f"월 수확 에러: {e}")
+                invalidate_page(page)
+                return None
+                
+            if not days:
+                # 다시 수확할 때 같은 빈 페이지를 재생하지 않도록
+                invalidate_page(page)
+                
+        # 빈 수확은 저장하지 않아 다음 조회에서 다시 수확
+        if not days:
+            self.logger.warning(f"월 수확 결과 없음, 저장하지 않음: {year}-{month:02d}")
+            return None
+            
+        covered = sorted(set(scheduled) | set(days))
+        harvest = {
+            'harvested_at': datetime.now().isoformat(timespec='seconds'),
+            'first_day': covered[0],
+            'last_day': covered[-1],
+            'days': days
+        }
+        self._month_harvests[(year, month)] = harvest
+        
+        # 날짜별 결과 파일과 월 수확 파일 저장
+        for date_str, games in sorted(days.items()):
+            self.save_results(games, datetime.strptime(date_str, '%Y-%m-%d'))
+            
+        filepath = self._month_harvest_path(year, month)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(harvest, f, ensure_ascii=False, indent=2)
+        self.logger.info(f"월 수확 완료: {year}-{month:02d}, {len(days)}일, {sum(len(g) for g in days.values())}경기")
+        
+        return harvest
+    
+    async def _harvest_from_dom(self, page, year):
+        """렌더링된 월 일정 표에서 날짜별 경기 추출 ({날짜: [경기]}, 일정 표에 있던 날짜 목록)"""
+        days = {}
+        result = await self._extract_month_games(page)
+        games_data = result['games']
+        scheduled = sorted({f"{year}-{month:02d}-{day:02d}" for month, day in result['days']})
+        
+        found = GameSet(self.teams)
+        for game_data in games_data:
+            try:
+                game_date = datetime(year, game_data['month'], game_data['day'])
+                game_info = self._to_game_info(game_data, game_date)
+                if game_info and found.add(game_info):
+                    days.setdefault(game_info['date'], []).append(game_info)
+                    
+            except Exception as e:
+                self.logger.error(f"게임 파싱 에러: {e}")
+                
+        return days, scheduled
+    
+    def _to_game_info(self, game_data, date):
+        """추출된 경기 데이터를 표준 형식으로 변환"""
+        away_team = self.teams.canonical(game_data['awayTeam'])
+        home_team = self.teams.canonical(game_data['homeTeam'])
+        
+        if not (away_team and home_team):
+            return None
+            
+        return {
+            'date': date.strftime('%Y-%m-%d'),
+            'away_team': away_team,
+            'home_team': home_team,
+            'away_score': game_data['awayScore'],
+            'home_score': game_data['homeScore'],
+            'winner': away_team if game_data['awayScore'] > game_data['homeScore'] else home_team
+        }
+    
+    async def _extract_month_games(self, page):
+        """월 일정 표에서 날짜별 종료 경기와 일정이 있는 날짜 추출"""
         return await page.evaluate("""
             () => {
                 const games = [];
-                const processedGames = new Set();
-                
-                // 모든 테이블과 div 요소 검색
-                const elements = document.querySelectorAll('table, div');
+                const days = [];
+                let current = null;
                 
-                elements.forEach(element => {
-                    const text = element.innerText || element.textContent || '';
+                // 일정 표의 행을 위에서부터 훑으며 날짜 셀(rowspan)을 이어받음
+                document.querySelectorAll('table tr').forEach(row => {
+                    const dayCell = row.querySelector('td.day');
+                    if (dayCell) {
+                        const m = (dayCell.textContent || '').match(/(\\d{1,2})\\.(\\d{1,2})/);
+                        if (m) {
+                            current = {month: parseInt(m[1]), day: parseInt(m[2])};
+                        }
+                    }
                     
-                    // 점수 패턴들
-                    const patterns = [
-                        /(\\w+)\\s+(\\d+)\\s*:\\s*(\\d+)\\s+(\\w+)/g,  // KIA 5 : 3 LG
-                        /(\\w+)\\s+(\\d+)\\s*-\\s*(\\d+)\\s+(\\w+)/g,  // KIA 5 - 3 LG
-                        /(\\w+)\\s+(\\d+)vs(\\d+)\\s+(\\w+)/g,        // KIA 5vs3 LG
-                    ];
+                    const playCell = row.querySelector('td.play');
+                    if (!current || !playCell) {
+                        return;
+                    }
+                    days.push([current.month, current.day]);
                     
-                    patterns.forEach(pattern => {
-                        const matches = text.matchAll(pattern);
-                        for (const match of matches) {
-                            const gameKey = `${match[1]}-${match[4]}-${match[2]}-${match[3]}`;
-                            
-                            if (!processedGames.has(gameKey)) {
-                                processedGames.add(gameKey);
-                                games.push({
-                                    awayTeam: match[1],
-                                    awayScore: parseInt(match[2]),
-                                    homeScore: parseInt(match[3]),
-                                    homeTeam: match[4]
-                                });
-                            }
-                        }
-                    });
+                    // 예: "KIA5vs3LG" (점수가 없으면 종료되지 않은 경기)
+                    const text = (playCell.textContent || '').replace(/\\s+/g, '');
+                    const match = text.match(/^(\\D+?)(\\d+)vs(\\d+)(\\D+)$/);
+                    if (match) {
+                        games.push({
+                            month: current.month,
+                            day: current.day,
+                            awayTeam: match[1],
+                            awayScore: parseInt(match[2]),
+                            homeScore: parseInt(match[3]),
+                            homeTeam: match[4]
+                        });
+                    }
                 });
                 
-                return games;
+                return {games, days};
             }
         """)
     
-    def _normalize_team_name(self, name):
-        """팀 이름 정규화"""
-        team_mapping = {
-            'SSG': 'SSG', '랜더스': 'SSG',
-            'LG': 'LG', '트윈스': 'LG',
-            'NC': 'NC', '다이노스': 'NC',
-            '키움': '키움', '히어로즈': '키움',
-            '두산': '두산', '베어스': '두산',
-            '한화': '한화', '이글스': '한화',
-            '삼성': '삼성', '라이온즈': '삼성',
-            'KIA': 'KIA', '타이거즈': 'KIA',
-            'KT': 'KT', '위즈': 'KT',
-            '롯데': '롯데', '자이언츠': '롯데'
-        }
+    async def _extract_games_data(self, page):
+        """페이지에서 경기 데이터 추출 (DOM을 한 번만 순회)"""
+        result = await page.evaluate("""
+            () => {
+                """ + SCORE_JS + """
+                const games = [];
+                const processedGames = new Set();
+                let visited = 0;
+                let containers = 0;
+                
+                // 블록 컨테이너 단위로 텍스트를 모으고, 인라인 요소(span, em, a 등)는 부모 컨테이너에 합침
+                const CONTAINER_TAGS = new Set([
+                    'BODY', 'TABLE', 'TBODY', 'THEAD', 'TR', 'TD', 'TH',
+                    'DIV', 'SECTION', 'ARTICLE', 'UL', 'OL', 'LI', 'DL', 'DT', 'DD', 'P'
+                ]);
+                const SKIP_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+                
+                // 점수 표기 (":", "-", "vs")는 score_patterns의 패턴 하나로 한 번에 찾음
+                const scan = (text) => {
+                    containers++;
+                    if (!/\\d/.test(text)) {
+                        return;
+                    }
+                    for (const [awayTeam, awayScore, homeScore, homeTeam] of findScores(text)) {
+                        const gameKey = `${awayTeam}-${homeTeam}-${awayScore}-${homeScore}`;
+                        
+                        if (!processedGames.has(gameKey)) {
+                            processedGames.add(gameKey);
+                            games.push({awayTeam, awayScore, homeScore, homeTeam});
+                        }
+                    }
+                };
+                
+                // 각 노드를 한 번씩만 방문하고 텍스트 노드는 nodeValue로 읽음 (레이아웃 계산 없음)
+                const walk = (node, buffer) => {
+                    for (let child = node.firstChild; child; child = child.nextSibling) {
+                        visited++;
+                        if (child.nodeType === Node.TEXT_NODE) {
+                            buffer.push(child.nodeValue);
+                        } else if (child.nodeType === Node.ELEMENT_NODE && !SKIP_TAGS.has(child.tagName)) {
+                            if (CONTAINER_TAGS.has(child.tagName)) {
+                                const own = [];
+                                walk(child, own);
+                                scan(own.join(' '));
+                            } else {
+                                walk(child, buffer);
+                            }
+                        }
+                    }
+                };
+                
+                const rootText = [];
+                walk(document.body, rootText);
+                scan(rootText.join(' '));
+                
+                return {games, visited, containers};
+            }
+        """)
         
-        return team_mapping.get(name, name if name in team_mapping.values() else None)
+        self.logger.info(f"경기 추출: 노드 {result['visited']}개 방문, 컨테이너 {result['containers']}개 검사, {len(result['games'])}개 후보")
+        return result['games']
     
+    @timed('save')
     def save_results(self, games, date):
         """결과 저장"""
         if not games:
@@ -210,16 +471,56 @@ class UnifiedCrawler:
         if games:
             self.save_results(games, date)
             return games
+        elif isinstance(games, NoGames):
+            self.logger.info("경기가 없는 날입니다.")
+            return games
         else:
             self.logger.warning("경기 결과를 찾을 수 없습니다.")
             # 테스트용 더미 데이터
             return self._get_dummy_data(date)
     
+    async def run_range(self, start, end, concurrency=RANGE_CONCURRENCY):
+        """날짜 범위를 동시에 크롤링해 끝나는 순서대로 (날짜, 경기) 반환"""
+        dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # 풀이 없으면 동시성 크기만큼 풀을 띄우고 끝나면 정리
+        owns_pool = self.pool is None
+        if owns_pool:
+            self.pool = BrowserPool(size=concurrency)
+            
+        async def crawl(date):
+            async with semaphore:
+                try:
+                    games = await asyncio.wait_for(self.get_game_results(date), RANGE_DATE_TIMEOUT)
+                    if games:
+                        self.save_results(games, date)
+                    return date, games
+                except Exception as e:
+                    # 한 날짜의 실패가 전체 배치를 멈추지 않도록 빈 결과로 처리
+                    self.logger.error(f"날짜 크롤링 실패 ({date.strftime('%Y-%m-%d')}): {e!r}")
+                    return date, []
+                    
+        self.logger.info(f"범위 크롤링 시작: {start.strftime('%Y-%m-%d')} ~ {end.strftime('%Y-%m-%d')}, {len(dates)}일, 동시성 {concurrency}")
+        tasks = [asyncio.create_task(crawl(date)) for date in dates]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            if owns_pool:
+                await self.pool.close()
+                self.pool = None
+    
     def _get_dummy_data(self, date):
         """테스트용 더미 데이터"""
         import random
         
-        teams = ['SSG', 'LG', 'NC', '키움', '두산', '한화', '삼성', 'KIA', 'KT', '롯데']
+        teams = list(TEAM_NAMES)
         games = []
         
         # 5경기 생성
@@ -258,10 +559,39 @@ class UnifiedCrawler:
         return games
 
 # 동기 래퍼 함수
-def run_unified_crawler(date=None):
-    """동기 환경에서 통합 크롤러 실행"""
-    crawler = UnifiedCrawler()
-    return asyncio.run(crawler.run(date))
+def run_unified_crawler(date=None, harvest=False, intercept=False, record_har=None, replay_har=None):
+    """동기 환경에서 통합 크롤러 실행 (record_har/replay_har로 HAR 녹화/재생)"""
+    async def _run():
+        if record_har or replay_har:
+            # HAR 모드는 모든 페이지가 같은 풀을 거쳐야 세션 하나로 기록/재생됨
+            async with BrowserPool(size=1, record_har=record_har, replay_har=replay_har) as pool:
+                return await UnifiedCrawler(pool=pool, harvest=harvest, intercept=intercept).run(date)
+        return await UnifiedCrawler(harvest=harvest, intercept=intercept).run(date)
+
+    return asyncio.run(_run())
+
+def run_unified_crawler_range(start, end, concurrency=None, harvest=False, intercept=False, on_result=None,
+                              record_har=None, replay_har=None):
+    """동기 환경에서 날짜 범위 크롤링 (on_result로 완료 순서대로 결과 전달, concurrency가 없으면 RANGE_CONCURRENCY)"""
+    concurrency = concurrency or RANGE_CONCURRENCY
+    async def _run_all():
+        pool = None
+        if record_har or replay_har:
+            pool = BrowserPool(size=concurrency, record_har=record_har, replay_har=replay_har)
+            
+        crawler = UnifiedCrawler(pool=pool, harvest=harvest, intercept=intercept)
+        results = {}
+        try:
+            async for date, games in crawler.run_range(start, end, concurrency):
+                results[date] = games
+                if on_result:
+                    on_result(date, games)
+        finally:
+            if pool is not None:
+                await pool.close()
+        return results
+
+    return asyncio.run(_run_all())
 
 if __name__ == "__main__":
     # 테스트 실행
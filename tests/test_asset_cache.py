@@ -0,0 +1,47 @@
+import unittest
+import tempfile
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.asset_cache import AssetCache
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = AssetCache(cache_dir=self.temp_dir.name, max_age=60)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_store_and_lookup(self):
+        """저장한 응답을 그대로 돌려주고 인코딩 헤더는 제거"""
+        url = 'https://www.koreabaseball.com/js/common.js'
+        headers = {'content-type': 'application/javascript', 'content-encoding': 'gzip'}
+        self.assertTrue(self.cache.store(url, 200, headers, b'var a = 1;'))
+
+        status, cached_headers, body = self.cache.lookup(url)
+        self.assertEqual(status, 200)
+        self.assertEqual(body, b'var a = 1;')
+        self.assertEqual(cached_headers, {'content-type': 'application/javascript'})
+
+    def test_skip_uncacheable(self):
+        """200이 아니거나 no-store면 저장하지 않음"""
+        url = 'https://www.koreabaseball.com/js/missing.js'
+        self.assertFalse(self.cache.store(url, 404, {}, b''))
+        self.assertFalse(self.cache.store(url, 200, {'cache-control': 'no-store'}, b'x'))
+        self.assertIsNone(self.cache.lookup(url))
+
+    def test_expired_entry(self):
+        """만료된 항목은 조회되지 않고 정리됨"""
+        url = 'https://ssl.pstatic.net/static/sports/common.css'
+        self.cache.store(url, 200, {}, b'body{}')
+        for name in os.listdir(self.temp_dir.name):
+            os.utime(os.path.join(self.temp_dir.name, name), (0, 0))
+        self.cache.max_age = 0
+
+        self.assertIsNone(self.cache.lookup(url))
+        self.assertEqual(self.cache.prune(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.kbo_api_crawler import AsyncKBOAPICrawler
+from src.http_client import HttpClient
+from src.rate_limiter import RateLimiter
+from src.source_health import SourceHealth
+from src.source_orchestrator import NoGames
+
+class ScheduleHandler(BaseHTTPRequestHandler):
+    """GetScheduleList 형태의 응답을 돌려주는 로컬 서버 (월 단위 요청이면 1~3일 경기)"""
+    protocol_version = 'HTTP/1.1'
+    calls = 0
+
+    def do_POST(self):
+        ScheduleHandler.calls += 1
+        form = parse_qs(self.rfile.read(int(self.headers['Content-Length'])).decode())
+        if 'gameMonth' in form:
+            prefix = form['seasonId'][0] + form['gameMonth'][0]
+            dates = [f"{prefix}{day:02d}" for day in (1, 1, 2, 3)]
+        elif form['date'][0] == '20241021':
+            # 경기가 없는 월요일
+            dates = []
+        else:
+            dates = [form['date'][0]]
+        games = [{'gmsc': 'F', 'awayNm': 'KIA', 'homeNm': 'LG', 'asc': '5', 'hsc': '3', 'G_DT': d} for d in dates]
+        body = json.dumps({'d': {'list': games}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestAsyncKBOAPICrawler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ScheduleHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ScheduleHandler.calls = 0
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.health = SourceHealth(path=os.path.join(self.temp_dir.name, 'source_health.json'))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def fetch_all(self, crawler, start, end, limiter=None):
+        # 디스크 캐시 없이 매번 로컬 서버로 요청
+        crawler.http = HttpClient(limiter=limiter)
+        crawler.health = self.health
+        
+        async def run():
+            return [item async for item in crawler.fetch_range(start, end, save=False)]
+        return asyncio.run(run())
+
+    def test_fetch_range(self):
+        """범위의 모든 날짜를 조회하고 날짜별로 파싱"""
+        crawler = AsyncKBOAPICrawler(concurrency=4, month_batch=False)
+        crawler.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+        results = self.fetch_all(crawler, datetime(2024, 10, 1), datetime(2024, 10, 10))
+
+        self.assertEqual(len(results), 10)
+        for date, games in results:
+            self.assertEqual(games[0]['date'], date.strftime('%Y-%m-%d'))
+            self.assertEqual(games[0]['winner'], 'KIA')
+
+    def test_rate_limit(self):
+        """호스트당 초당 요청 수를 넘지 않음"""
+        crawler = AsyncKBOAPICrawler(concurrency=8, month_batch=False)
+        crawler.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+        limiter = RateLimiter(db_path=os.path.join(self.temp_dir.name, 'rate.sqlite3'), limits={'127.0.0.1': (20, 1)})
+        start = time.perf_counter()
+        self.fetch_all(crawler, datetime(2024, 10, 1), datetime(2024, 10, 5), limiter)
+
+        # 버스트 1, 초당 20건이면 5번째 요청은 최소 0.2초 뒤
+        self.assertGreaterEqual(time.perf_counter() - start, 0.19)
+
+    def test_month_batch(self):
+        """월마다 요청 한 번, 응답을 경기 날짜별로 나눔"""
+        crawler = AsyncKBOAPICrawler(concurrency=4)
+        crawler.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+        results = dict(self.fetch_all(crawler, datetime(2024, 9, 30), datetime(2024, 10, 2)))
+
+        self.assertEqual(ScheduleHandler.calls, 2)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[datetime(2024, 9, 30)], [])
+        self.assertEqual(len(results[datetime(2024, 10, 1)]), 2)
+        self.assertEqual(results[datetime(2024, 10, 2)][0]['date'], '2024-10-02')
+
+    def test_get_month_results(self):
+        """동기 월 단위 조회"""
+        crawler = AsyncKBOAPICrawler()
+        crawler.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        crawler.http = HttpClient()
+        crawler.health = self.health
+
+        by_date = crawler.get_month_results(2024, 10)
+
+        self.assertEqual(sorted(by_date), ['2024-10-01', '2024-10-02', '2024-10-03'])
+        self.assertEqual(ScheduleHandler.calls, 1)
+
+    def test_confirmed_off_day(self):
+        """지난 날짜의 응답에 그 날짜 경기 행이 없으면 경기 없음 확인"""
+        crawler = AsyncKBOAPICrawler()
+        crawler.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        crawler.http = HttpClient()
+        crawler.health = self.health
+
+        games = crawler.get_game_results(datetime(2024, 10, 21))
+        self.assertIsInstance(games, NoGames)
+        self.assertNotIsInstance(crawler.get_game_results(datetime(2024, 10, 15)), NoGames)
+
+if __name__ == '__main__':
+    unittest.main()
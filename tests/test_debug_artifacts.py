@@ -0,0 +1,49 @@
+import unittest
+import gzip
+import tempfile
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.debug_artifacts import DebugArtifacts
+
+class TestDebugArtifacts(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_modes(self):
+        """모드별 저장 여부"""
+        self.assertFalse(DebugArtifacts(mode='off').should_capture(failed=True))
+        self.assertTrue(DebugArtifacts(mode='failure').should_capture(failed=True))
+        self.assertFalse(DebugArtifacts(mode='failure').should_capture(failed=False))
+        self.assertTrue(DebugArtifacts(mode='sample', sample_rate=1.0).should_capture(failed=False))
+        self.assertFalse(DebugArtifacts(mode='sample', sample_rate=0.0).should_capture(failed=False))
+        with self.assertRaises(ValueError):
+            DebugArtifacts(mode='always')
+
+    def test_write_compressed(self):
+        """HTML은 gzip으로 저장"""
+        artifacts = DebugArtifacts(directory=self.temp_dir.name)
+        artifacts._write('kbo_official_20241015_fail', '<html>경기</html>', b'\xff\xd8')
+
+        with gzip.open(os.path.join(self.temp_dir.name, 'kbo_official_20241015_fail.html.gz'), 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), '<html>경기</html>')
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, 'kbo_official_20241015_fail.jpg')))
+
+    def test_retention_removes_oldest(self):
+        """파일 수 한도를 넘으면 오래된 파일부터 삭제"""
+        artifacts = DebugArtifacts(directory=self.temp_dir.name, max_files=2)
+        for i in range(4):
+            path = os.path.join(self.temp_dir.name, f'{i}.jpg')
+            with open(path, 'wb') as f:
+                f.write(b'x')
+            os.utime(path, (i, i))
+
+        self.assertEqual(artifacts.enforce_retention(), 2)
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ['2.jpg', '3.jpg'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+import unittest
+import json
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.endpoint_discovery import EndpointDiscovery, find_games, extract_games
+from src.source_orchestrator import validate_games
+from src.http_client import HttpClient
+from src.source_health import SourceHealth
+
+GAMES = {'result': {'games': [
+    {'gameDate': '20241015', 'awayTeamName': 'KIA', 'homeTeamName': 'LG', 'awayTeamScore': 5, 'homeTeamScore': 3},
+    {'gameDate': '20241015', 'awayTeamName': 'NC', 'homeTeamName': 'KT', 'awayTeamScore': None, 'homeTeamScore': None},
+]}}
+
+class ProbeHandler(BaseHTTPRequestHandler):
+    """후보 엔드포인트 흉내 - /slow는 늦게, /html은 HTML, /games는 경기 JSON"""
+    protocol_version = 'HTTP/1.1'
+    calls = []
+    broken = False
+    unavailable = False
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        ProbeHandler.calls.append(path)
+        if path == '/slow':
+            time.sleep(1)
+        if path == '/missing' or (path == '/games' and ProbeHandler.broken):
+            self.reply(404, b'not found', 'text/plain')
+        elif path == '/games' and ProbeHandler.unavailable:
+            self.reply(503, b'unavailable', 'text/plain')
+        elif path == '/html':
+            self.reply(200, b'<html></html>', 'text/html')
+        elif path == '/other':
+            self.reply(200, json.dumps({'list': [{'name': 'x'}]}).encode(), 'application/json')
+        else:
+            self.reply(200, json.dumps(GAMES).encode(), 'application/json')
+
+    def reply(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class SlowLimiter:
+    """요청마다 일정 시간 기다리는 속도 제한기"""
+
+    def __init__(self, wait):
+        self.wait = wait
+        self.urls = []
+
+    def acquire(self, url):
+        self.urls.append(url)
+        time.sleep(self.wait)
+        return self.wait
+
+class TestSchema(unittest.TestCase):
+    def test_find_games(self):
+        path, mapping = find_games(GAMES)
+        self.assertEqual(path, ['result', 'games'])
+        self.assertEqual(mapping['away_team'], 'awayTeamName')
+        self.assertEqual(mapping['home_score'], 'homeTeamScore')
+        self.assertEqual(mapping['date'], 'gameDate')
+
+    def test_rejects_other_shapes(self):
+        self.assertIsNone(find_games({'list': [{'name': 'x'}]}))
+        self.assertIsNone(find_games({'games': []}))
+
+    def test_extract_games(self):
+        """점수가 없는 경기와 다른 날짜 경기는 제외"""
+        path, mapping = find_games(GAMES)
+        games = extract_games(GAMES, path, mapping, datetime(2024, 10, 15))
+        self.assertEqual(len(games), 1)
+        self.assertEqual(games[0]['winner'], 'KIA')
+        self.assertEqual(extract_games(GAMES, path, mapping, datetime(2024, 10, 16)), [])
+
+        with self.assertRaises(ValueError):
+            extract_games({'data': []}, path, mapping, datetime(2024, 10, 15))
+
+    def test_extract_canonical_final_games(self):
+        """팀 이름은 정규 이름으로, 종료되지 않은 경기와 알 수 없는 팀은 제외"""
+        data = {'games': [
+            {'gameDate': '20241015', 'awayTeamName': 'KIA 타이거즈', 'homeTeamName': 'LG트윈스',
+             'awayTeamScore': 5, 'homeTeamScore': 3, 'statusCode': 'RESULT'},
+            {'gameDate': '20241015', 'awayTeamName': 'NC', 'homeTeamName': 'KT',
+             'awayTeamScore': 0, 'homeTeamScore': 0, 'statusCode': 'BEFORE'},
+            {'gameDate': '20241015', 'awayTeamName': '드림', 'homeTeamName': '나눔',
+             'awayTeamScore': 4, 'homeTeamScore': 2, 'statusCode': 'RESULT'},
+        ]}
+        path, mapping = find_games(data)
+        self.assertEqual(mapping['status'], 'statusCode')
+
+        date = datetime(2024, 10, 15)
+        games = extract_games(data, path, mapping, date)
+        self.assertEqual([(g['away_team'], g['home_team'], g['winner']) for g in games], [('KIA', 'LG', 'KIA')])
+        self.assertTrue(validate_games(games, date))
+
+        # 상태 필드가 없던 예전 매핑은 0:0 경기를 제외
+        del mapping['status']
+        self.assertEqual(len(extract_games(data, path, mapping, date)), 1)
+
+class TestEndpointDiscovery(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ProbeHandler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ProbeHandler.calls = []
+        ProbeHandler.broken = False
+        ProbeHandler.unavailable = False
+        self.temp_dir = tempfile.TemporaryDirectory()
+        candidates = [{'url': self.base + path, 'params': {'date': '{date}'}}
+                      for path in ['/missing', '/html', '/other', '/slow', '/games']]
+        self.discovery = EndpointDiscovery(
+            candidates,
+            path=os.path.join(self.temp_dir.name, 'api_endpoint.json'),
+            http=HttpClient(timeout=(1, 2), retries=0),
+            health=SourceHealth(path=os.path.join(self.temp_dir.name, 'source_health.json'))
+        )
+        self.date = datetime(2024, 10, 15)
+
+    def tearDown(self):
+        self.discovery.http.close()
+        self.temp_dir.cleanup()
+
+    def test_discover_concurrently(self):
+        """모든 후보를 동시에 조회하고 가장 빠른 유효 엔드포인트 저장"""
+        start = time.perf_counter()
+        endpoint = self.discovery.discover(self.date)
+
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertEqual(endpoint['url'], self.base + '/games')
+        self.assertEqual(endpoint['path'], ['result', 'games'])
+        self.assertEqual(self.discovery.load()['mapping'], endpoint['mapping'])
+        errors = {result['url'].rsplit('/', 1)[1]: result.get('error') for _, result in self.discovery.last_report}
+        self.assertEqual(errors['missing'], 'HTTP 404')
+        self.assertEqual(errors['html'], 'JSON 아님')
+
+    def test_latency_excludes_rate_limit_wait(self):
+        """응답 시간은 속도 제한 대기가 끝난 뒤부터 잼"""
+        self.discovery.limiter = SlowLimiter(0.5)
+        result = self.discovery.probe({'url': self.base + '/games'}, self.date)
+
+        self.assertTrue(result['ok'])
+        self.assertLess(result['latency_ms'], 400)
+        self.assertEqual(self.discovery.limiter.urls, [self.base + '/games'])
+
+    def test_reuses_saved_endpoint(self):
+        """저장된 엔드포인트가 있으면 탐색 없이 바로 조회"""
+        self.discovery.discover(self.date)
+        ProbeHandler.calls = []
+
+        games = self.discovery.get_game_results(self.date)
+
+        self.assertEqual(len(games), 1)
+        self.assertEqual(ProbeHandler.calls, ['/games'])
+
+    def test_reprobe_when_endpoint_breaks(self):
+        """저장된 엔드포인트가 실패하면 다시 탐색"""
+        self.discovery.discover(self.date)
+        ProbeHandler.broken = True
+
+        games = self.discovery.get_game_results(self.date)
+
+        self.assertEqual(games[0]['away_team'], 'KIA')
+        self.assertEqual(self.discovery.load()['url'], self.base + '/slow')
+
+    def test_keeps_endpoint_on_server_error(self):
+        """5xx는 이번 실행의 실패로만 기록하고 저장된 엔드포인트는 유지"""
+        self.discovery.discover(self.date)
+        ProbeHandler.unavailable = True
+        ProbeHandler.calls = []
+
+        self.assertEqual(self.discovery.get_game_results(self.date), [])
+        self.assertEqual(ProbeHandler.calls, ['/games'])
+        self.assertEqual(self.discovery.load()['url'], self.base + '/games')
+
+if __name__ == '__main__':
+    unittest.main()
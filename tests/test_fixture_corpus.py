@@ -0,0 +1,24 @@
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from corpus import CORPUS_DIR, PARSERS, load_manifest, run_entry, summarize
+
+class TestFixtureCorpus(unittest.TestCase):
+    def test_manifest_entries(self):
+        entries = load_manifest()
+        self.assertTrue(entries)
+        for entry in entries:
+            self.assertIn(entry['parser'], PARSERS)
+            self.assertTrue(os.path.exists(os.path.join(CORPUS_DIR, entry['file'])), entry['file'])
+
+    def test_parsers_match_expected_games(self):
+        # 파서 동작을 의도적으로 바꿨다면 benchmarks/corpus.py refresh로 기대 결과 갱신
+        for entry in load_manifest():
+            with self.subTest(file=entry['file'], parser=entry['parser']):
+                self.assertEqual(summarize(run_entry(entry)), entry['games'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from datetime import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.game_identity import GameSet, dedupe_games
+from src.kbo_official_crawler import KBOOfficialCrawler
+
+def game(away, home, away_score, home_score, date='2024-10-15'):
+    return {
+        'date': date,
+        'away_team': away,
+        'home_team': home,
+        'away_score': away_score,
+        'home_score': home_score,
+        'winner': away if away_score > home_score else home
+    }
+
+class TestGameSet(unittest.TestCase):
+    def test_same_game_once(self):
+        games = GameSet()
+        self.assertTrue(games.add(game('KIA', 'LG', 5, 3)))
+        self.assertFalse(games.add(game('KIA', 'LG', 5, 3)))
+        # 별칭도 같은 팀 ID
+        self.assertFalse(games.add(game('KIA타이거즈', 'LG트윈스', 5, 3)))
+        self.assertTrue(games.add(game('KIA', 'LG', 5, 3, date='2024-10-16')))
+        self.assertEqual(len(games), 2)
+        self.assertIn(game('KIA', 'LG', 5, 3), games)
+
+    def test_doubleheader(self):
+        games = GameSet()
+        self.assertTrue(games.add(game('두산', '한화', 2, 1)))
+        self.assertTrue(games.add(game('두산', '한화', 0, 4)))
+        self.assertFalse(games.add(game('두산', '한화', 2, 1)))
+        self.assertEqual(games.key(games.games[1], 2), ('2024-10-15', 8, 4, 2))
+
+        # 경기 번호를 주는 소스는 점수가 같은 더블헤더도 구분
+        numbered = GameSet()
+        self.assertTrue(numbered.add(game('두산', '한화', 3, 3), game_no=1))
+        self.assertTrue(numbered.add(game('두산', '한화', 3, 3), game_no=2))
+        self.assertFalse(numbered.add(game('두산', '한화', 3, 3), game_no=2))
+        self.assertEqual(len(numbered), 2)
+
+    def test_dedupe_games_keeps_order(self):
+        first = [game('KIA', 'LG', 5, 3), game('NC', 'SSG', 2, 4)]
+        second = [game('NC', 'SSG랜더스', 2, 4), game('KT', '삼성', 3, 3)]
+        merged = dedupe_games(first, second)
+        self.assertEqual([g['away_team'] for g in merged], ['KIA', 'NC', 'KT'])
+
+class TestNoisyPage(unittest.TestCase):
+    def test_repeated_score_text(self):
+        # 중첩된 표마다 같은 점수 텍스트가 수백 번 반복되는 페이지
+        cells = '<tr><td>SSG 5 : 3 LG</td><td>랜더스 5 : 3 트윈스</td><td>두산 2 - 1 한화</td></tr>' * 500
+        html = f'<table>{cells}<tr><td><table>{cells}</table></td></tr></table>'
+        crawler = KBOOfficialCrawler()
+        crawler.parse_cache = None
+        games = crawler._parse_with_beautifulsoup(html, datetime(2024, 10, 15))
+        self.assertEqual([(g['away_team'], g['home_team']) for g in games], [('SSG', 'LG'), ('두산', '한화')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+import unittest
+import asyncio
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.http_cache import HttpCache, cache_key, is_final_date, is_final_month, invalidate_page, request_period
+from src.http_client import HttpClient
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """ETag가 맞으면 304, 아니면 200을 돌려주는 로컬 서버"""
+    protocol_version = 'HTTP/1.1'
+    calls = 0
+    etag = '"v1"'
+
+    def do_GET(self):
+        ETagHandler.calls += 1
+        if self.headers.get('If-None-Match') == ETagHandler.etag:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = f'결과 {self.path}'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', ETagHandler.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestHttpCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ETagHandler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ETagHandler.calls = 0
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(directory=self.temp_dir.name)
+        self.client = HttpClient(cache=self.cache)
+
+    def tearDown(self):
+        self.client.close()
+        self.temp_dir.cleanup()
+
+    def test_conditional_revalidation(self):
+        """두 번째 요청은 If-None-Match로 재검증하고 캐시 본문 사용"""
+        first = self.client.get(self.base + '/schedule', params={'date': '20241015'})
+        second = self.client.get(self.base + '/schedule', params={'date': '20241015'})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.text, first.text)
+        self.assertEqual(ETagHandler.calls, 2)
+        self.assertEqual((self.cache.misses, self.cache.revalidated), (1, 1))
+
+    def test_frozen_skips_network(self):
+        """동결된 응답은 네트워크 없이 반환"""
+        self.client.get(self.base + '/final', freeze=True)
+        response = self.client.get(self.base + '/final', freeze=True)
+
+        self.assertEqual(response.text, '결과 /final')
+        self.assertEqual(ETagHandler.calls, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.hit_rate(), 0.5)
+
+    def test_key_includes_params(self):
+        """파라미터가 다르면 다른 항목"""
+        self.client.get(self.base + '/schedule', params={'date': '20241015'}, freeze=True)
+        self.client.get(self.base + '/schedule', params={'date': '20241016'}, freeze=True)
+        self.assertEqual(ETagHandler.calls, 2)
+
+    def test_final_dates(self):
+        today = datetime.now()
+        self.assertTrue(is_final_date(today - timedelta(days=30)))
+        self.assertFalse(is_final_date(today - timedelta(days=1)))
+        self.assertFalse(is_final_month(today.year, today.month))
+        self.assertTrue(is_final_month(2024, 10))
+
+class FakeRequest:
+    def __init__(self, url, post_data=None):
+        self.url = url
+        self.method = 'POST' if post_data else 'GET'
+        self.resource_type = 'xhr' if post_data else 'document'
+        self.post_data_buffer = post_data
+        self.headers = {}
+
+class FakeResponse:
+    status = 200
+    headers = {'content-type': 'text/html'}
+
+    async def body(self):
+        return '동의 화면'.encode('utf-8')
+
+class FakeRoute:
+    """브라우저 라우팅 대신 쓰는 route (네트워크 요청 수만 셈)"""
+
+    def __init__(self, url, page, post_data=None):
+        self.request = FakeRequest(url, post_data)
+        self.page = page
+
+    async def fetch(self, headers=None):
+        self.page.fetches += 1
+        return FakeResponse()
+
+    async def fulfill(self, status, headers, body):
+        self.page.bodies.append(body)
+
+    async def fallback(self):
+        pass
+
+class FakePage:
+    def __init__(self):
+        self.url = 'https://example.com/schedule?date=20241015'
+        self.handler = None
+        self.fetches = 0
+        self.bodies = []
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+    def load(self, url=None, post_data=None):
+        asyncio.run(self.handler(FakeRoute(url or self.url, self, post_data)))
+
+class FakeLimiter:
+    def __init__(self):
+        self.urls = []
+
+    async def acquire_async(self, url):
+        self.urls.append(url)
+        return 0
+
+class TestFrozenPage(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(directory=self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def open_page(self, limiter=None):
+        page = FakePage()
+        asyncio.run(self.cache.attach(page, freeze=True, limiter=limiter))
+        return page
+
+    def test_empty_result_drops_frozen_response(self):
+        """결과가 빈 페이지의 동결 응답은 삭제돼 다음 페이지에서 다시 받음"""
+        page = self.open_page()
+        page.load()
+        second = self.open_page()
+        second.load()
+        self.assertEqual((page.fetches, second.fetches), (1, 0))
+
+        self.assertEqual(invalidate_page(second), 1)
+        third = self.open_page()
+        third.load()
+        self.assertEqual(third.fetches, 1)
+
+        # 삭제 뒤 같은 페이지에서 다시 동결한 응답도 삭제 대상
+        second.load()
+        self.assertEqual(invalidate_page(second), 1)
+        self.assertEqual(invalidate_page(second), 0)
+
+    def test_limiter_only_on_network(self):
+        """동결 응답 적중은 속도 제한 대기 없이, 미스만 속도 제한을 거침"""
+        limiter = FakeLimiter()
+        self.open_page(limiter).load()
+        self.open_page(limiter).load()
+        self.assertEqual(limiter.urls, ['https://example.com/schedule?date=20241015'])
+
+    def test_freezes_only_final_period(self):
+        """동결 페이지라도 이번 달을 요청하는 XHR은 동결하지 않음"""
+        now = datetime.now()
+        xhr = 'https://example.com/ws/Schedule.asmx/GetScheduleList'
+        current = f'leId=1&srIdList=0,9&seasonId={now.year}&gameMonth={now.month:02d}'.encode()
+        past = b'leId=1&srIdList=0,9&seasonId=2024&gameMonth=09'
+        for _ in range(2):
+            page = self.open_page()
+            page.load(xhr, current)
+            page.load(xhr, past)
+            page.load('https://example.com/schedule/schedule.aspx')
+        # 이번 달 XHR과 쿼리 없는 문서는 매번 네트워크, 지난달 XHR은 두 번째부터 캐시
+        self.assertEqual(page.fetches, 2)
+
+    def test_stale_frozen_entry_is_not_served(self):
+        """예전에 동결돼 저장된 이번 달 응답은 적중으로 쓰지 않음"""
+        now = datetime.now()
+        url = f'https://example.com/schedule?date={now.strftime("%Y%m%d")}'
+        self.cache.store(cache_key('GET', url), 'GET', url, 200, {}, b'stale', frozen=True)
+        page = self.open_page()
+        page.load(url)
+        self.assertEqual((page.fetches, page.bodies), (1, ['동의 화면'.encode('utf-8')]))
+
+    def test_request_period(self):
+        self.assertEqual(request_period('https://example.com/schedule?date=20241015'), datetime(2024, 10, 15))
+        self.assertEqual(request_period('https://example.com/x', b'seasonId=2024&gameMonth=02'), datetime(2024, 2, 29))
+        self.assertEqual(request_period('https://example.com/schedule.aspx?year=2024&month=09'), datetime(2024, 9, 30))
+        self.assertIsNone(request_period('https://example.com/schedule.aspx'))
+
+    def test_untouched_page(self):
+        self.assertEqual(invalidate_page(self.open_page()), 0)
+
+if __name__ == '__main__':
+    unittest.main()
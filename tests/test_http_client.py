@@ -0,0 +1,92 @@
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.http_client import HttpClient, LatencyHistogram
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """처음 fail_count번은 503, 이후 200을 돌려주는 로컬 서버"""
+    protocol_version = 'HTTP/1.1'
+    fail_count = 0
+    calls = 0
+
+    def do_GET(self):
+        FlakyHandler.calls += 1
+        status = 503 if FlakyHandler.calls <= FlakyHandler.fail_count else 200
+        body = b'ok'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestHttpClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/schedule"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        FlakyHandler.calls = 0
+        self.client = HttpClient(backoff_base=0.01, retries=2)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_retry_on_5xx(self):
+        """503 두 번 후 성공"""
+        FlakyHandler.fail_count = 2
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        histogram = self.client.histograms[self.url.rsplit('/', 1)[0]]
+        self.assertEqual(histogram.count, 3)
+        self.assertEqual(histogram.retries, 2)
+        self.assertEqual(histogram.errors, 0)
+
+    def test_give_up_after_retries(self):
+        """재시도 한도를 넘으면 마지막 응답 반환"""
+        FlakyHandler.fail_count = 10
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(FlakyHandler.calls, 3)
+
+    def test_default_timeout(self):
+        """타임아웃을 주지 않아도 기본 (연결, 읽기) 타임아웃 적용"""
+        FlakyHandler.fail_count = 0
+        captured = {}
+        session = self.client._session(self.url.rsplit('/', 1)[0])
+        original = session.request
+
+        def request(method, url, **kwargs):
+            captured.update(kwargs)
+            return original(method, url, **kwargs)
+
+        session.request = request
+        self.client.get(self.url)
+        self.assertEqual(captured['timeout'], self.client.timeout)
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentile(self):
+        histogram = LatencyHistogram(buckets=[100, 500])
+        for elapsed_ms in [10, 20, 30, 400, 900]:
+            histogram.record(elapsed_ms)
+
+        self.assertEqual(histogram.counts, [3, 1, 1])
+        self.assertEqual(histogram.percentile(0.5), 100)
+        self.assertEqual(histogram.percentile(0.95), float('inf'))
+
+if __name__ == '__main__':
+    unittest.main()
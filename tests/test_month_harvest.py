@@ -0,0 +1,57 @@
+import unittest
+import asyncio
+from datetime import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.unified_crawler import UnifiedCrawler
+from src.parser import GameParser
+from src.source_orchestrator import NoGames
+
+GAME = {'date': '2024-09-10', 'away_team': 'KIA', 'home_team': 'LG',
+        'away_score': 5, 'home_score': 3, 'winner': 'KIA'}
+
+class TestHarvestedGames(unittest.TestCase):
+    def setUp(self):
+        self.crawler = UnifiedCrawler(harvest=True)
+        self.crawler._month_harvests[(2024, 9)] = {
+            'harvested_at': '2024-10-01T10:00:00',
+            'first_day': '2024-09-03',
+            'last_day': '2024-09-28',
+            'days': {'2024-09-10': [GAME]}
+        }
+
+    def test_harvested_day(self):
+        self.assertEqual(self.crawler._get_harvested_games(datetime(2024, 9, 10)), [GAME])
+
+    def test_off_day_inside_schedule(self):
+        """일정 표 범위 안에서 경기가 없는 날은 빈 목록"""
+        self.assertEqual(self.crawler._get_harvested_games(datetime(2024, 9, 9)), [])
+        # 소스 경합에서는 경기 없음이 확인된 결과
+        games = asyncio.run(self.crawler._get_from_month_harvest(datetime(2024, 9, 9)))
+        self.assertIsInstance(games, NoGames)
+
+    def test_day_outside_schedule_is_unknown(self):
+        """수확한 일정 표가 다루지 않은 날짜는 None (일 단위로 다시 크롤링)"""
+        self.assertIsNone(self.crawler._get_harvested_games(datetime(2024, 9, 1)))
+        self.assertIsNone(self.crawler._get_harvested_games(datetime(2024, 9, 30)))
+
+    def test_old_harvest_without_range(self):
+        del self.crawler._month_harvests[(2024, 9)]['first_day']
+        self.assertEqual(self.crawler._get_harvested_games(datetime(2024, 9, 10)), [GAME])
+        self.assertIsNone(self.crawler._get_harvested_games(datetime(2024, 9, 9)))
+
+class TestScheduleDates(unittest.TestCase):
+    def test_rows_include_unfinished_games(self):
+        payload = {'rows': [
+            {'row': [{'Class': 'day', 'Text': '09.03(화)'}, {'Class': 'play', 'Text': 'KIA<em>5vs3</em>LG'}]},
+            {'row': [{'Class': 'day', 'Text': '09.04(수)'}, {'Class': 'play', 'Text': 'KIAvsLG'}]},
+        ]}
+        parser = GameParser()
+        self.assertEqual(parser.schedule_dates(payload, 2024), ['2024-09-03', '2024-09-04'])
+        self.assertTrue(parser.covers_date(payload, datetime(2024, 9, 4)))
+        self.assertFalse(parser.covers_date(payload, datetime(2024, 9, 5)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import asyncio
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.page_readiness import PageReadiness
+
+class FakePage:
+    """신호별 도착 시간(초)을 정해 두는 페이지 (None이면 오지 않음)"""
+
+    def __init__(self, selector=None, response=None, stable=None):
+        self.delays = {'selector': selector, 'response': response, 'stable': stable}
+
+    async def _arrive(self, name, timeout):
+        delay = self.delays[name]
+        if delay is None or delay * 1000 > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(name)
+        await asyncio.sleep(delay)
+        return name
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        return await self._arrive('selector', timeout)
+
+    async def wait_for_event(self, event, predicate=None, timeout=None):
+        return await self._arrive('response', timeout)
+
+    async def wait_for_function(self, script, arg=None, polling=None, timeout=None):
+        return await self._arrive('stable', timeout)
+
+def wait(page, source, rule):
+    async def run():
+        readiness = PageReadiness(page, source)
+        readiness.rule = rule
+        return await readiness.arm().wait()
+    return asyncio.run(run())
+
+class TestPageReadiness(unittest.TestCase):
+    UPDATE_RULE = {'response': '/GetScheduleList', 'stable_ms': 300, 'timeout': 400}
+
+    def test_quiet_dom_does_not_beat_pending_response(self):
+        """데이터 응답을 기다리는 규칙에서는 DOM이 먼저 조용해져도 응답을 기다림"""
+        page = FakePage(response=0.1, stable=0.01)
+        self.assertEqual(wait(page, 'kbo_schedule_update', self.UPDATE_RULE), 'response')
+
+    def test_dom_stable_is_timeout_fallback(self):
+        """응답이 끝내 오지 않으면 DOM 안정으로 진행"""
+        page = FakePage(stable=0.01)
+        self.assertEqual(wait(page, 'kbo_schedule_update', self.UPDATE_RULE), 'dom_stable')
+
+    def test_dom_stable_wins_without_response_rule(self):
+        """데이터 응답이 없는 규칙은 DOM 안정도 동등한 신호"""
+        page = FakePage(selector=0.2, stable=0.01)
+        rule = {'selector': 'div.tb_wrap', 'stable_ms': 500, 'timeout': 400}
+        self.assertEqual(wait(page, 'naver_schedule', rule), 'dom_stable')
+
+    def test_timeout(self):
+        self.assertIsNone(wait(FakePage(), 'kbo_schedule_update', self.UPDATE_RULE))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from datetime import datetime
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parse_cache import ParseCache, cached_parse
+
+PAGE = '<table><tr><td>KIA 5 : 3 LG</td></tr></table>'
+
+class CountingParser:
+    """호출 횟수를 세는 파서"""
+
+    def __init__(self, parse_cache):
+        self.parse_cache = parse_cache
+        self.calls = 0
+
+    @cached_parse('CountingParser.parse')
+    def parse(self, html, date):
+        self.calls += 1
+        return [{'date': date.strftime('%Y-%m-%d'), 'away_team': 'KIA', 'home_team': 'LG',
+                 'away_score': 5, 'home_score': 3, 'winner': 'KIA', 'size': len(html)}]
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(directory=self.tmp.name)
+        self.date = datetime(2024, 10, 15)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_same_content_is_parsed_once(self):
+        parser = CountingParser(self.cache)
+        first = parser.parse(PAGE, self.date)
+        second = parser.parse(PAGE, self.date)
+
+        self.assertEqual(first, second)
+        self.assertEqual(parser.calls, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        # 다른 프로세스(새 인스턴스)도 디스크의 결과를 사용
+        other = CountingParser(ParseCache(directory=self.tmp.name))
+        self.assertEqual(other.parse(PAGE, self.date), first)
+        self.assertEqual(other.calls, 0)
+
+    def test_changed_content_or_date_is_parsed_again(self):
+        parser = CountingParser(self.cache)
+        parser.parse(PAGE, self.date)
+        parser.parse(PAGE + ' ', self.date)
+        parser.parse(PAGE, datetime(2024, 10, 16))
+        self.assertEqual(parser.calls, 3)
+
+    def test_parser_version_is_part_of_key(self):
+        key = self.cache.key('CountingParser.parse', 'v1', PAGE, '2024-10-15')
+        self.assertNotEqual(key, self.cache.key('CountingParser.parse', 'v2', PAGE, '2024-10-15'))
+        self.assertNotEqual(key, self.cache.key('Other.parse', 'v1', PAGE, '2024-10-15'))
+
+    def test_disabled_cache(self):
+        parser = CountingParser(None)
+        parser.parse(PAGE, self.date)
+        parser.parse(PAGE, self.date)
+        self.assertEqual(parser.calls, 2)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_size_eviction_keeps_recent_entries(self):
+        cache = ParseCache(directory=self.tmp.name, max_bytes=2000)
+        games = [{'away_team': 'KIA', 'filler': 'x' * 400}]
+        keys = [cache.key('p', 'v', f'page {i}', '2024-10-15') for i in range(10)]
+
+        base = time.time() - 1000
+        for index, key in enumerate(keys):
+            cache.store(key, games)
+            # 파일 시각 순서를 분명히 함 (방금 저장한 항목이 가장 최근)
+            if os.path.exists(cache._path(key)):
+                os.utime(cache._path(key), (base + index, base + index))
+
+        files = os.listdir(self.tmp.name)
+        total = sum(os.path.getsize(os.path.join(self.tmp.name, name)) for name in files)
+        self.assertLessEqual(total, 2000)
+        self.assertIsNotNone(cache.lookup(keys[-1]))
+        self.assertIsNone(cache.lookup(keys[0]))
+
+if __name__ == '__main__':
+    unittest.main()
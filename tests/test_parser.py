@@ -0,0 +1,92 @@
+import unittest
+from datetime import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parser import GameParser, make_soup, NAVER_SCHEDULE_STRAINER
+
+# KBO 일정 페이지 XHR(GetScheduleList) 응답 형태
+SCHEDULE_ROWS = {
+    'rows': [
+        {'row': [
+            {'Text': '<b>10.15(화)</b>', 'Class': 'day', 'RowSpan': '2'},
+            {'Text': '<b>18:30</b>', 'Class': 'time'},
+            {'Text': '<span>KIA</span><em><span class="win">5</span><span>vs</span><span class="lose">3</span></em><span>LG</span>', 'Class': 'play'},
+        ]},
+        {'row': [
+            {'Text': '<b>18:30</b>', 'Class': 'time'},
+            {'Text': '<span>두산</span><em><span>vs</span></em><span>한화</span>', 'Class': 'play'},
+        ]},
+        {'row': [
+            {'Text': '<b>10.16(수)</b>', 'Class': 'day', 'RowSpan': '1'},
+            {'Text': '<b>18:30</b>', 'Class': 'time'},
+            {'Text': '<span>NC</span><em><span class="lose">2</span><span>vs</span><span class="win">4</span></em><span>SSG</span>', 'Class': 'play'},
+        ]},
+    ]
+}
+
+class TestKBOScheduleRows(unittest.TestCase):
+    def setUp(self):
+        self.parser = GameParser()
+
+    def test_parse_single_day(self):
+        """요청한 날짜의 종료 경기만 반환"""
+        games = self.parser.parse_kbo_official(SCHEDULE_ROWS, datetime(2024, 10, 15))
+
+        self.assertEqual(len(games), 1)
+        self.assertEqual(games[0]['date'], '2024-10-15')
+        self.assertEqual(games[0]['away_team'], 'KIA')
+        self.assertEqual(games[0]['home_team'], 'LG')
+        self.assertEqual(games[0]['away_score'], 5)
+        self.assertEqual(games[0]['home_score'], 3)
+        self.assertEqual(games[0]['winner'], 'KIA')
+        self.assertEqual(games[0]['game_time'], '18:30')
+
+    def test_parse_whole_month(self):
+        """월 전체 응답을 경기 날짜별로 분리"""
+        games = self.parser.parse_kbo_official(SCHEDULE_ROWS, datetime(2024, 10, 1), whole_month=True)
+
+        self.assertEqual([g['date'] for g in games], ['2024-10-15', '2024-10-16'])
+        self.assertEqual(games[1]['winner'], 'SSG')
+
+# 일정 표 앞뒤로 기사 목록이 붙은 네이버 스포츠 페이지 형태
+NAVER_HTML = (
+    '<html><body><div class="news"><table class="ad"><tr><td>광고</td></tr></table></div>'
+    '<div class="sch_tb wide"><span class="team_lft">KIA타이거즈</span><strong class="td_score">5</strong>'
+    '<strong class="td_score">3</strong><span class="team_rgt">LG트윈스</span><span class="td_hour">종료</span></div>'
+    '<div class="sch_tb"><span class="team_lft">NC</span><strong class="td_score">2</strong>'
+    '<strong class="td_score">4</strong><span class="team_rgt">SSG</span><span class="td_hour">종료</span></div>'
+    '<table class="tb_sc"><tr><td><span class="team_name">두산</span></td></tr></table>'
+    '<div class="footer">푸터</div></body></html>'
+)
+
+class TestParserBackend(unittest.TestCase):
+    def setUp(self):
+        self.parser = GameParser(backend='lxml')
+        self.parser.parse_cache = None
+        self.parser.selector_stats = None
+
+    def test_backends_agree(self):
+        """lxml 부분 트리와 html.parser 전체 트리의 파싱 결과가 같음"""
+        date = datetime(2024, 10, 15)
+        games = self.parser.parse_naver_sports(NAVER_HTML, date)
+
+        self.assertEqual([(g['away_team'], g['winner']) for g in games], [('KIA', 'KIA'), ('NC', 'SSG')])
+
+        full_tree_parser = GameParser(backend='html.parser')
+        full_tree_parser.parse_cache = None
+        full_tree_parser.selector_stats = None
+        full_tree = full_tree_parser.parse_naver_sports(NAVER_HTML, date)
+        self.assertEqual(full_tree, games)
+
+    def test_strainer_keeps_only_schedule(self):
+        """여러 클래스를 가진 요소도 맞추고, 나머지 트리는 만들지 않음"""
+        soup = make_soup(NAVER_HTML, NAVER_SCHEDULE_STRAINER, backend='lxml')
+
+        self.assertEqual(len(soup.find_all('table', class_='tb_sc')), 1)
+        self.assertIsNone(soup.find('div', class_='footer'))
+        self.assertIsNone(soup.find('table', class_='ad'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rate_limiter import RateLimiter
+
+def reserve_in_process(db_path):
+    """다른 프로세스에서 같은 파일로 토큰 예약"""
+    limiter = RateLimiter(db_path=db_path, limits={'example.com': (10, 2)})
+    return [limiter.reserve('https://example.com/a') for _ in range(3)]
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'rate.sqlite3')
+        self.limiter = RateLimiter(db_path=self.db_path, limits={'example.com': (10, 2)}, default=(0, 0))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_burst_then_wait(self):
+        """버스트만큼은 바로, 이후는 초당 요청 수에 맞춰 대기"""
+        # 예약 사이에 흐른 시간만큼 토큰이 차므로, 부하가 걸려도 오차가 작도록 초당 1건으로
+        limiter = RateLimiter(db_path=self.db_path, limits={'example.com': (1, 2)})
+        waits = [limiter.reserve('https://www.example.com/schedule') for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 1.0, delta=0.05)
+        self.assertAlmostEqual(waits[3], 2.0, delta=0.05)
+
+    def test_limit_lookup(self):
+        """하위 도메인은 상위 도메인 설정, 나머지는 기본값"""
+        self.assertEqual(self.limiter.limit_for('m.example.com:443'), (10, 2))
+        self.assertEqual(self.limiter.limit_for('notexample.com'), (0, 0))
+        self.assertEqual(self.limiter.reserve('https://other.org/'), 0.0)
+
+    def test_shared_across_instances(self):
+        """같은 파일을 쓰는 다른 인스턴스(프로세스)와 버킷 공유"""
+        other = RateLimiter(db_path=self.db_path, limits={'example.com': (10, 2)})
+        self.limiter.reserve('https://example.com/a')
+        other.reserve('https://example.com/b')
+
+        self.assertGreater(self.limiter.reserve('https://example.com/c'), 0.05)
+
+    def test_shared_across_processes(self):
+        """워커 프로세스 두 개가 버스트를 나눠 씀"""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(reserve_in_process, [self.db_path] * 2))
+
+        waits = sorted(w for result in results for w in result)
+        self.assertEqual(waits.count(0.0), 2)
+        self.assertGreater(waits[-1], 0.3)
+
+    def test_acquire_async(self):
+        """비동기 대기도 같은 간격을 지킴"""
+        async def run():
+            start = time.perf_counter()
+            await asyncio.gather(*(self.limiter.acquire_async('https://example.com/') for _ in range(4)))
+            return time.perf_counter() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.19)
+        self.assertGreater(self.limiter.waited, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.request_blocking import RequestBlocker
+
+class TestRequestBlocker(unittest.TestCase):
+    def setUp(self):
+        self.blocker = RequestBlocker('default')
+
+    def test_document_and_data_allowed(self):
+        """메인 문서와 일정 데이터 XHR은 허용"""
+        self.assertIsNone(self.blocker.block_reason('https://www.koreabaseball.com/Schedule/Schedule.aspx', 'document'))
+        self.assertIsNone(self.blocker.block_reason('https://www.koreabaseball.com/ws/Schedule.asmx/GetScheduleList', 'xhr'))
+        self.assertIsNone(self.blocker.block_reason('https://ssl.pstatic.net/static/app.js', 'script'))
+
+    def test_blocked_requests(self):
+        """리소스 유형, 추적 도메인, 제3자 도메인 차단"""
+        self.assertEqual(self.blocker.block_reason('https://www.koreabaseball.com/logo.png', 'image'), 'type')
+        self.assertEqual(self.blocker.block_reason('https://www.googletagmanager.com/gtm.js', 'script'), 'tracker')
+        self.assertEqual(self.blocker.block_reason('https://wcs.naver.net/wcslog.js', 'script'), 'tracker')
+        self.assertEqual(self.blocker.block_reason('https://ads.example.com/ad.js', 'script'), 'third_party')
+
+    def test_off_profile(self):
+        """off 프로필은 아무것도 차단하지 않음"""
+        blocker = RequestBlocker('off')
+        self.assertFalse(blocker.enabled)
+        self.assertIsNone(blocker.block_reason('https://ads.example.com/ad.png', 'image'))
+
+if __name__ == '__main__':
+    unittest.main()
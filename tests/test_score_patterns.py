@@ -0,0 +1,137 @@
+import unittest
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.score_patterns import search_score, parse_score, find_scores, SCORE_JS
+
+# 이전 KBOOfficialCrawler._parse_with_beautifulsoup의 셀별 세 번 검색
+LEGACY_PATTERNS = [
+    r'(\w+)\s+(\d+)\s*:\s*(\d+)\s+(\w+)',
+    r'(\w+)\s+(\d+)\s*-\s*(\d+)\s+(\w+)',
+    r'(\w+)\s+(\d+)\s+vs\s+(\d+)\s+(\w+)',
+]
+
+# 이전 UnifiedCrawler._extract_games_data의 페이지 안 패턴 (구분자별 전역 검색 결과를 모두 모음)
+LEGACY_UNIFIED_PATTERNS = [
+    r'([A-Za-z가-힣]+)\s*(\d+)\s*:\s*(\d+)\s*([A-Za-z가-힣]+)',
+    r'([A-Za-z가-힣]+)\s*(\d+)\s*-\s*(\d+)\s*([A-Za-z가-힣]+)',
+    r'([A-Za-z가-힣]+)\s*(\d+)\s*vs\s*(\d+)\s*([A-Za-z가-힣]+)',
+]
+
+# 이전 PlaywrightCrawler._parse_kbo_games의 링크 텍스트 패턴
+LEGACY_KBO_LINK_PATTERN = r'(\w+)\s*(\d+):(\d+)\s*(\w+)'
+
+def legacy_unified(text):
+    return [(m.group(1), int(m.group(2)), int(m.group(3)), m.group(4))
+            for pattern in LEGACY_UNIFIED_PATTERNS for m in re.finditer(pattern, text)]
+
+def legacy_parse(text):
+    for pattern in LEGACY_PATTERNS:
+        match = re.search(pattern, text)
+        if match:
+            return match.group(1), int(match.group(2)), int(match.group(3)), match.group(4)
+    return None
+
+CELLS = [
+    'SSG 5 : 3 LG',
+    'SSG 5:3 LG',
+    'SSG 5 - 3 LG',
+    'KIA 5-3 LG',
+    '두산 7 vs 6 한화',
+    '두산 7vs6 한화',
+    'KIA 5vs3 LG',
+    'KIA5:3LG',
+    'KIA 5:3LG',
+    'SSG5-3LG',
+    '키움 8 : 5 롯데 종료',
+    '18:30 KT 3 : 3 삼성',
+    '10.15(화) NC 2 - 4 SSG',
+    'A 1 - 2 B 3 : 4 C',        # 뒤쪽의 ":" 표기가 우선
+    'A 1 vs 2 B 3 - 4 C',
+    'A 1 vs 2 B 3 vs 4 C',
+    'KIA 10 : 12 LG 연장 11회',
+    'KIA 5 : 3 LG',
+    'SSG랜더스 5 : 3 LG트윈스',
+    '경기 취소',
+    '',
+    'KIA vs LG',
+    '5 : 3',
+    '18:30',
+    '2024-10-15',
+]
+
+def find_node():
+    """JS 엔진 확인용 node (없으면 Playwright 드라이버에 포함된 node)"""
+    node = shutil.which('node')
+    if node:
+        return node
+    try:
+        import playwright
+    except ImportError:
+        return None
+    bundled = os.path.join(os.path.dirname(playwright.__file__), 'driver', 'node')
+    return bundled if os.path.exists(bundled) else None
+
+class TestScorePatterns(unittest.TestCase):
+    def test_matches_legacy_patterns(self):
+        """이전 KBO 셀 패턴이 찾던 표기는 같은 결과 (공백 없는 표기는 새로 찾음)"""
+        for cell in CELLS:
+            with self.subTest(cell=cell):
+                if legacy_parse(cell):
+                    self.assertEqual(parse_score(cell), legacy_parse(cell))
+
+    def test_matches_legacy_unified_patterns(self):
+        texts = CELLS + [
+            'KIA 5 : 3 LG 두산 7 - 6 한화 NC 2 vs 4 SSG',
+            '2024-10-15 KIA 5:3 LG 삼성 2:1 롯데',
+            '하이라이트 KT 4vs1 키움 경기 종료',
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(find_scores(text), legacy_unified(text))
+
+    def test_matches_legacy_kbo_link_pattern(self):
+        for text in ['SSG 5:3 LG', 'SSG5:3LG', 'KIA 7:2 두산', '두산베어스 3:4 한화이글스', '경기 전']:
+            with self.subTest(text=text):
+                match = re.search(LEGACY_KBO_LINK_PATTERN, text)
+                expected = (match.group(1), int(match.group(2)), int(match.group(3)), match.group(4)) if match else None
+                self.assertEqual(parse_score(text), expected)
+
+    def test_priority_of_mixed_cells(self):
+        self.assertEqual(parse_score('A 1 - 2 B 3 : 4 C'), ('B', 3, 4, 'C'))
+        self.assertEqual(search_score('A 1 vs 2 B 3 - 4 C').group(0), 'B 3 - 4 C')
+
+    def test_find_scores(self):
+        text = 'KIA 5 : 3 LG 두산 7 - 6 한화 NC 2 vs 4 SSG'
+        self.assertEqual(find_scores(text), [('KIA', 5, 3, 'LG'), ('두산', 7, 6, '한화'), ('NC', 2, 4, 'SSG')])
+        self.assertEqual(find_scores('경기 없음'), [])
+
+class TestScorePatternsJS(unittest.TestCase):
+    def setUp(self):
+        self.node = find_node()
+        if self.node is None:
+            self.skipTest('node 없음')
+
+    def run_js(self, texts):
+        script = SCORE_JS + """
+        const texts = %s;
+        process.stdout.write(JSON.stringify(texts.map(text => [searchScore(text), findScores(text)])));
+        """ % json.dumps(texts)
+        output = subprocess.run([self.node, '-'], input=script, capture_output=True, text=True, timeout=30, check=True)
+        return json.loads(output.stdout)
+
+    def test_js_matches_python(self):
+        texts = CELLS + ['KIA 5 : 3 LG 두산 7 - 6 한화 NC 2 vs 4 SSG', '2024-10-15 KIA 5:3 LG 삼성 2:1 롯데']
+        for text, (single, every) in zip(texts, self.run_js(texts)):
+            with self.subTest(text=text):
+                expected = parse_score(text)
+                self.assertEqual(tuple(single) if single else None, expected)
+                self.assertEqual([tuple(score) for score in every], find_scores(text))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from datetime import datetime
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.selector_stats import SelectorStats, cascade
+from src.parser import GameParser, NAVER_SPORTS_SELECTORS
+
+# 빈 sch_tb 블록과 실제 경기가 있는 game_result 블록
+GAME_RESULT_HTML = (
+    '<html><body><div class="sch_tb"><span class="td_hour">18:30</span></div>'
+    '<div class="game_result"><span class="team">KIA</span><span class="score">5</span>'
+    '<span class="score">3</span><span class="team">LG</span><span class="state">종료</span></div>'
+    '</body></html>'
+)
+
+class TestSelectorStats(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'selector_stats.json')
+        self.stats = SelectorStats(path=self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_learned_strategy_is_tried_first(self):
+        tried = []
+
+        def attempt(name):
+            tried.append(name)
+            return ['game'] if name == 'c' else []
+
+        self.assertEqual(cascade(self.stats, 'naver', 'div.x', ['a', 'b', 'c'], attempt), ['game'])
+        self.assertEqual(tried, ['a', 'b', 'c'])
+
+        tried.clear()
+        cascade(self.stats, 'naver', 'div.x', ['a', 'b', 'c'], attempt)
+        self.assertEqual(tried, ['c'])
+
+        # 다른 페이지 구성은 기본 순서
+        self.assertEqual(self.stats.order('naver', 'table.y', ['a', 'b', 'c']), ['a', 'b', 'c'])
+
+    def test_stats_persist_across_runs(self):
+        self.stats.record('naver', 'div.x', 'b', True)
+
+        other = SelectorStats(path=self.path)
+        self.assertEqual(other.order('naver', 'div.x', ['a', 'b']), ['b', 'a'])
+
+        # 학습한 방법이 실패하고 다른 방법이 성공하면 순서가 바뀜
+        other.record('naver', 'div.x', 'b', False)
+        other.record('naver', 'div.x', 'a', True)
+        self.assertEqual(SelectorStats(path=self.path).order('naver', 'div.x', ['a', 'b']), ['a', 'b'])
+
+    def test_disabled_stats(self):
+        tried = []
+        cascade(None, 'naver', '', ['a', 'b'], lambda name: tried.append(name) or [])
+        self.assertEqual(tried, ['a', 'b'])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_parse_naver_sports_learns_selector(self):
+        parser = GameParser()
+        parser.parse_cache = None
+        parser.selector_stats = self.stats
+        date = datetime(2024, 10, 15)
+
+        # 요소는 있지만 경기가 없는 선택자는 건너뛰고 다음 선택자로
+        games = parser.parse_naver_sports(GAME_RESULT_HTML, date)
+        self.assertEqual([(g['away_team'], g['home_team']) for g in games], [('KIA', 'LG')])
+
+        order = SelectorStats(path=self.path).order('naver_sports', 'div.sch_tb', NAVER_SPORTS_SELECTORS)
+        self.assertEqual(order[0], 'div.game_result')
+        self.assertEqual(parser.parse_naver_sports(GAME_RESULT_HTML, date), games)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+import asyncio
+import json
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.source_health import SourceHealth, NullSourceHealth
+from src.source_orchestrator import SourceOrchestrator
+from src.unified_crawler import UnifiedCrawler
+
+GAMES = [{'date': '2024-10-15', 'away_team': 'KIA', 'home_team': 'LG',
+          'away_score': 5, 'home_score': 3, 'winner': 'KIA'}]
+
+def fail_in_process(path):
+    """다른 프로세스에서 같은 파일에 실패 기록"""
+    health = SourceHealth(path=path, threshold=1000, cooldown=60)
+    for _ in range(50):
+        health.record_failure('naver_api', 'timeout')
+
+class ReplayPool:
+    """HAR 재생 풀 흉내 (소스 구성 확인용)"""
+    replay_har = 'session.har'
+
+class TestSourceHealth(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'source_health.json')
+        self.health = SourceHealth(path=self.path, threshold=2, cooldown=60)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def expire_cooldown(self, name):
+        """차단 시각을 쿨다운 이전으로 돌림"""
+        with open(self.path, encoding='utf-8') as f:
+            states = json.load(f)
+        for key in ('opened_at', 'probe_at'):
+            if key in states[name]:
+                states[name][key] -= 61
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(states, f)
+
+    def test_opens_after_threshold(self):
+        """연속 실패가 한도에 닿으면 차단"""
+        self.health.record_failure('kbo_api', 'HTTP 500')
+        self.assertTrue(self.health.allow('kbo_api'))
+
+        self.health.record_failure('kbo_api', 'HTTP 500')
+        self.assertEqual(self.health.state('kbo_api')['state'], 'open')
+        self.assertFalse(self.health.allow('kbo_api'))
+
+    def test_success_resets_failures(self):
+        self.health.record_failure('naver', 'timeout')
+        self.health.record_success('naver')
+        self.health.record_failure('naver', 'timeout')
+        self.assertEqual(self.health.state('naver')['state'], 'closed')
+
+    def test_half_open_probe(self):
+        """쿨다운 뒤 한 번만 시험 호출, 실패하면 다시 차단"""
+        for _ in range(2):
+            self.health.record_failure('naver_mobile', 'HTTP 404')
+        self.expire_cooldown('naver_mobile')
+
+        self.assertTrue(self.health.allow('naver_mobile'))
+        self.assertFalse(self.health.allow('naver_mobile'))
+
+        self.health.record_failure('naver_mobile', 'HTTP 404')
+        self.assertEqual(self.health.state('naver_mobile')['state'], 'open')
+        self.assertFalse(self.health.allow('naver_mobile'))
+
+    def test_half_open_recovers(self):
+        for _ in range(2):
+            self.health.record_failure('kbo_api', 'HTTP 500')
+        self.expire_cooldown('kbo_api')
+
+        self.assertTrue(self.health.allow('kbo_api'))
+        self.health.record_success('kbo_api')
+        self.assertTrue(self.health.allow('kbo_api'))
+        self.assertEqual(self.health.state('kbo_api')['failures'], 0)
+
+    def test_persisted_between_instances(self):
+        """상태는 파일로 다음 실행에 이어짐"""
+        for _ in range(2):
+            self.health.record_failure('kbo_api', 'HTTP 500')
+
+        other = SourceHealth(path=self.path, threshold=2, cooldown=60)
+        self.assertFalse(other.allow('kbo_api'))
+        self.assertIn('HTTP 500', other.report()[0])
+
+    def test_shared_across_processes(self):
+        """여러 프로세스가 동시에 기록해도 갱신이 사라지지 않음"""
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(fail_in_process, [self.path] * 4))
+
+        self.assertEqual(self.health.state('naver_api')['failures'], 200)
+
+    def test_replay_uses_browser_sources_only(self):
+        """HAR 재생 중에는 requests 기반 백업을 빼고 소스 상태를 기록하지 않음"""
+        crawler = UnifiedCrawler(pool=ReplayPool())
+        names = [name for name, _ in crawler._build_sources(datetime.now())]
+
+        self.assertEqual(names, ['kbo_official', 'naver', 'google'])
+        self.assertIsInstance(crawler.health, NullSourceHealth)
+        self.assertIn('kbo_api', [name for name, _ in UnifiedCrawler()._build_sources(datetime.now())])
+
+    def test_orchestrator_skips_open_source(self):
+        """차단된 주 소스는 시작하지 않고 백업을 바로 시작"""
+        for _ in range(2):
+            self.health.record_failure('kbo_official', 'timeout')
+        called = []
+
+        async def primary(date):
+            called.append('primary')
+            return GAMES
+
+        async def backup(date):
+            return GAMES
+
+        orchestrator = SourceOrchestrator([('kbo_official', primary), ('kbo_api', backup)],
+                                          hedge_delay=10, health=self.health)
+        start = time.perf_counter()
+        name, _ = asyncio.run(orchestrator.run(datetime(2024, 10, 15)))
+
+        self.assertEqual(name, 'kbo_api')
+        self.assertEqual(called, [])
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(orchestrator.last_report['kbo_official'], 'skipped')
+        self.assertEqual(self.health.state('kbo_api')['state'], 'closed')
+
+    def test_unlaunched_backup_keeps_probe(self):
+        """시작하지 않은 백업은 시험 호출을 쓰지 않고, 취소된 시험 호출은 반납"""
+        for _ in range(2):
+            self.health.record_failure('kbo_api', 'HTTP 500')
+        self.expire_cooldown('kbo_api')
+        opened_at = self.health.state('kbo_api')['opened_at']
+
+        async def fast(date):
+            return GAMES
+
+        async def slow(date):
+            await asyncio.sleep(5)
+            return GAMES
+
+        orchestrator = SourceOrchestrator([('kbo_official', fast), ('kbo_api', fast)],
+                                          hedge_delay=10, health=self.health)
+        asyncio.run(orchestrator.run(datetime(2024, 10, 15)))
+        self.assertEqual(orchestrator.last_report['kbo_api'], 'not_started')
+        self.assertEqual(self.health.state('kbo_api')['state'], 'open')
+
+        orchestrator = SourceOrchestrator([('kbo_official', slow), ('kbo_api', slow), ('naver', fast)],
+                                          hedge_delay=0, health=self.health)
+        name, _ = asyncio.run(orchestrator.run(datetime(2024, 10, 15)))
+        self.assertEqual(name, 'naver')
+        self.assertEqual(orchestrator.last_report['kbo_api'], 'cancelled')
+        state = self.health.state('kbo_api')
+        self.assertEqual((state['state'], state['opened_at']), ('open', opened_at))
+        self.assertTrue(self.health.allow('kbo_api'))
+
+    def test_orchestrator_records_errors(self):
+        async def broken(date):
+            raise RuntimeError('HTTP 500')
+
+        orchestrator = SourceOrchestrator([('kbo_api', broken)], health=self.health)
+        for _ in range(2):
+            asyncio.run(orchestrator.run(datetime(2024, 10, 15)))
+
+        self.assertEqual(self.health.state('kbo_api')['state'], 'open')
+
+if __name__ == '__main__':
+    unittest.main()
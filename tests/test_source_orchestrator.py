@@ -0,0 +1,93 @@
+import unittest
+import asyncio
+from datetime import datetime
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.source_orchestrator import SourceOrchestrator, validate_games, NoGames
+
+DATE = datetime(2024, 10, 15)
+GAMES = [{'date': '2024-10-15', 'away_team': 'KIA', 'home_team': 'LG',
+          'away_score': 5, 'home_score': 3, 'winner': 'KIA'}]
+
+def source(delay, result=None, error=None, log=None, name=None):
+    """delay초 뒤 결과를 돌려주는 테스트용 소스"""
+    async def run(date):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(name)
+            raise
+        if error:
+            raise error
+        return result
+    return run
+
+class TestValidateGames(unittest.TestCase):
+    def test_valid(self):
+        self.assertTrue(validate_games(GAMES, DATE))
+
+    def test_invalid(self):
+        """빈 결과, 다른 날짜, 알 수 없는 팀은 거부"""
+        self.assertFalse(validate_games([], DATE))
+        self.assertFalse(validate_games([dict(GAMES[0], date='2024-10-14')], DATE))
+        self.assertFalse(validate_games([dict(GAMES[0], home_team='Yankees')], DATE))
+
+class TestSourceOrchestrator(unittest.TestCase):
+    def test_primary_wins_before_hedge(self):
+        """주 소스가 헤지 시간 안에 끝나면 백업은 시작하지 않음"""
+        orchestrator = SourceOrchestrator([
+            ('primary', source(0.01, GAMES)),
+            ('backup', source(0.01, GAMES)),
+        ], hedge_delay=1, timeout=5)
+
+        name, games = asyncio.run(orchestrator.run(DATE))
+        self.assertEqual(name, 'primary')
+        self.assertEqual(orchestrator.last_report['backup'], 'not_started')
+
+    def test_backup_wins_and_primary_cancelled(self):
+        """주 소스가 느리면 백업 결과를 쓰고 주 소스는 취소"""
+        cancelled = []
+        orchestrator = SourceOrchestrator([
+            ('primary', source(5, GAMES, log=cancelled, name='primary')),
+            ('backup', source(0.01, GAMES)),
+        ], hedge_delay=0.05, timeout=5)
+
+        name, games = asyncio.run(orchestrator.run(DATE))
+        self.assertEqual(name, 'backup')
+        self.assertEqual(cancelled, ['primary'])
+        self.assertEqual(orchestrator.last_report['primary'], 'cancelled')
+
+    def test_primary_failure_starts_backups_immediately(self):
+        """주 소스가 실패하면 헤지 시간을 기다리지 않음"""
+        orchestrator = SourceOrchestrator([
+            ('primary', source(0, error=RuntimeError('down'))),
+            ('invalid', source(0, [])),
+            ('backup', source(0.01, GAMES)),
+        ], hedge_delay=10, timeout=1)
+
+        name, games = asyncio.run(orchestrator.run(DATE))
+        self.assertEqual(name, 'backup')
+        self.assertEqual(orchestrator.last_report['primary'], 'error')
+        self.assertEqual(orchestrator.last_report['invalid'], 'invalid')
+
+    def test_confirmed_no_games(self):
+        """경기 없음을 확인한 주 소스는 백업 없이 채택"""
+        self.assertTrue(validate_games(NoGames(), DATE))
+        orchestrator = SourceOrchestrator([
+            ('primary', source(0, NoGames())),
+            ('backup', source(0, GAMES)),
+        ], hedge_delay=10, timeout=1)
+
+        name, games = asyncio.run(orchestrator.run(DATE))
+        self.assertEqual((name, games), ('primary', []))
+        self.assertEqual(orchestrator.last_report['backup'], 'not_started')
+
+    def test_all_fail(self):
+        orchestrator = SourceOrchestrator([('primary', source(0, []))], hedge_delay=0, timeout=1)
+        self.assertEqual(asyncio.run(orchestrator.run(DATE)), (None, []))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import asyncio
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.stage_timer import StageTimer, timed, record_stage
+
+class TestStageTimer(unittest.TestCase):
+    def test_records_only_when_active(self):
+        """활성화된 블록 안에서만 기록"""
+        timer = StageTimer()
+        with timed('save'):
+            pass
+
+        with timer.activate():
+            with timed('save'):
+                pass
+            record_stage('wait', 0.5)
+
+        self.assertEqual(len(timer.samples['save']), 1)
+        self.assertEqual(timer.summary()['wait']['total_ms'], 500)
+        self.assertEqual(list(timer.summary()), ['wait', 'save'])
+
+    def test_tasks_inherit_timer(self):
+        """활성화 블록에서 만든 태스크의 측정도 같은 객체에 기록"""
+        timer = StageTimer()
+
+        @timed('extraction')
+        def parse():
+            return 1
+
+        async def run():
+            with timer.activate():
+                await asyncio.gather(*(asyncio.to_thread(parse) for _ in range(3)))
+
+        asyncio.run(run())
+        self.assertEqual(timer.summary()['extraction']['count'], 3)
+
+if __name__ == '__main__':
+    unittest.main()
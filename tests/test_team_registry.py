@@ -0,0 +1,68 @@
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.team_registry import TeamRegistry, TEAMS, TEAM_NAMES, canonical_team
+from src.parser import GameParser
+
+class TestTeamRegistry(unittest.TestCase):
+    def setUp(self):
+        self.teams = TeamRegistry()
+
+    def test_aliases_resolve_to_canonical_names(self):
+        cases = {
+            'KIA': 'KIA', 'KIA타이거즈': 'KIA', '기아': 'KIA', 'Kia Tigers': 'KIA',
+            'SSG랜더스': 'SSG', '랜더스': 'SSG', 'SK와이번스': 'SSG',
+            '키움히어로즈': '키움', '넥센': '키움', 'kt wiz': 'KT',
+            ' 두산 ': '두산', '롯데 자이언츠': '롯데', 'NC 다이노스': 'NC',
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.teams.canonical(text), expected)
+
+    def test_codes_only_match_whole_text(self):
+        self.assertEqual(self.teams.canonical('HT'), 'KIA')
+        self.assertEqual(self.teams.canonical('OB'), '두산')
+        # 'SS'(삼성 코드)가 들어 있어도 SSG
+        self.assertEqual(self.teams.canonical('SSG'), 'SSG')
+        self.assertIsNone(self.teams.canonical('SKY'))
+
+    def test_unknown_names(self):
+        self.assertIsNone(self.teams.canonical('경기 취소'))
+        self.assertEqual(self.teams.canonical('', 'x'), 'x')
+        self.assertEqual(GameParser().parse_team_name(' 상무 '), '상무')
+
+    def test_find_all_in_order(self):
+        text = '10.15(화) SSG랜더스 5 : 3 LG트윈스, 두산 7 - 6 한화'
+        self.assertEqual([self.teams.name(team_id) for team_id in self.teams.find_all(text)],
+                         ['SSG', 'LG', '두산', '한화'])
+        self.assertEqual(self.teams.find_all('잠실'), [])
+
+    def test_latin_aliases_need_word_boundaries(self):
+        """영문 단어 안에 들어 있는 별칭은 팀이 아님"""
+        for text in ['since', 'Once', 'Algorithm', 'Kitchen']:
+            with self.subTest(text=text):
+                self.assertIsNone(self.teams.canonical(text))
+                self.assertEqual(self.teams.find_all(text), [])
+        # 숫자/한글과 붙은 표기는 그대로 인정
+        self.assertEqual(self.teams.find_all('KIA5:3LG'), [1, 3])
+
+    def test_name_and_nickname_count_once(self):
+        self.assertEqual(self.teams.find_all('LG Twins'), [3])
+        self.assertEqual(self.teams.find_all('KT wiz'), [5])
+        self.assertEqual(self.teams.find_all('LG Twins 5 : 3 KT Wiz'), [3, 5])
+        self.assertEqual(self.teams.find_all('KIA 타이거즈 2 - 1 롯데 자이언츠'), [1, 7])
+
+    def test_ids_are_stable_and_unique(self):
+        ids = [team_id for team_id, _, _, _ in TEAMS]
+        self.assertEqual(ids, list(range(1, 11)))
+        self.assertEqual(self.teams.find('KIA'), 1)
+        self.assertEqual(self.teams.find('키움'), 10)
+        self.assertEqual(set(TEAM_NAMES), {name for _, name, _, _ in TEAMS})
+
+    def test_shared_registry(self):
+        self.assertEqual(canonical_team('삼성라이온즈'), '삼성')
+
+if __name__ == '__main__':
+    unittest.main()